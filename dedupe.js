@@ -0,0 +1,118 @@
+  // Near-duplicate node labels
+  // Scraped and hand-entered names for one organization rarely match exactly
+  // ("Ecorestoration Alliance" / "Eco-Restoration Alliance"). Labels are
+  // compared by a normalized key and, failing that, by their character
+  // trigrams: an inverted index (trigram -> node rows) turns a lookup into a
+  // walk over the few rows sharing a trigram with the label instead of a
+  // comparison with every node. Trigrams shared by too many rows (a common
+  // word's) are skipped, which keeps a lookup's cost bounded as the graph grows.
+  //
+  // tools/find_duplicates.py runs the same comparison over a whole sheet
+  // export; keep labelKey() and the constants below in step with it.
+
+  const DUPLICATE_THRESHOLD = 0.8;  // Dice coefficient of two labels' trigrams
+  const GRAM_SIZE = 3;
+  const BLOCK_MAX = 200;            // rows a trigram may index before lookups ignore it
+  const LEGAL_SUFFIXES = new Set(['inc', 'llc', 'ltd', 'co', 'corp', 'gmbh', 'plc']);
+
+  /**
+   * Comparison key of a label: lower-cased, accents, punctuation and spaces
+   * dropped, '&' read as 'and', a leading "the" and a trailing legal suffix ignored
+   * @param {string} label - e.g. "The Eco-Restoration Alliance, Inc."
+   * @returns {string} e.g. "ecorestorationalliance" ('' if nothing is left)
+   */
+  function labelKey(label){
+    const words = String(label == null ? '' : label).normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+      .toLowerCase().replace(/&/g, ' and ').split(/[^a-z0-9]+/).filter(Boolean);
+    while (words.length > 1 && words[0] === 'the') words.shift();
+    while (words.length > 1 && LEGAL_SUFFIXES.has(words[words.length - 1])) words.pop();
+    return words.join('');
+  }
+
+  /** Distinct character trigrams of a key (a shorter key is its own gram) */
+  function labelGrams(key){
+    if (key.length < GRAM_SIZE) return [key];
+    const grams = new Set();
+    for (let i = 0; i + GRAM_SIZE <= key.length; i++) grams.add(key.slice(i, i + GRAM_SIZE));
+    return [...grams];
+  }
+
+  /** Dice coefficient of two gram lists: 2 * shared / (|a| + |b|) */
+  function gramSimilarity(a, b){
+    const inA = new Set(a);
+    const shared = b.reduce((n, g) => n + (inA.has(g) ? 1 : 0), 0);
+    return 2 * shared / (a.length + b.length);
+  }
+
+  class DuplicateIndex {
+    constructor(store){
+      this.store = store;
+      this._reset();
+    }
+
+    _reset(){
+      this.rowOf = this.store.rowOf;  // a reload replaces it, and the index starts over
+      this.labelIds = [];             // per row: the interned label it was indexed under
+      this.keys = [];
+      this.grams = [];
+      this.byKey = new Map();         // key -> rows
+      this.postings = new Map();      // trigram -> rows
+    }
+
+    _add(row){
+      const key = labelKey(this.store.nodeLabel(row));
+      this.labelIds[row] = this.store.nodeCols.label[row];
+      this.keys[row] = key;
+      this.grams[row] = key ? labelGrams(key) : [];
+      if (!key) return;
+      if (!this.byKey.has(key)) this.byKey.set(key, []);
+      this.byKey.get(key).push(row);
+      this.grams[row].forEach(g => {
+        if (!this.postings.has(g)) this.postings.set(g, []);
+        this.postings.get(g).push(row);
+      });
+    }
+
+    // Index the rows added (or relabelled) since the last lookup; rows are never removed
+    _catchUp(){
+      if (this.rowOf !== this.store.rowOf) this._reset();
+      const labels = this.store.nodeCols.label;
+      for (let r = 0; r < this.store.nodeCount; r++){
+        if (this.labelIds[r] !== labels[r]) this._add(r);
+      }
+    }
+
+    /**
+     * Existing nodes whose label is probably the same name as this one
+     * @param {string} label - a label about to be given to a new node
+     * @param {Object} [options] - {type: only nodes of this type, threshold, limit}
+     * @returns {{row: number, score: number}[]} best first; score 1 means the keys are equal
+     */
+    candidates(label, options = {}){
+      const { type = null, threshold = DUPLICATE_THRESHOLD, limit = 5 } = options;
+      this._catchUp();
+      const key = labelKey(label);
+      if (!key) return [];
+      const grams = labelGrams(key);
+      const shared = new Map();  // row -> trigrams shared with the label
+      grams.forEach(g => {
+        const rows = this.postings.get(g);
+        if (!rows || rows.length > BLOCK_MAX) return;
+        rows.forEach(r => shared.set(r, (shared.get(r) || 0) + 1));
+      });
+      (this.byKey.get(key) || []).forEach(r => shared.set(r, Infinity));
+
+      // Dice >= threshold needs at least threshold * |grams| / 2 trigrams in common
+      const minShared = threshold * grams.length / 2;
+      const found = [];
+      shared.forEach((count, row) => {
+        if (count < minShared || (type && this.store.nodeTypeName(row) !== type)) return;
+        // Postings of a relabelled row still list it under its old trigrams
+        const score = this.keys[row] === key ? 1 : gramSimilarity(grams, this.grams[row]);
+        if (score >= threshold) found.push({ row, score });
+      });
+      return found.sort((a, b) => b.score - a.score || a.row - b.row).slice(0, limit);
+    }
+  }
+
+  const duplicateIndex = new DuplicateIndex(graphStore);
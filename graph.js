@@ -2,7 +2,9 @@
   const data = { nodes, edges };
   const options = {
     autoResize: true,
-    physics: { stabilization: { enabled: true, iterations: 1000 } },
+    // Physics (and stabilization) stops once no node moves faster than minVelocity;
+    // from a seeded layout (layout.js) that comes well before the iteration cap
+    physics: { minVelocity: 0.75, stabilization: { enabled: true, iterations: 1000 } },
     nodes: {
       borderWidth: 1,
       // size is controlled by scaling when 'value' is provided per node
@@ -13,6 +15,8 @@
       },
       font: { face: 'Inter, system-ui, -apple-system, Segoe UI, Roboto, Arial', size: 14 }
     },
+    // Styles live on the groups; nodes carry only group (type + view state)
+    groups: nodeGroups(),
     edges: {
       smooth: true,
       font: { face: 'Inter, system-ui, -apple-system, Segoe UI, Roboto, Arial', size: 10 }
@@ -22,7 +26,9 @@
   // Make network globally accessible for fit after data load
   window.network = network;
   // Testing hooks (for automation)
-  window.__graph = { nodes, edges, candidatesByOrgId };
+  window.__graph = { nodes, edges, store: graphStore, candidates: candidateCache, hidden: hiddenNodes };
+  // The startup snapshot needs the store and the network, so it is drawn from here
+  loadSnapshot();
   // Toolbar logic
   document.getElementById('fitBtn').onclick = () => network.fit({ animation: true });
   // Simple org-like tester in JS (mirrors Python loosely)
@@ -50,12 +56,40 @@
   let pendingOps = [];   // batch of ops to persist on Save
   let hasUnsaved = false;
   const unsavedBadge = document.getElementById('unsavedBadge');
-  function updateUnsaved(){ unsavedBadge.style.display = hasUnsaved ? '' : 'none'; }
+  // Autosave mode: the badge shows sync status instead of just "unsaved"
+  let autosaveEnabled = localStorage.getItem('era_autosave') === 'on';
+  let syncState = 'idle'; // 'idle' | 'saving' | 'saved' | 'error'
+  const SYNC_BADGES = {
+    unsaved: ['• unsaved edit', '#c00'],
+    signin: ['• sign in to autosave', '#c00'],
+    saving: ['⟳ saving…', '#666'],
+    saved: ['✓ saved', '#2a7d4f'],
+    error: ['⚠ sync failed, retrying', '#c00']
+  };
+  function updateUnsaved(){
+    let badge = hasUnsaved ? 'unsaved' : null;
+    if (autosaveEnabled){
+      if (hasUnsaved) badge = (syncState === 'saving' || syncState === 'error') ? syncState : (sheetsApiReady ? 'unsaved' : 'signin');
+      else if (syncState === 'saved') badge = 'saved';
+    }
+    unsavedBadge.style.display = badge ? '' : 'none';
+    if (badge){
+      unsavedBadge.textContent = SYNC_BADGES[badge][0];
+      unsavedBadge.style.color = SYNC_BADGES[badge][1];
+    }
+  }
   
-  function queueOp(op){ 
-    pendingOps.push(op); 
+  // Observers of locally queued ops, called with each batch (e.g. tab_sync.js broadcasts them to other tabs)
+  const opObservers = [];
+  function queueOp(op){ queueOps([op]); }
+  // A batch (e.g. a bulk import) is one unsaved-state update, one autosave timer and one broadcast
+  function queueOps(ops){
+    if (!ops.length) return;
+    pendingOps.push(...ops);
     hasUnsaved = true; 
     updateUnsaved(); 
+    scheduleAutosave();
+    opObservers.forEach(fn => fn(ops));
   }
   
   // Expose for testing (use getter to always return current values)
@@ -68,7 +102,60 @@
     set: (val) => { hasUnsaved = val; }
   });
   window.queueOp = queueOp;
-  
+  window.queueOps = queueOps;
+  window.onQueueOps = (fn) => opObservers.push(fn);
+
+  // Remove the ops a save persisted; ops queued while it ran stay pending
+  function dropSavedOps(savedOps){
+    const saved = new Set(savedOps);
+    const remaining = pendingOps.filter(op => !saved.has(op));
+    pendingOps.length = 0;  // Clear array without breaking reference
+    pendingOps.push(...remaining);
+    hasUnsaved = pendingOps.length > 0;
+    updateUnsaved();
+  }
+
+  // Background autosave: flush pendingOps once edits go quiet, in an idle window
+  const AUTOSAVE_QUIET_MS = 4000;
+  const AUTOSAVE_RETRY_MS = 30000;
+  let autosaveTimer = null;
+  const whenIdle = window.requestIdleCallback
+    ? (fn) => requestIdleCallback(fn, { timeout: 5000 })
+    : (fn) => setTimeout(fn, 0);
+  function scheduleAutosave(delay = AUTOSAVE_QUIET_MS){
+    if (!autosaveEnabled) return;
+    if (autosaveTimer) clearTimeout(autosaveTimer);
+    autosaveTimer = setTimeout(() => whenIdle(flushAutosave), delay);
+  }
+  async function flushAutosave(){
+    autosaveTimer = null;
+    if (!autosaveEnabled || pendingOps.length === 0) return;
+    // Not signed in yet: updateSignInStatus() reschedules after sign-in
+    if (!sheetsApiReady) { updateUnsaved(); return; }
+    syncState = 'saving'; updateUnsaved();
+    const result = await saveDataToSheets({ incremental: true, quiet: true });
+    if (result && result.ok){
+      syncState = 'saved';
+      lastAction = null;
+      dropSavedOps(result.ops);
+      if (pendingOps.length) scheduleAutosave();
+    } else {
+      syncState = 'error'; updateUnsaved();
+      scheduleAutosave(AUTOSAVE_RETRY_MS);
+    }
+  }
+  const autosaveToggle = document.getElementById('autosaveToggle');
+  if (autosaveToggle){
+    autosaveToggle.checked = autosaveEnabled;
+    autosaveToggle.addEventListener('change', () => {
+      autosaveEnabled = autosaveToggle.checked;
+      localStorage.setItem('era_autosave', autosaveEnabled ? 'on' : 'off');
+      syncState = 'idle';
+      updateUnsaved();
+      if (autosaveEnabled && pendingOps.length) scheduleAutosave(0);
+    });
+  }
+
   // Curation modal behavior
   const curModal=document.getElementById('curationModal');
   const curList=document.getElementById('curationList');
@@ -85,104 +172,219 @@
   let originalUrl='';
   let originalType='';
   
-  // Helper: refresh the connection list for current node
-  function refreshConnectionList(){
-    if (!currentSourceId) return;
-    const orgId = currentSourceId;
-    const n = nodes.get(orgId);
-    if (!n) return;
-    
-    const isOrg = n.group === 'organization';
-    
-    curList.innerHTML = '';
-    
-    // Get ALL connections (edges) for this node
-    const allEdges = edges.get().filter(e => e.from === orgId || e.to === orgId);
-    const connections = allEdges.map(e => {
-      const otherId = e.from === orgId ? e.to : e.from;
-      const otherNode = nodes.get(otherId);
-      return otherNode ? {
-        id: otherId,
-        label: otherNode.label,
-        relationship: e.label || e.relationship || 'connected',
-        url: otherNode.url || ''
-      } : null;
-    }).filter(x => x);
-    
-    // Get discovered partner candidates (org-only feature)
-    const cand = (isOrg && candidatesByOrgId[orgId]) ? candidatesByOrgId[orgId] : [];
-    
-    // Update info text
-    const connCount = connections.length;
-    const candCount = cand.length;
+  // Connection list (virtualized)
+  // The list is a model over the node's incident-edge index: a section of edge
+  // rows to drawn neighbours, one of edge rows to hidden neighbours, and the
+  // org's discovered candidates. Rows are read from the store as they scroll
+  // into view, so only a window of them is ever in the DOM, and a toggle
+  // re-renders just its own row.
+  const CUR_ROW_HEIGHT = 22;   // px, fixed so a scroll offset maps straight to an item
+  const CUR_OVERSCAN = 10;     // rows rendered beyond each edge of the viewport
+  const CUR_VIEW_ROWS = 40;    // rows assumed visible before the list has a height
+  const curSpacer = document.createElement('div');
+  const curWindow = document.createElement('div');
+  curWindow.style.position = 'absolute';
+  curWindow.style.left = curWindow.style.right = '0';
+  curList.replaceChildren(curSpacer, curWindow);
+  let curModel = null;  // {row, sections: [{kind, title, items}], length, checked: Map item -> bool, connected}
+
+  /** The section item (or section header) at a list position */
+  function curationItem(i){
+    for (const section of curModel.sections){
+      if (i === 0) return { header: section.title };
+      if (i <= section.items.length) return { kind: section.kind, item: section.items[i - 1] };
+      i -= section.items.length + 1;
+    }
+    return null;
+  }
+
+  function curationRow(i){
+    const div = document.createElement('div');
+    div.className = 'curRow';
+    div.dataset.item = i;
+    const entry = curationItem(i);
+    if (entry.header){
+      const strong = document.createElement('strong');
+      strong.textContent = entry.header;
+      div.appendChild(strong);
+      return div;
+    }
+    const label = document.createElement('label');
+    const cb = document.createElement('input');
+    cb.type = 'checkbox';
+    cb.dataset.item = i;
+    label.appendChild(cb);
+    let url = '';
+    if (entry.kind === 'cand'){
+      const c = entry.item;
+      cb.checked = curModel.checked.get(i) === true;
+      cb.dataset.url = c.url;
+      cb.dataset.name = c.name;
+      label.append(` ${c.name}`);
+      url = c.url;
+      div.style.color = '#666';
+    } else {
+      const e = entry.item, other = graphStore.otherEnd(e, curModel.row);
+      const rel = graphStore.edgeRelationship(e) || 'connected';
+      // A hidden neighbour restored from here lists as a connection
+      const asConnection = entry.kind === 'conn' || curModel.checked.get(i) === true;
+      if (asConnection){
+        cb.checked = curModel.checked.get(i) !== false;
+        cb.dataset.connId = graphStore.nodeId(other);
+        cb.dataset.relationship = rel;
+        label.append(` ${graphStore.nodeLabel(other)} (${rel})`);
+        url = graphStore.nodeField(other, 'url');
+        div.style.color = '#333';
+      } else {
+        cb.dataset.restoreId = graphStore.nodeId(other);
+        label.append(` ${graphStore.nodeLabel(other)} (${rel}) — hidden, tick to restore`);
+        div.style.color = '#999';
+      }
+    }
+    if (url){
+      const a = document.createElement('a');
+      a.href = url;
+      a.target = '_blank';
+      a.textContent = url;
+      label.append(' — ', a);
+    }
+    div.appendChild(label);
+    return div;
+  }
+
+  /** Render the rows in (and just around) the viewport */
+  function renderCurationWindow(){
+    if (!curModel) return;
+    curSpacer.style.height = `${curModel.length * CUR_ROW_HEIGHT}px`;
+    const top = curList.scrollTop;
+    const height = curList.clientHeight || CUR_VIEW_ROWS * CUR_ROW_HEIGHT;
+    const first = Math.max(0, Math.floor(top / CUR_ROW_HEIGHT) - CUR_OVERSCAN);
+    const last = Math.min(curModel.length, Math.ceil((top + height) / CUR_ROW_HEIGHT) + CUR_OVERSCAN);
+    curWindow.style.top = `${first * CUR_ROW_HEIGHT}px`;
+    const rows = document.createDocumentFragment();
+    for (let i = first; i < last; i++) rows.appendChild(curationRow(i));
+    curWindow.replaceChildren(rows);
+
+    // Neighbours' URLs are detail columns: fetch them for the rows on screen only
+    const missing = [...curWindow.querySelectorAll('input[data-conn-id]')]
+      .map(cb => cb.dataset.connId).filter(id => needsDetails('nodes', id));
+    if (missing.length) {
+      const model = curModel;
+      ensureNodeDetails(missing)
+        .then(() => { if (curModel === model) renderCurationWindow(); })
+        .catch(err => console.warn('Could not load details for', missing, err));
+    }
+  }
+  curList.addEventListener('scroll', renderCurationWindow);
+
+  /** Re-render one row if it is in the window */
+  function patchCurationRow(i){
+    const el = curWindow.querySelector(`div[data-item="${i}"]`);
+    if (el) el.replaceWith(curationRow(i));
+  }
+
+  function updateCurationInfo(){
+    const n = graphStore.node(currentSourceId);
+    const isOrg = n.type === 'organization';
+    const candSection = curModel.sections.find(s => s.kind === 'cand');
+    const connCount = curModel.connected, candCount = candSection ? candSection.items.length : 0;
     if (isOrg && candCount > 0) {
       curInfo.textContent = `${connCount} connections, ${candCount} candidates`;
     } else if (connCount > 0) {
       curInfo.textContent = `${connCount} connections`;
     } else {
-      curInfo.textContent = isOrg ? 'No connections' : `${n.group || 'node'} (read-only)`;
-    }
-    
-    // Show existing connections first
-    if (connections.length > 0) {
-      const header = document.createElement('div');
-      header.innerHTML = '<strong>Connections:</strong>';
-      header.style.marginTop = '10px';
-      header.style.marginBottom = '5px';
-      curList.appendChild(header);
-      
-      connections.forEach(conn => {
-        const row = document.createElement('div');
-        const urlLink = conn.url ? ` — <a href="${conn.url}" target="_blank">${conn.url}</a>` : '';
-        row.innerHTML = `<label><input type="checkbox" checked data-conn-id="${conn.id}" data-relationship="${conn.relationship}"> ${conn.label} (${conn.relationship})${urlLink}</label>`;
-        row.style.color = '#333';
-        curList.appendChild(row);
-      });
-    }
-    
-    // Show discovered partner candidates (orgs only, exclude existing connections)
-    if (isOrg && cand.length > 0) {
-      const header = document.createElement('div');
-      header.innerHTML = '<strong>Discovered partners:</strong>';
-      header.style.marginTop = '15px';
-      header.style.marginBottom = '5px';
-      curList.appendChild(header);
-      
-      const connectedLabels = new Set(connections.map(c => c.label));
-      cand.forEach(c => {
-        if (!connectedLabels.has(String(c.name))) {
-          const row = document.createElement('div');
-          row.innerHTML = `<label><input type="checkbox" data-url="${c.url}" data-name="${c.name}"> ${c.name} — <a href="${c.url}" target="_blank">${c.url}</a></label>`;
-          row.style.color = '#666';
-          curList.appendChild(row);
-        }
-      });
+      curInfo.textContent = isOrg ? 'No connections' : `${n.type || 'node'} (read-only)`;
     }
+    if (isOrg && candidateLoads.has(currentSourceId)) curInfo.textContent += ' • loading candidates…';
+  }
+
+  // Discovered partner candidates (org-only feature) not already drawn as connections, once loaded into the cache
+  function candidateSection(orgId, conn){
+    const n = graphStore.node(orgId);
+    const cand = n.type === 'organization' ? (cachedCandidates(orgId) || []) : [];
+    if (!cand.length) return null;
+    const row = graphStore.nodeRow(orgId);
+    const connectedLabels = new Set(conn.map(e => graphStore.nodeLabel(graphStore.otherEnd(e, row))));
+    const items = cand.filter(c => !connectedLabels.has(String(c.name)));
+    return items.length ? { kind: 'cand', title: 'Discovered partners:', items } : null;
+  }
+
+  // Helper: (re)build the connection list for current node from its incident edges
+  function refreshConnectionList(){
+    if (!currentSourceId) return;
+    const orgId = currentSourceId;
+    const row = graphStore.nodeRow(orgId);
+    if (row < 0) return;
+    const conn = [], hidden = [];
+    graphStore.incidentRows(row).forEach(e => (isProjected(graphStore.otherEnd(e, row)) ? conn : hidden).push(e));
+    const sections = [
+      { kind: 'conn', title: 'Connections:', items: conn },
+      { kind: 'hidden', title: 'Hidden connections:', items: hidden },
+      candidateSection(orgId, conn)
+    ].filter(s => s && s.items.length);
+    curModel = { row, sections, checked: new Map(), connected: conn.length,
+                 length: sections.reduce((n, s) => n + s.items.length + 1, 0) };
+    curList.scrollTop = 0;
+    updateCurationInfo();
+    renderCurationWindow();
+  }
+
+  // Candidates arrived: replace the last section, keeping the rows (and ticks) above it
+  function refreshCandidateSection(){
+    if (!curModel) return;
+    const sections = curModel.sections.filter(s => s.kind !== 'cand');
+    const conn = (sections.find(s => s.kind === 'conn') || { items: [] }).items;
+    const cand = candidateSection(currentSourceId, conn);
+    if (cand) sections.push(cand);
+    const length = sections.reduce((n, s) => n + s.items.length + 1, 0);
+    [...curModel.checked.keys()].forEach(i => { if (i >= length) curModel.checked.delete(i); });
+    Object.assign(curModel, { sections, length });
+    updateCurationInfo();
+    renderCurationWindow();
+  }
+
+  /** Record a row's new tick state, adjust the connection count, and patch the row */
+  function setCurationChecked(i, checked, connectedDelta){
+    curModel.checked.set(i, checked);
+    curModel.connected += connectedDelta;
+    updateCurationInfo();
+    patchCurationRow(i);
   }
   
-  function openCurationFor(orgId){
-    const n=nodes.get(orgId); if(!n) return;
-    currentSourceId=orgId; curSrc.textContent = n.label;
-    
-    // Set URL display and input
-    originalUrl = n.url || '';
-    if (n.url) { 
-      curSrcLink.href = n.url; 
-      curUrl.href = n.url; 
-      curUrl.textContent = n.url;
-      curUrlInput.value = n.url;
+  function showSourceUrl(url){
+    if (url) { 
+      curSrcLink.href = url; 
+      curUrl.href = url; 
+      curUrl.textContent = url;
+      curUrlInput.value = url;
     } else { 
       curSrcLink.removeAttribute('href'); 
       curUrl.removeAttribute('href'); 
       curUrl.textContent='';
       curUrlInput.value = '';
     }
+  }
+  
+  // A hidden node leaves the network once its modal closes
+  function stashCurrentIfHidden(){
+    if (currentSourceId) stashHiddenNode(currentSourceId);
+  }
+  
+  function openCurationFor(orgId){
+    if (orgId !== currentSourceId) stashCurrentIfHidden();
+    // Hidden nodes come back into the network (still hidden) while their modal is open
+    const n=revealNode(orgId); if(!n) return;
+    currentSourceId=orgId; curSrc.textContent = n.label;
+    
+    // Set URL display and input
+    originalUrl = n.url || '';
+    showSourceUrl(originalUrl);
     
     // Check if this is an organization (full editing) or other type (read-only)
-    const isOrg = n.group === 'organization';
+    const isOrg = n.type === 'organization';
     
     // Set type radio buttons based on current node type
-    originalType = n.group || 'person';
+    originalType = n.type || 'person';
     modalTypeRadios.forEach(radio => {
       radio.checked = (radio.value === originalType);
     });
@@ -192,9 +394,27 @@
     sourceToggle.checked = originalKeep;
     sourceToggle.disabled = false;  // Allow hiding any node type
     
-    // Populate connection list
-    refreshConnectionList();
+    // Candidates are fetched the first time an org's modal opens, then come from the cache
+    if (isOrg && !candidateCache.has(orgId) && window.gapi && window.gapi.client && window.gapi.client.sheets) {
+      loadCandidates(orgId)
+        .then(() => { if (currentSourceId === orgId) refreshCandidateSection(); })
+        .catch(err => { console.warn('Could not load candidates for', orgId, err); if (currentSourceId === orgId) refreshCandidateSection(); });
+    }
+    
+    // The URL is a detail column and may not be loaded yet; the rows on screen
+    // ask for their neighbours' in the same batch (see renderCurationWindow)
+    if (needsDetails('nodes', orgId)) {
+      ensureNodeDetails([orgId]).then(() => {
+        if (currentSourceId !== orgId) return;
+        const fresh = graphStore.node(orgId);
+        // Don't clobber a URL the curator has started typing
+        if (fresh && curUrlInput.value === originalUrl) { originalUrl = fresh.url || ''; showSourceUrl(originalUrl); }
+      }).catch(err => console.warn('Could not load details for', orgId, err));
+    }
+    
+    // Populate connection list (shown first, so the list knows its height)
     curModal.style.display='flex';
+    refreshConnectionList();
     hasUnsavedCuration = false;
   }
   window.openCurationFor = openCurationFor;
@@ -210,18 +430,15 @@
   let currentEdgeId = null;
   
   function openEdgeModal(edgeId) {
-    const edge = edges.get(edgeId);
+    const edge = graphStore.edge(edgeRowOf(edgeId));
     if (!edge) return;
     
     currentEdgeId = edgeId;
-    const fromNode = nodes.get(edge.from);
-    const toNode = nodes.get(edge.to);
-    
-    edgeFromLabel.textContent = fromNode.label;
-    edgeToLabel.textContent = toNode.label;
+    edgeFromLabel.textContent = graphStore.nodeLabel(graphStore.nodeRow(edge.from));
+    edgeToLabel.textContent = graphStore.nodeLabel(graphStore.nodeRow(edge.to));
     
     // Set relationship - handle custom values
-    const rel = edge.label || 'partnership';
+    const rel = edge.relationship || 'partnership';
     if (['partnership', 'affiliation', 'membership'].includes(rel)) {
       edgeRelSelect.value = rel;
       edgeRelCustom.style.display = 'none';
@@ -232,6 +449,8 @@
     }
     
     edgeModal.style.display = 'flex';
+    // Load role/url/notes before any edit, so a save never writes them back blank
+    ensureEdgeDetails([edge]).catch(err => console.warn('Could not load edge details', err));
   }
   
   closeEdgeModalBtn.onclick = () => {
@@ -256,10 +475,10 @@
       edgeRelCustom.style.display = 'none';
       // Update edge with standard relationship
       if (currentEdgeId) {
-        const edge = edges.get(currentEdgeId);
+        const edge = graphStore.edge(edgeRowOf(currentEdgeId));
         const newRel = edgeRelSelect.value;
-        edges.update({ id: currentEdgeId, label: newRel });
-        queueOp({ type: 'edge_update', from: edge.from, to: edge.to, old_relationship: edge.label, new_relationship: newRel });
+        updateGraphEdge(edge.id, { relationship: newRel });
+        queueOp({ type: 'edge_update', from: edge.from, to: edge.to, old_relationship: edge.relationship, new_relationship: newRel });
         hasUnsaved = true; updateUnsaved();
         showToast('Relationship updated (not yet saved)');
       }
@@ -272,9 +491,9 @@
     const customRel = edgeRelCustom.value.trim();
     if (!customRel) return;
     
-    const edge = edges.get(currentEdgeId);
-    edges.update({ id: currentEdgeId, label: customRel });
-    queueOp({ type: 'edge_update', from: edge.from, to: edge.to, old_relationship: edge.label, new_relationship: customRel });
+    const edge = graphStore.edge(edgeRowOf(currentEdgeId));
+    updateGraphEdge(edge.id, { relationship: customRel });
+    queueOp({ type: 'edge_update', from: edge.from, to: edge.to, old_relationship: edge.relationship, new_relationship: customRel });
     hasUnsaved = true; updateUnsaved();
     showToast('Relationship updated (not yet saved)');
   });
@@ -282,10 +501,10 @@
   // Delete edge
   deleteEdgeBtn.onclick = () => {
     if (!currentEdgeId) return;
-    const edge = edges.get(currentEdgeId);
+    const edge = graphStore.edge(edgeRowOf(currentEdgeId));
     
-    edges.remove(currentEdgeId);
-    queueOp({ type: 'edge_remove', from: edge.from, to: edge.to, relationship: edge.label || 'partnership' });
+    removeGraphEdges([edge.id]);
+    queueOp({ type: 'edge_remove', from: edge.from, to: edge.to, relationship: edge.relationship || 'partnership' });
     hasUnsaved = true; updateUnsaved();
     showToast('Connection deleted (not yet saved)');
     
@@ -302,8 +521,7 @@
       openEdgeModal(edgeId);
     } else if (params.nodes && params.nodes.length > 0) {
       const id = params.nodes[0];
-      const n = nodes.get(id);
-      if (n) {
+      if (graphStore.hasNode(id)) {
         openCurationFor(id);
       }
     }
@@ -312,7 +530,7 @@
   sourceToggle.addEventListener('change', ()=>{
     if (!currentSourceId) return;
     const shouldHide = !sourceToggle.checked;
-    nodes.update({ id: currentSourceId, hidden: shouldHide });
+    updateGraphNode(currentSourceId, { hidden: shouldHide });
     // Queue operation to persist hidden state
     queueOp({ type: 'update_node', id: currentSourceId, hidden: shouldHide });
     hasUnsaved = true; updateUnsaved();
@@ -324,7 +542,7 @@
     const newUrl = curUrlInput.value.trim();
     if (newUrl !== originalUrl) {
       // Update node data
-      nodes.update({ id: currentSourceId, url: newUrl });
+      updateGraphNode(currentSourceId, { url: newUrl });
       // Update display link
       if (newUrl) {
         curSrcLink.href = newUrl;
@@ -347,43 +565,9 @@
     radio.addEventListener('change', ()=>{
       if (!currentSourceId) return;
       const newType = radio.value;
-      const currentNode = nodes.get(currentSourceId);
-      
       // Only update if actually different from current state
-      if (newType !== currentNode.group) {
-        let updates = { id: currentSourceId, group: newType };
-        
-        // Update shape and color based on type - vis.js needs explicit color object
-        if (newType === 'person') {
-          updates.shape = 'dot';
-          updates.color = {
-            background: '#6aa7ff',
-            border: '#2f79ff',
-            highlight: {background: '#4d8fff', border: '#2f79ff'},
-            hover: {background: '#4d8fff', border: '#2f79ff'}
-          };
-        } else if (newType === 'project') {
-          updates.shape = 'triangle';
-          updates.color = {
-            background: '#ffd97d',
-            border: '#f9a826',
-            highlight: {background: '#ffc94d', border: '#f9a826'},
-            hover: {background: '#ffc94d', border: '#f9a826'}
-          };
-        } else if (newType === 'organization') {
-          updates.shape = 'box';
-          updates.color = {
-            background: '#a8dadc',
-            border: '#457b9d',
-            highlight: {background: '#8cc5ca', border: '#457b9d'},
-            hover: {background: '#8cc5ca', border: '#457b9d'}
-          };
-        }
-        
-        nodes.update(updates);
-        
-        // Force visual redraw - vis.js needs this for immediate shape/color changes
-        network.redraw();
+      if (newType !== graphStore.nodeTypeName(graphStore.nodeRow(currentSourceId))) {
+        updateGraphNode(currentSourceId, { type: newType });
         
         // Queue operation to persist type change
         queueOp({ type: 'update_node', id: currentSourceId, node_type: newType });
@@ -396,6 +580,7 @@
   curList.addEventListener('change', (e)=>{
     if (!currentSourceId) return;
     const t = e.target;
+    const item = Number(t.dataset.item);
     
     // Handle existing connection checkboxes (data-conn-id)
     if (t && t.matches('input[type="checkbox"][data-conn-id]')){
@@ -405,59 +590,63 @@
       
       if (!t.checked) {
         // Remove connection - ONLY the edge with this specific relationship
-        const allEdges = edges.get().filter(e => e.from === src || e.to === src);
-        const toRemove = allEdges.filter(e => {
-          const otherId = e.from === src ? e.to : e.from;
-          const edgeRel = e.label || e.relationship || '';
-          return otherId === connId && edgeRel === relationship;
-        });
+        const toRemove = graphStore.findEdges(src, connId, relationship, true).map(r => graphStore.edge(r));
         
         if (toRemove.length > 0) {
-          edges.remove(toRemove.map(e => e.id));
+          removeGraphEdges(toRemove.map(e => e.id));
           toRemove.forEach(edge => {
-            queueOp({ type:'edge_remove', from: edge.from, to: edge.to, relationship: edge.label || edge.relationship || 'connected' });
+            queueOp({ type:'edge_remove', from: edge.from, to: edge.to, relationship: edge.relationship || 'connected' });
           });
           hasUnsaved = true; updateUnsaved();
-          refreshConnectionList(); // Refresh modal to show updated state
+          setCurationChecked(item, false, -1); // the row stays, unticked, to restore from
         }
       } else {
         // Re-checking a removed connection - restore it with the specific relationship
-        const targetNode = nodes.get(connId);
-        if (targetNode) {
-          const exists = edges.get().some(e => 
-            ((e.from === src && e.to === connId) || (e.from === connId && e.to === src)) &&
-            (e.label || e.relationship || '') === relationship
-          );
+        if (graphStore.hasNode(connId)) {
+          const exists = graphStore.findEdges(src, connId, relationship, true).length > 0;
           if (!exists) {
-            edges.add({ from: src, to: connId, label: relationship || 'connected', font:{align:'horizontal'} });
+            addGraphEdge(src, connId, relationship || 'connected');
             queueOp({ type:'edge_add', from: src, to: connId, relationship: relationship || 'connected' });
             hasUnsaved = true; updateUnsaved();
-            refreshConnectionList(); // Refresh modal to show updated state
+            setCurationChecked(item, true, 1);
           }
         }
       }
     }
     
+    // Handle hidden connection checkboxes (data-restore-id): unhide that node
+    if (t && t.matches('input[type="checkbox"][data-restore-id]') && t.checked){
+      const id = t.getAttribute('data-restore-id');
+      if (graphStore.hasNode(id)) {
+        updateGraphNode(id, { hidden: false });
+        queueOp({ type: 'update_node', id, hidden: false });
+        hasUnsaved = true; updateUnsaved();
+        showToast('Node restored (not yet saved)');
+        setCurationChecked(item, true, 1);
+      }
+      return;
+    }
+    
     // Handle discovered partner checkboxes (data-name) - org-only feature
     if (t && t.matches('input[type="checkbox"][data-name]')){
       const src=currentSourceId; const name=String(t.getAttribute('data-name')); const url=t.getAttribute('data-url')||'';
       const nid='org::'+name;
       if (t.checked){
-        if(!nodes.get(nid)) nodes.add({ id:nid, label:name, group:'organization', shape:'box', url:url, color:{background:'#a8dadc', border:'#457b9d'}, value:1});
-        const exists=edges.get().some(e=>e.from===src && e.to===nid && (e.label||'')==='partnership');
+        if(!graphStore.hasNode(nid)) addGraphNode({ id:nid, label:name, type:'organization', url:url });
+        const exists=graphStore.findEdges(src, nid, 'partnership').length > 0;
         if(!exists) {
-          edges.add({ from: src, to: nid, label:'partnership', font:{align:'horizontal'} });
+          addGraphEdge(src, nid, 'partnership');
           // Queue for batch save
           queueOp({ type:'edge_add', from: src, to: nid, relationship: 'partnership' });
-          refreshConnectionList(); // Refresh modal to show updated state
+          setCurationChecked(item, true, 1);
         }
       } else {
-        const toRemove = edges.get().filter(e=>e.from===src && e.to===nid && (e.label||'')==='partnership');
+        const toRemove = graphStore.findEdges(src, nid, 'partnership');
         if (toRemove.length) {
-          edges.remove(toRemove.map(e=>e.id));
+          removeGraphEdges(toRemove);
           // Queue for batch save
           queueOp({ type:'edge_remove', from: src, to: nid, relationship: 'partnership' });
-          refreshConnectionList(); // Refresh modal to show updated state
+          setCurationChecked(item, false, -1);
         }
       }
       hasUnsaved = true; updateUnsaved();
@@ -466,11 +655,13 @@
   // Close: just hide the modal (changes are already queued)
   document.getElementById('closeCuration').onclick = ()=>{
     curModal.style.display='none';
+    stashCurrentIfHidden();
   };
   // Esc closes the modal (no warning needed - changes already queued)
   window.addEventListener('keydown', (e)=>{
     if (e.key === 'Escape' && curModal.style.display==='flex'){
       curModal.style.display='none';
+      stashCurrentIfHidden();
     }
   });
   function showToast(msg){ const t=document.getElementById('toast'); t.textContent=msg; t.style.display='block'; setTimeout(()=>{ t.style.display='none'; }, 2500); }
@@ -501,12 +692,25 @@
   network.on('doubleClick', function(params) {
     if (params.nodes && params.nodes.length > 0) {
       const id = params.nodes[0];
-      const n = nodes.get(id);
+      const n = graphStore.node(id);
       if (n && n.url) {
         window.open(n.url, '_blank');
+      } else if (n && needsDetails('nodes', id)) {
+        // URL not fetched yet: open the tab inside the click (popup blockers), point it once known
+        const win = window.open('', '_blank');
+        ensureNodeDetails([id]).then(() => {
+          const url = (graphStore.node(id) || {}).url;
+          if (!win) return;
+          if (url) win.location.href = url; else win.close();
+        }).catch(() => { if (win) win.close(); });
       }
     }
   });
+  // Tooltips are a cheap hint that details are about to be wanted: prefetch them
+  network.on('showPopup', id => {
+    if (graphStore.hasNode(id)) ensureNodeDetails([id]).catch(() => {});
+    else if (graphStore.edge(edgeRowOf(id))) ensureEdgeDetails([graphStore.edge(edgeRowOf(id))]).catch(() => {});
+  });
   // Make the curation modal draggable by the header
   (function(){
     const panel = document.getElementById('curationPanel');
@@ -532,18 +736,28 @@
     const nodeList = document.getElementById('nodeList');
     const fromTypeRadios = [...document.querySelectorAll('input[name="fromType"]')];
     const toTypeRadios = [...document.querySelectorAll('input[name="toType"]')];
-    // populate datalist
+    // populate datalist with the drawn nodes; bursts of DataSet events rebuild it once
+    let nodeListQueued = false;
     function refreshNodeList(){
-      nodeList.innerHTML = '';
-      nodes.get().forEach(n=>{
-        const opt = document.createElement('option');
-        opt.value = n.label;
-        nodeList.appendChild(opt);
-      });
+      if (nodeListQueued) return;
+      nodeListQueued = true;
+      setTimeout(() => {
+        nodeListQueued = false;
+        const options = document.createDocumentFragment();
+        graphStore.findRows(isProjected).forEach(r => {
+          const opt = document.createElement('option');
+          opt.value = graphStore.nodeLabel(r);
+          options.appendChild(opt);
+        });
+        nodeList.replaceChildren(options);
+      }, 0);
     }
     refreshNodeList();
     nodes.on('add', refreshNodeList);
-    nodes.on('update', refreshNodeList);
+    nodes.on('update', (event, props) => {
+      if (props.data.some(d => 'label' in d)) refreshNodeList();
+    });
+    nodes.on('remove', refreshNodeList);
 
     qeRel.addEventListener('change', ()=>{
       if (qeRel.value === '__custom') {
@@ -554,56 +768,55 @@
       }
     });
 
+    // A new label that reads like an existing node's ("Eco-Restoration Alliance" for
+    // "Ecorestoration Alliance") is offered as that node before another is created
+    function nearDuplicateId(label, type){
+      const match = duplicateIndex.candidates(label, { type, limit: 1 })[0];
+      if (!match) return null;
+      const existing = graphStore.nodeLabel(match.row);
+      if (!confirm(`"${String(label).trim()}" looks like the existing "${existing}". Use that node instead of creating a new one?`)) return null;
+      return graphStore.nodeId(match.row);
+    }
+
     function resolveNodeId(label, referenceNodeId){
-      // find by label, else create node with type from radios
-      const all = nodes.get();
-      const found = all.find(n=>String(n.label).trim() === String(label).trim());
-      if (found) return found.id;
+      // find by label (hidden nodes included), else create node with type from radios
+      const found = graphStore.findByLabel(label);
+      if (found >= 0) return graphStore.nodeId(found);
       // determine type from radios
       const fromSel = fromTypeRadios.find(r=>r.checked)?.value || 'organization';
       const map = { person:'person::', project:'project::', organization:'org::' };
       const pref = map[fromSel] || 'org::';
       const nid = pref + String(label).trim();
-      if (!nodes.get(nid)){
-        const group = (fromSel==='person') ? 'person' : (fromSel==='project' ? 'project' : 'organization');
-        const visuals = getNodeVisuals(group);
-        // Position new node near reference node (if provided) to prevent racing offscreen
-        let x = Math.random() * 200 - 100;
-        let y = Math.random() * 200 - 100;
-        if(referenceNodeId){
-          const refPos = network.getPositions([referenceNodeId])[referenceNodeId];
-          if(refPos){
-            x = refPos.x + (Math.random() * 200 - 100);
-            y = refPos.y + (Math.random() * 200 - 100);
-          }
-        }
-        nodes.add({ id:nid, label:String(label).trim(), group:group, shape:visuals.shape, origin:origin, color:visuals.color, value:1, x:x, y:y });
+      if (!graphStore.hasNode(nid)){
+        const type = (fromSel==='person') ? 'person' : (fromSel==='project' ? 'project' : 'organization');
+        const similar = nearDuplicateId(label, type);
+        if (similar) return similar;
+        addGraphNode({ id:nid, label:String(label).trim(), type:type, origin:'' }, newNodePosition(referenceNodeId, type));
       }
       return nid;
     }
 
+    // A new node starts next to the node it is being connected to (in the widest
+    // gap around it, see placeNear), else in the middle of the view
+    function newNodePosition(referenceNodeId, type){
+      const refPos = referenceNodeId && network.getPositions([referenceNodeId])[referenceNodeId];
+      if (!refPos) return placeNear(network.getViewPosition(), [], type);
+      const around = graphStore.neighbours(referenceNodeId).filter(id => nodes.get(id));
+      return placeNear(refPos, Object.values(network.getPositions(around)), type);
+    }
+
     function resolveToNodeId(label, referenceNodeId){
-      const all = nodes.get();
-      const found = all.find(n=>String(n.label).trim() === String(label).trim());
-      if (found) return found.id;
+      const found = graphStore.findByLabel(label);
+      if (found >= 0) return graphStore.nodeId(found);
       const toSel = toTypeRadios.find(r=>r.checked)?.value || 'organization';
       const map = { person:'person::', project:'project::', organization:'org::' };
       const pref = map[toSel] || 'org::';
       const nid = pref + String(label).trim();
-      if (!nodes.get(nid)){
-        const group = (toSel==='person') ? 'person' : (toSel==='project' ? 'project' : 'organization');
-        const visuals = getNodeVisuals(group);
-        // Position new node near reference node (if provided) to prevent racing offscreen
-        let x = Math.random() * 200 - 100;
-        let y = Math.random() * 200 - 100;
-        if(referenceNodeId){
-          const refPos = network.getPositions([referenceNodeId])[referenceNodeId];
-          if(refPos){
-            x = refPos.x + (Math.random() * 200 - 100);
-            y = refPos.y + (Math.random() * 200 - 100);
-          }
-        }
-        nodes.add({ id:nid, label:String(label).trim(), group:group, shape:visuals.shape, origin:origin, color:visuals.color, value:1, x:x, y:y });
+      if (!graphStore.hasNode(nid)){
+        const type = (toSel==='person') ? 'person' : (toSel==='project' ? 'project' : 'organization');
+        const similar = nearDuplicateId(label, type);
+        if (similar) return similar;
+        addGraphNode({ id:nid, label:String(label).trim(), type:type, origin:'' }, newNodePosition(referenceNodeId, type));
       }
       return nid;
     }
@@ -630,30 +843,26 @@
       }
       const createdNodes = [];
       // Check if nodes exist before creating (to pass as reference for positioning)
-      const fromExists = nodes.get().find(n=>String(n.label).trim() === fromLabel);
-      const toExists = nodes.get().find(n=>String(n.label).trim() === toLabel);
+      const fromExists = graphStore.findByLabel(fromLabel) >= 0;
+      const toRow = graphStore.findByLabel(toLabel);
+      const toExists = toRow >= 0;
       // Create nodes, passing existing node as reference for positioning
-      const fromId = resolveNodeId(fromLabel, toExists?.id); if (!fromExists) createdNodes.push(fromId);
+      const fromId = resolveNodeId(fromLabel, toExists ? graphStore.nodeId(toRow) : undefined); if (!fromExists) createdNodes.push(fromId);
       const toId = resolveToNodeId(toLabel, fromId); if (!toExists) createdNodes.push(toId);
       
       // Unhide both nodes when creating an edge (connecting a hidden node should make it visible)
-      const fromNode = nodes.get(fromId);
-      const toNode = nodes.get(toId);
-      if (fromNode && fromNode.hidden) {
-        nodes.update({id: fromId, hidden: false});
+      if (graphStore.isHidden(graphStore.nodeRow(fromId))) {
+        updateGraphNode(fromId, { hidden: false });
         queueOp({ type: 'update_node', id: fromId, hidden: false });
       }
-      if (toNode && toNode.hidden) {
-        nodes.update({id: toId, hidden: false});
+      if (graphStore.isHidden(graphStore.nodeRow(toId))) {
+        updateGraphNode(toId, { hidden: false });
         queueOp({ type: 'update_node', id: toId, hidden: false });
       }
       
       // Add the new edge (check if this SPECIFIC edge exists with this EXACT relationship)
-      const exists = edges.get().find(e=>
-        ((e.from===fromId && e.to===toId) || (e.from===toId && e.to===fromId)) && 
-        (e.label||'')===rel
-      );
-      if (!exists){ edges.add({ from: fromId, to: toId, label: rel, font:{align:'horizontal'} }); }
+      const exists = graphStore.findEdges(fromId, toId, rel, true).length > 0;
+      if (!exists){ addGraphEdge(fromId, toId, rel); }
       lastAction = { type:'add', edge:{from:fromId, to:toId, label:rel}, createdNodes };
       queueOp({ type:'edge_add', from: fromId, to: toId, relationship: rel });
       
@@ -677,8 +886,8 @@
       if (!rel){ alert('Choose a relationship'); return; }
       const fromId = resolveNodeId(fromLabel);
       const toId = resolveToNodeId(toLabel);
-      const toRemove = edges.get().filter(e=>e.from===fromId && e.to===toId && (e.label||'')===rel);
-      if (toRemove.length){ edges.remove(toRemove.map(e=>e.id)); lastAction = { type:'remove', edge:{from:fromId, to:toId, label:rel} }; queueOp({ type:'edge_remove', from: fromId, to: toId, relationship: rel }); showToast('Edge removed (not yet saved)'); }
+      const toRemove = graphStore.findEdges(fromId, toId, rel);
+      if (toRemove.length){ removeGraphEdges(toRemove); lastAction = { type:'remove', edge:{from:fromId, to:toId, label:rel} }; queueOp({ type:'edge_remove', from: fromId, to: toId, relationship: rel }); showToast('Edge removed (not yet saved)'); }
       else { alert('No such edge found'); }
     }
 
@@ -687,11 +896,11 @@
       try{
         console.log('[doSave] Saving to Google Sheets...');
         if (typeof saveDataToSheets === 'function') {
-          await saveDataToSheets();
+          // Concurrent clicks coalesce into one follow-up save (see saveDataToSheets)
+          const result = await saveDataToSheets();
+          if (!result || !result.ok) return;
           lastAction = null;
-          pendingOps.length = 0;  // Clear array without breaking reference
-          hasUnsaved = false; 
-          updateUnsaved();
+          dropSavedOps(result.ops);
         } else {
           showToast('⚠️ Sheets API not initialized');
         }
@@ -705,14 +914,14 @@
       if (!lastAction) { showToast('Nothing to undo'); return; }
       const a = lastAction;
       if (a.type==='add'){
-        const toRemove = edges.get().filter(e=>e.from===a.edge.from && e.to===a.edge.to && (e.label||'')===a.edge.label);
-        if (toRemove.length) edges.remove(toRemove.map(e=>e.id));
+        removeGraphEdges(graphStore.findEdges(a.edge.from, a.edge.to, a.edge.label));
         // also remove matching pending op if it is the last one
         const last = pendingOps[pendingOps.length-1];
         if (last && last.type==='edge_add' && last.from===a.edge.from && last.to===a.edge.to && last.relationship===a.edge.label){ pendingOps.pop(); }
       } else if (a.type==='remove'){
-        const exists = edges.get().find(e=>e.from===a.edge.from && e.to===a.edge.to && (e.label||'')===a.edge.label);
-        if (!exists) edges.add({ from:a.edge.from, to:a.edge.to, label:a.edge.label, font:{align:'horizontal'} });
+        // Drawn only if both ends are (see the projection in graph_store.js)
+        const exists = graphStore.findEdges(a.edge.from, a.edge.to, a.edge.label).length > 0;
+        if (!exists) addGraphEdge(a.edge.from, a.edge.to, a.edge.label);
         const last = pendingOps[pendingOps.length-1];
         if (last && last.type==='edge_remove' && last.from===a.edge.from && last.to===a.edge.to && last.relationship===a.edge.label){ pendingOps.pop(); }
       }
@@ -724,20 +933,17 @@
     // When type radios change and the input matches an existing node, update live and stage update_node
     function updateNodeTypeFromInput(inputEl, radios, which){
       const label = (inputEl.value||'').trim(); if(!label) return;
-      const all = nodes.get();
-      const n = all.find(nn=>String(nn.label).trim()===label);
-      if (!n) return; // creation path handled elsewhere
+      const row = graphStore.findByLabel(label);
+      if (row < 0) return; // creation path handled elsewhere
       const val = (radios.find(r=>r.checked)?.value)||'organization';
       const newType = (val==='person')?'person':(val==='project'?'project':'organization');
       // Only stage if type actually changes
-      if ((n.group==='person' && newType==='person') || (n.group==='organization' && newType!=='person' && newType!=='project' && newType==='organization')) {
-        // no-op check for org default, but allow project explicitly
-      }
+      if (graphStore.nodeTypeName(row) === newType) return;
       // Update visualization immediately
-      const shape = newType==='person' ? 'dot' : (newType==='project' ? 'triangle' : 'box');
-      nodes.update({ id: n.id, group: (newType==='organization'?'organization':newType), shape: shape });
+      const id = graphStore.nodeId(row);
+      updateGraphNode(id, { type: newType });
       // Stage persistence
-      queueOp({ type:'update_node', id: n.id, node_type: newType });
+      queueOp({ type:'update_node', id, node_type: newType });
       showToast('Node type updated (not yet saved)');
     }
 
@@ -746,14 +952,12 @@
 
     // Auto-set type radios when selecting from autocomplete or typing existing node name
     function autoSetFromType(){
-      const all=nodes.get(); 
-      const f=all.find(n=>String(n.label).trim()===qeFrom.value.trim()); 
-      if(f) setTypeRadiosFromId(f.id,true);
+      const f=graphStore.findByLabel(qeFrom.value); 
+      if(f >= 0) setTypeRadiosFromId(graphStore.nodeId(f),true);
     }
     function autoSetToType(){
-      const all=nodes.get(); 
-      const f=all.find(n=>String(n.label).trim()===qeTo.value.trim()); 
-      if(f) setTypeRadiosFromId(f.id,false);
+      const f=graphStore.findByLabel(qeTo.value); 
+      if(f >= 0) setTypeRadiosFromId(graphStore.nodeId(f),false);
     }
     
     // Trigger on blur (when leaving field) and on input (when selecting from datalist)
@@ -779,76 +983,45 @@
     // Highlight nodes when single match found - track From and To separately
     let highlightedFromNode = null;
     let highlightedToNode = null;
-    let highlightInterval = null;
+    // Nodes the search filter has ghosted (see applyQESearchFilter)
+    let ghostedNodes = new Set();
+
+    // View state for a node: a highlight wins over ghosting
+    function viewState(id) {
+      if (id === highlightedFromNode || id === highlightedToNode) return 'highlighted';
+      return ghostedNodes.has(id) ? 'ghost' : '';
+    }
+
+    // Move nodes into the group for their current view state (skips nodes already there)
+    function restyleNodes(ids) {
+      const updates = [];
+      ids.forEach(id => {
+        const node = nodes.get(id);
+        if (!node) return;
+        const state = viewState(id);
+        if (node.state !== state) updates.push({ id, state, group: nodeGroup(graphStore.nodeTypeName(graphStore.nodeRow(id)), state) });
+      });
+      if (updates.length) nodes.update(updates);
+    }
     
     function clearAllHighlights() {
       // Clear both From and To highlights
-      const nodesToClear = [];
-      if (highlightedFromNode) nodesToClear.push(highlightedFromNode);
-      if (highlightedToNode) nodesToClear.push(highlightedToNode);
-      
-      if (nodesToClear.length > 0) {
-        const updates = nodesToClear.map(id => {
-          const node = nodes.get(id);
-          const type = node.type || node.group;
-          const visuals = getNodeVisuals(type);
-          return {
-            id: id,
-            borderWidth: 1,
-            color: visuals.color
-          };
-        });
-        nodes.update(updates);
-        highlightedFromNode = null;
-        highlightedToNode = null;
-      }
-      // Stop reapplying highlights
-      if (highlightInterval) {
-        clearInterval(highlightInterval);
-        highlightInterval = null;
-      }
+      const nodesToClear = [highlightedFromNode, highlightedToNode].filter(Boolean);
+      highlightedFromNode = null;
+      highlightedToNode = null;
+      restyleNodes(nodesToClear);
     }
     
     function clearHighlightForField(isFrom) {
       // Clear highlight for specific field only
       const nodeId = isFrom ? highlightedFromNode : highlightedToNode;
-      if (nodeId) {
-        const node = nodes.get(nodeId);
-        const type = node.type || node.group;
-        const visuals = getNodeVisuals(type);
-        nodes.update({
-          id: nodeId,
-          borderWidth: 1,
-          color: visuals.color
-        });
-        
-        if (isFrom) {
-          highlightedFromNode = null;
-        } else {
-          highlightedToNode = null;
-        }
+      if (!nodeId) return;
+      if (isFrom) {
+        highlightedFromNode = null;
+      } else {
+        highlightedToNode = null;
       }
-    }
-    
-    function reapplyHighlights() {
-      // Reapply yellow borders to both highlighted nodes (in case network events reset them)
-      const nodesToHighlight = [];
-      if (highlightedFromNode) nodesToHighlight.push(highlightedFromNode);
-      if (highlightedToNode) nodesToHighlight.push(highlightedToNode);
-      
-      nodesToHighlight.forEach(nodeId => {
-        const node = nodes.get(nodeId);
-        if (node && node.color.border !== '#FFD700') {
-          nodes.update({
-            id: nodeId,
-            borderWidth: 5,
-            color: {
-              background: node.color.background,
-              border: '#FFD700'
-            }
-          });
-        }
-      });
+      restyleNodes([nodeId]);
     }
     
     function highlightNode(label, isFrom) {
@@ -856,51 +1029,24 @@
       clearHighlightForField(isFrom);
       
       // If empty, just return (that field's highlight cleared)
-      if (!label || label.trim().length === 0) {
-        // Restart interval if other field still highlighted
-        if (highlightedFromNode || highlightedToNode) {
-          if (highlightInterval) clearInterval(highlightInterval);
-          highlightInterval = setInterval(reapplyHighlights, 100);
-        } else {
-          // No highlights left, stop interval
-          if (highlightInterval) {
-            clearInterval(highlightInterval);
-            highlightInterval = null;
-          }
-        }
-        return;
-      }
+      if (!label || label.trim().length === 0) return;
       
-      const all = nodes.get();
-      const matches = all.filter(n => 
-        String(n.label).trim().toLowerCase() === String(label).trim().toLowerCase()
-      );
+      const want = String(label).trim().toLowerCase();
+      const matches = graphStore.findRows(r => isProjected(r) && graphStore.lowerLabel(r).trim() === want, 2);
       
       // Only highlight if exactly one match
       if (matches.length === 1) {
-        const node = matches[0];
-        const nodeId = node.id;
-        nodes.update({
-          id: nodeId,
-          borderWidth: 5,
-          color: { 
-            background: node.color.background,
-            border: '#FFD700'  // Gold/yellow border
-          }
-        });
+        const id = graphStore.nodeId(matches[0]);
         
         // Store in appropriate field
         if (isFrom) {
-          highlightedFromNode = nodeId;
+          highlightedFromNode = id;
         } else {
-          highlightedToNode = nodeId;
+          highlightedToNode = id;
         }
+        restyleNodes([id]);
         
-        console.log(`[QE] Highlighted ${isFrom ? 'From' : 'To'} node: ${node.label}`);
-        
-        // Continuously reapply highlights every 100ms to prevent network from overriding them
-        if (highlightInterval) clearInterval(highlightInterval);
-        highlightInterval = setInterval(reapplyHighlights, 100);
+        console.log(`[QE] Highlighted ${isFrom ? 'From' : 'To'} node: ${graphStore.nodeLabel(matches[0])}`);
       }
     }
     
@@ -921,41 +1067,16 @@
     window.doSave = doSave;
 
     // Quick Editor Search Filtering: progressively narrow visible nodes as user types
-    // Build adjacency list once for performance
-    let adjacencyList = null;
-    function buildAdjacencyList(){
-      adjacencyList = {};
-      edges.get().forEach(e => {
-        if(!adjacencyList[e.from]) adjacencyList[e.from] = [];
-        if(!adjacencyList[e.to]) adjacencyList[e.to] = [];
-        adjacencyList[e.from].push(e.to);
-        adjacencyList[e.to].push(e.from);
-      });
+    function getConnectedComponent(startNodeIds){
+      // BFS over the store's CSR adjacency, through drawn nodes only
+      return graphStore.component(startNodeIds, isProjected);
     }
-    buildAdjacencyList();
-    edges.on('add', buildAdjacencyList);
-    edges.on('remove', buildAdjacencyList);
 
-    function getConnectedComponent(startNodeIds){
-      // Fast BFS using pre-built adjacency list
-      const visited = new Set();
-      const queue = [...startNodeIds];
-      
-      while(queue.length > 0){
-        const nodeId = queue.shift();
-        if(visited.has(nodeId)) continue;
-        visited.add(nodeId);
-        
-        const neighbors = adjacencyList[nodeId];
-        if(neighbors){
-          neighbors.forEach(neighbor => {
-            if(!visited.has(neighbor)){
-              queue.push(neighbor);
-            }
-          });
-        }
-      }
-      return visited;
+    // Ghosted nodes switch to the ghost group and drop out of the physics simulation
+    function ghostUpdate(id){
+      const ghost = ghostedNodes.has(id);
+      const state = viewState(id);
+      return {id, state, group: nodeGroup(graphStore.nodeTypeName(graphStore.nodeRow(id)), state), physics: !ghost, fixed: ghost ? {x: true, y: true} : false};
     }
 
     function applyQESearchFilter(){
@@ -964,27 +1085,19 @@
       
       // If both empty, clear all filters
       if(!fromQuery && !toQuery){
-        const allNodes = nodes.get();
-        allNodes.forEach(n => {
-          const updates = {id: n.id, physics: true, fixed: false};
-          if(n.originalColor){
-            updates.color = n.originalColor;
-            updates.opacity = 1;
-          }
-          nodes.update(updates);
-        });
+        const wasGhosted = [...ghostedNodes];
+        ghostedNodes = new Set();
+        nodes.update(wasGhosted.filter(id => nodes.get(id)).map(ghostUpdate));
         return;
       }
       
-      const allNodes = nodes.get();
+      const drawn = graphStore.findRows(isProjected);
       let fromComponent = new Set();
       let toComponent = new Set();
       
       // Find nodes matching From query
       if(fromQuery){
-        const fromMatches = allNodes.filter(n => 
-          String(n.label).toLowerCase().includes(fromQuery)
-        ).map(n => n.id);
+        const fromMatches = drawn.filter(r => graphStore.labelIncludes(r, fromQuery)).map(r => graphStore.nodeId(r));
         if(fromMatches.length > 0){
           fromComponent = getConnectedComponent(fromMatches);
         }
@@ -992,9 +1105,7 @@
       
       // Find nodes matching To query
       if(toQuery){
-        const toMatches = allNodes.filter(n => 
-          String(n.label).toLowerCase().includes(toQuery)
-        ).map(n => n.id);
+        const toMatches = drawn.filter(r => graphStore.labelIncludes(r, toQuery)).map(r => graphStore.nodeId(r));
         if(toMatches.length > 0){
           toComponent = getConnectedComponent(toMatches);
         }
@@ -1009,43 +1120,14 @@
         toComponent.forEach(id => visibleSet.add(id));
       }
       
-      // Batch update for performance - collect all updates first
-      const updates = [];
-      allNodes.forEach(n => {
-        // Store original color on first filter
-        if(!n.originalColor && n.color){
-          n.originalColor = JSON.parse(JSON.stringify(n.color));
-        }
-        
-        if(visibleSet.has(n.id)){
-          // Visible: restore original appearance
-          const update = {
-            id: n.id,
-            physics: true,
-            fixed: false,
-            opacity: 1
-          };
-          if(n.originalColor){
-            update.color = n.originalColor;
-          }
-          updates.push(update);
-        } else {
-          // Ghost: grayed out, no physics, non-interactive
-          updates.push({
-            id: n.id,
-            color: {
-              background: 'rgba(200,200,200,0.2)',
-              border: 'rgba(150,150,150,0.3)'
-            },
-            opacity: 0.2,
-            physics: false,
-            fixed: {x: true, y: true}
-          });
-        }
-      });
+      // Ghosts: grayed out (ghost group), no physics, non-interactive
+      const wasGhosted = ghostedNodes;
+      const drawnIds = drawn.map(r => graphStore.nodeId(r));
+      ghostedNodes = new Set(drawnIds.filter(id => !visibleSet.has(id)));
+      const changed = drawnIds.filter(id => ghostedNodes.has(id) !== wasGhosted.has(id));
       
       // Single batch update instead of many individual updates
-      nodes.update(updates);
+      nodes.update(changed.map(ghostUpdate));
       
       // Auto-zoom to visible nodes
       if(visibleSet.size > 0){
@@ -1074,18 +1156,20 @@
       const a=(fltA.value||'').trim().toLowerCase();
       const b=(fltB.value||'').trim().toLowerCase();
       const updates=[];
-      nodes.get().forEach(n=>{
-        const label=(String(n.label||'').toLowerCase());
-        const match = (!a && !b) || (a && label.includes(a)) || (b && label.includes(b));
-        updates.push({ id:n.id, hidden: !match });
+      const hiddenIds=new Set();
+      graphStore.findRows(isProjected).forEach(r=>{
+        const match = (!a && !b) || (a && graphStore.labelIncludes(r, a)) || (b && graphStore.labelIncludes(r, b));
+        const id = graphStore.nodeId(r);
+        // A node revealed for curation stays hidden if it is curated-hidden
+        const hidden = !match || graphStore.isHidden(r);
+        if (hidden) hiddenIds.add(id);
+        updates.push({ id, hidden });
       });
       nodes.update(updates);
       // Hide edges not fully visible
-      const eUpd=[];
-      edges.get().forEach(e=>{
-        const f=nodes.get(e.from), t=nodes.get(e.to);
-        const vis = f && t && !f.hidden && !t.hidden;
-        eUpd.push({ id:e.id, hidden: !vis });
+      const eUpd=edges.getIds().map(id=>{
+        const r=edgeRowOf(id);
+        return { id, hidden: hiddenIds.has(graphStore.edgeFrom(r)) || hiddenIds.has(graphStore.edgeTo(r)) };
       });
       edges.update(eUpd);
     }
@@ -1094,9 +1178,10 @@
     if (clearFiltersBtn) clearFiltersBtn.onclick = clearFilters;
   })();
 
-  // Page-unload warning for unsaved changes
+  // Page-unload: autosave tries a final keepalive flush, otherwise warn about unsaved changes
   window.addEventListener('beforeunload', function(e) {
     if(window.hasUnsaved && window.pendingOps && window.pendingOps.length > 0){
+      if (autosaveEnabled && typeof flushOpsOnUnload === 'function' && flushOpsOnUnload(pendingOps)) return;
       // Prevent the page from closing
       e.preventDefault();
       // Chrome requires returnValue to be set
@@ -0,0 +1,235 @@
+  // Bulk import/export (Import/Export toolbar buttons, file drop on the graph)
+  // Files are parsed and exports serialized in io_worker.js; this side only
+  // resolves parsed rows against the loaded graph and adds them as one batch:
+  // one store/DataSet update, one queueOps call (one autosave, one broadcast).
+  (function(){
+    if (!('Worker' in window)) return;
+
+    const TYPE_PREFIX = { person: 'person::', project: 'project::', organization: 'org::', org: 'org::' };
+    const DEFAULT_RELATIONSHIP = 'partnership';
+
+    let worker = null;
+    let jobSeq = 0;
+    const jobs = new Map(); // job -> {onRows, onProgress, resolve, reject}
+
+    function ioWorker(){
+      if (worker) return worker;
+      worker = new Worker('./io_worker.js');
+      worker.onmessage = (e) => {
+        const msg = e.data, job = jobs.get(msg.job);
+        if (!job) return;
+        if (msg.type === 'rows') job.onRows(msg.kind, msg.rows);
+        else if (msg.type === 'progress') job.onProgress(msg);
+        else {
+          jobs.delete(msg.job);
+          if (msg.type === 'error') job.reject(new Error(msg.message));
+          else job.resolve(msg);
+        }
+      };
+      worker.onerror = (e) => {
+        jobs.forEach(job => job.reject(new Error(e.message || 'Import/export worker failed')));
+        jobs.clear();
+        worker = null;
+      };
+      return worker;
+    }
+
+    function runJob(message, handlers = {}){
+      return new Promise((resolve, reject) => {
+        const job = ++jobSeq;
+        jobs.set(job, { onRows: () => {}, onProgress: () => {}, ...handlers, resolve, reject });
+        ioWorker().postMessage({ ...message, job });
+      });
+    }
+
+    // ---------- import ----------
+
+    const prefixed = (name, type) => (TYPE_PREFIX[type] || 'org::') + name;
+
+    /**
+     * Turn parsed rows into graph ops, resolving names against the loaded graph.
+     * Rows naming a node or edge that already exists are counted as duplicates.
+     * @returns {{ops: Object[], nodes: Object[], edges: Object[], duplicates: number}}
+     */
+    function planImport(nodeRecs, edgeRecs){
+      const plannedNodes = new Map();   // id -> node fields
+      const plannedLabels = new Map();  // label -> id
+      const plannedEdges = new Set();
+      const edgeFields = [];
+      let duplicates = 0;
+
+      const existingId = label => {
+        const row = graphStore.findByLabel(label);
+        return row >= 0 ? graphStore.nodeId(row) : plannedLabels.get(label);
+      };
+      const planNode = (id, fields) => {
+        const node = { id, label: id.replace(/^(person|org|project)::/, ''), type: parseTypeFromId(id), origin: 'import', ...fields };
+        plannedNodes.set(id, node);
+        plannedLabels.set(node.label, id);
+        return id;
+      };
+
+      nodeRecs.forEach(rec => {
+        const label = rec.label || rec.id.replace(/^(person|org|project)::/, '');
+        const id = rec.id.includes('::') ? rec.id : prefixed(rec.id || label, rec.type);
+        if (graphStore.hasNode(id) || plannedNodes.has(id) || (!rec.id.includes('::') && existingId(label))) { duplicates++; return; }
+        const fields = { label };
+        ['url', 'notes', 'member', 'origin'].forEach(k => { if (rec[k]) fields[k] = rec[k]; });
+        if (rec.hidden) fields.hidden = true;
+        planNode(id, fields);
+      });
+
+      // An endpoint is an id ("org::Name"), or a label looked up in the graph and then this file
+      const endpoint = (ref, type) => {
+        if (ref.includes('::')) return graphStore.hasNode(ref) || plannedNodes.has(ref) ? ref : planNode(ref, {});
+        return existingId(ref) || planNode(prefixed(ref, type), { label: ref });
+      };
+
+      edgeRecs.forEach(rec => {
+        const from = endpoint(rec.source, rec.source_type);
+        const to = endpoint(rec.target, rec.target_type);
+        const relationship = rec.relationship || DEFAULT_RELATIONSHIP;
+        const key = `${from}|${to}|${relationship}`;
+        if (from === to || plannedEdges.has(key) || graphStore.findEdges(from, to, relationship).length) { duplicates++; return; }
+        plannedEdges.add(key);
+        const fields = { from, to, relationship };
+        ['role', 'url', 'notes'].forEach(k => { if (rec[k]) fields[k] = rec[k]; });
+        edgeFields.push(fields);
+      });
+
+      const nodeList = [...plannedNodes.values()];
+      const ops = [
+        ...nodeList.map(({ type, ...n }) => ({ type: 'node_add', node_type: type, ...n })),
+        ...edgeFields.map(e => ({ type: 'edge_add', ...e }))
+      ];
+      return { ops, nodes: nodeList, edges: edgeFields, duplicates };
+    }
+
+    // What a merge batch may do: redirect edges, create the parts of a split label, hide the merged node
+    const MERGE_OP_TYPES = ['node_add', 'edge_add', 'edge_remove', 'update_node'];
+
+    /**
+     * Apply merge batches written by tools/find_duplicates.py and queue their ops as one batch
+     * @param {{ops: Object[]}[]} merges
+     * @returns {number} batches applied
+     */
+    function applyMerges(merges){
+      const ops = merges.flatMap(m => (m.ops || []).filter(op => MERGE_OP_TYPES.includes(op.type)));
+      applyGraphOps(ops);
+      queueOps(ops);
+      return merges.length;
+    }
+
+    /**
+     * Import a CSV / JSON / JSON Lines file: parse in the worker, then add
+     * everything new to the graph and queue it as one batch of ops.
+     * A JSON file of merge batches ({merges: [...]}) is applied instead.
+     * @returns {Promise<{nodes: number, edges: number, duplicates: number, invalid: number, errors: string[], merged?: number}>}
+     */
+    async function importGraphFile(file){
+      const received = { nodes: [], edges: [], merges: [] };
+      const done = await runJob({ type: 'parse', file }, {
+        onRows: (kind, rows) => { for (const r of rows) received[kind].push(r); },
+        onProgress: ({ bytes, total }) => {
+          if (total) document.getElementById('importBtn').textContent = `⤒ ${Math.round(100 * bytes / total)}%`;
+        }
+      });
+      if (received.merges.length){
+        return { nodes: 0, edges: 0, duplicates: 0, invalid: 0, errors: [], merged: applyMerges(received.merges) };
+      }
+      const plan = planImport(received.nodes, received.edges);
+      const added = addGraphBatch(plan.nodes, plan.edges);
+      queueOps(plan.ops);
+      return { ...added, duplicates: done.stats.duplicates + plan.duplicates, invalid: done.stats.invalid, errors: done.stats.errors };
+    }
+
+    async function importWithFeedback(file){
+      const btn = document.getElementById('importBtn');
+      btn.disabled = true;
+      try {
+        const r = await importGraphFile(file);
+        if (r.merged !== undefined) { showToast(`Merged ${r.merged} duplicate(s) (not yet saved)`); return; }
+        if (r.errors.length) console.warn(`Import of ${file.name}: ${r.invalid} row(s) skipped`, r.errors);
+        const skipped = r.duplicates + r.invalid;
+        showToast(`Imported ${r.nodes} node(s), ${r.edges} edge(s)` + (skipped ? `, skipped ${skipped}` : '') + ' (not yet saved)');
+      } catch (err) {
+        console.error('Import error:', err);
+        showToast('Import failed: ' + err.message);
+      } finally {
+        btn.disabled = false;
+        btn.textContent = '⤒ Import';
+      }
+    }
+
+    // ---------- export ----------
+
+    /**
+     * Serialize the graph in the worker and download it
+     * @param {string} format - 'csv' (nodes and edges files), 'json' or 'graphml'
+     * @param {Object} [options] - {visibleOnly: only nodes drawn in the network, and edges between them}
+     * @returns {Promise<{name: string, blob: Blob}[]>} the downloaded files
+     */
+    async function exportGraph(format, options = {}){
+      let include = null;
+      if (options.visibleOnly){
+        include = new Uint8Array(graphStore.nodeCount);
+        nodes.get({ filter: n => !n.hidden && n.state !== 'ghost' }).forEach(n => { include[graphStore.nodeRow(n.id)] = 1; });
+      }
+      // Rows whose detail columns were never fetched would be exported blank
+      await ensureAllDetails();
+      const stamp = new Date().toISOString().slice(0, 10);
+      const done = await runJob({ type: 'export', format, snapshot: graphStore.snapshot(), include, name: `era-graph-${stamp}` });
+      done.files.forEach(download);
+      return done.files;
+    }
+
+    function download({ name, blob }){
+      const url = URL.createObjectURL(blob);
+      const a = document.createElement('a');
+      a.href = url;
+      a.download = name;
+      document.body.appendChild(a);
+      a.click();
+      a.remove();
+      setTimeout(() => URL.revokeObjectURL(url), 1000);
+    }
+
+    // ---------- wiring ----------
+
+    const importBtn = document.getElementById('importBtn');
+    const importFile = document.getElementById('importFile');
+    importBtn.onclick = () => importFile.click();
+    importFile.onchange = () => {
+      const file = importFile.files[0];
+      importFile.value = '';
+      if (file) importWithFeedback(file);
+    };
+
+    document.getElementById('exportBtn').onclick = async () => {
+      const format = document.getElementById('exportFormat').value;
+      try {
+        const files = await exportGraph(format, { visibleOnly: document.getElementById('exportVisible').checked });
+        showToast(`Exported ${files.map(f => f.name).join(', ')}`);
+      } catch (err) {
+        console.error('Export error:', err);
+        showToast('Export failed: ' + err.message);
+      }
+    };
+
+    const container = document.getElementById('network');
+    container.addEventListener('dragover', (e) => {
+      if ([...e.dataTransfer.types].includes('Files')) e.preventDefault();
+    });
+    container.addEventListener('drop', (e) => {
+      const file = e.dataTransfer.files[0];
+      if (!file) return;
+      e.preventDefault();
+      importWithFeedback(file);
+    });
+
+    // Expose for testing
+    window.importGraphFile = importGraphFile;
+    window.exportGraph = exportGraph;
+    window.planImport = planImport;
+    window.applyMerges = applyMerges;
+  })();
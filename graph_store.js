@@ -0,0 +1,711 @@
+  // Columnar graph store
+  // The source of truth for the loaded graph. Nodes and edges are rows in
+  // typed-array tables, every string (ids, labels, relationships, URLs,
+  // timestamps...) is interned once in a shared pool, and adjacency is a CSR
+  // index rebuilt lazily. Queries read the tables directly instead of cloning
+  // DataSet items; the vis DataSets hold only what rendering needs (see the
+  // projection functions at the end of this file).
+
+  const NODE_TYPES = ['organization', 'person', 'project'];
+  const NODE_HIDDEN = 1;
+  const EDGE_DELETED = 1;
+  // String columns, named as in the sheet
+  const NODE_STRING_COLUMNS = ['id', 'label', 'url', 'notes', 'member', 'origin', 'created_at', 'updated_at', 'cand_rows'];
+  const EDGE_STRING_COLUMNS = ['relationship', 'role', 'url', 'notes', 'created_at', 'updated_at'];
+  const CSR_TAIL_MAX = 1024;  // edges added since the last CSR build before it is rebuilt
+  // Provenance: bit k of a row's source mask is set when sheet k of the load
+  // holds it, and of its private mask when that sheet marks it private. Bit 0
+  // is the primary sheet (the one edits are saved to); rows added here belong to it.
+  const SOURCE_PRIMARY = 1;
+
+  class StringPool {
+    constructor(strings){
+      this.strings = strings ? strings.slice() : [''];
+      this.ids = new Map(this.strings.map((s, i) => [s, i]));
+      this.lower = [];  // lower-cased copies, filled on demand
+    }
+    intern(s){
+      s = s == null ? '' : String(s);
+      let id = this.ids.get(s);
+      if (id === undefined){
+        id = this.strings.length;
+        this.strings.push(s);
+        this.ids.set(s, id);
+      }
+      return id;
+    }
+    get(id){ return this.strings[id]; }
+    lowerCase(id){
+      let s = this.lower[id];
+      if (s === undefined) s = this.lower[id] = this.strings[id].toLowerCase();
+      return s;
+    }
+  }
+
+  function grown(array, capacity){
+    const next = new array.constructor(capacity);
+    next.set(array);
+    return next;
+  }
+
+  class GraphStore {
+    constructor(){ this.reset(); }
+
+    reset(capacity = 1024){
+      this.strings = new StringPool();
+      this.nodeCount = 0;
+      this.edgeCount = 0;
+      this.nodeCapacity = capacity;
+      this.edgeCapacity = capacity;
+      this.nodeCols = {};
+      NODE_STRING_COLUMNS.forEach(c => { this.nodeCols[c] = new Int32Array(capacity); });
+      this.nodeType = new Uint8Array(capacity);
+      this.nodeFlags = new Uint8Array(capacity);
+      this.nodeSource = new Uint8Array(capacity);
+      this.nodePrivate = new Uint8Array(capacity);
+      this.edgeSrc = new Int32Array(capacity);
+      this.edgeDst = new Int32Array(capacity);
+      this.edgeCols = {};
+      EDGE_STRING_COLUMNS.forEach(c => { this.edgeCols[c] = new Int32Array(capacity); });
+      this.edgeFlags = new Uint8Array(capacity);
+      this.edgeSource = new Uint8Array(capacity);
+      this.edgePrivate = new Uint8Array(capacity);
+      this.rowOf = new Map();       // node id -> row
+      this.labelRow = new Map();    // trimmed label -> first row with it
+      this.csr = null;              // {offsets, edges, built}: incident edge rows per node
+    }
+
+    // ---------- nodes ----------
+
+    _growNodes(){
+      const cap = this.nodeCapacity * 2;
+      NODE_STRING_COLUMNS.forEach(c => { this.nodeCols[c] = grown(this.nodeCols[c], cap); });
+      this.nodeType = grown(this.nodeType, cap);
+      this.nodeFlags = grown(this.nodeFlags, cap);
+      this.nodeSource = grown(this.nodeSource, cap);
+      this.nodePrivate = grown(this.nodePrivate, cap);
+      this.nodeCapacity = cap;
+    }
+
+    _setNodeFields(row, fields){
+      NODE_STRING_COLUMNS.forEach(c => {
+        if (c in fields && c !== 'id') this.nodeCols[c][row] = this.strings.intern(fields[c]);
+      });
+      if ('type' in fields) this.nodeType[row] = Math.max(0, NODE_TYPES.indexOf(fields.type));
+      if ('hidden' in fields){
+        if (fields.hidden) this.nodeFlags[row] |= NODE_HIDDEN;
+        else this.nodeFlags[row] &= ~NODE_HIDDEN;
+      }
+      if ('private' in fields) this.nodePrivate[row] = fields.private ? SOURCE_PRIMARY : 0;
+    }
+
+    _indexLabel(row){
+      const label = this.nodeLabel(row).trim();
+      if (!this.labelRow.has(label)) this.labelRow.set(label, row);
+    }
+
+    /** Add a node (or update it if the id exists); fields use the sheet's names */
+    addNode(fields){
+      const existing = this.rowOf.get(fields.id);
+      if (existing !== undefined){
+        this.updateNode(fields.id, fields);
+        return existing;
+      }
+      if (this.nodeCount === this.nodeCapacity) this._growNodes();
+      const row = this.nodeCount++;
+      this.nodeCols.id[row] = this.strings.intern(fields.id);
+      this.nodeSource[row] = SOURCE_PRIMARY;
+      this._setNodeFields(row, fields);
+      this.rowOf.set(fields.id, row);
+      this._indexLabel(row);
+      return row;
+    }
+
+    updateNode(id, fields){
+      const row = this.rowOf.get(id);
+      if (row === undefined) return -1;
+      const oldLabel = 'label' in fields ? this.nodeLabel(row).trim() : null;
+      this._setNodeFields(row, fields);
+      if (oldLabel !== null && oldLabel !== this.nodeLabel(row).trim()){
+        if (this.labelRow.get(oldLabel) === row){
+          this.labelRow.delete(oldLabel);
+          const other = this.findRows(r => r !== row && this.nodeLabel(r).trim() === oldLabel, 1)[0];
+          if (other !== undefined) this.labelRow.set(oldLabel, other);
+        }
+        this._indexLabel(row);
+      }
+      return row;
+    }
+
+    nodeRow(id){ const row = this.rowOf.get(id); return row === undefined ? -1 : row; }
+    hasNode(id){ return this.rowOf.has(id); }
+    nodeId(row){ return this.strings.get(this.nodeCols.id[row]); }
+    nodeLabel(row){ return this.strings.get(this.nodeCols.label[row]); }
+    nodeTypeName(row){ return NODE_TYPES[this.nodeType[row]]; }
+    nodeField(row, column){ return this.strings.get(this.nodeCols[column][row]); }
+    isHidden(row){ return (this.nodeFlags[row] & NODE_HIDDEN) !== 0; }
+
+    /** A node as a plain object with the sheet's field names, or null */
+    node(id){
+      const row = this.rowOf.get(id);
+      if (row === undefined) return null;
+      const n = { type: this.nodeTypeName(row), hidden: this.isHidden(row) };
+      NODE_STRING_COLUMNS.forEach(c => { n[c] = this.nodeField(row, c); });
+      return n;
+    }
+
+    /** Row of the node whose trimmed label matches exactly, or -1 */
+    findByLabel(label){
+      const row = this.labelRow.get(String(label).trim());
+      return row === undefined ? -1 : row;
+    }
+
+    /** Rows for which test(row) holds, up to limit */
+    findRows(test, limit = Infinity){
+      const rows = [];
+      for (let r = 0; r < this.nodeCount && rows.length < limit; r++){
+        if (test(r)) rows.push(r);
+      }
+      return rows;
+    }
+
+    /** A node's label, lower-cased (cached per distinct label) */
+    lowerLabel(row){ return this.strings.lowerCase(this.nodeCols.label[row]); }
+
+    /** Whether a node's label contains a lower-case query */
+    labelIncludes(row, query){ return this.lowerLabel(row).includes(query); }
+
+    // ---------- edges ----------
+
+    _growEdges(){
+      const cap = this.edgeCapacity * 2;
+      this.edgeSrc = grown(this.edgeSrc, cap);
+      this.edgeDst = grown(this.edgeDst, cap);
+      EDGE_STRING_COLUMNS.forEach(c => { this.edgeCols[c] = grown(this.edgeCols[c], cap); });
+      this.edgeFlags = grown(this.edgeFlags, cap);
+      this.edgeSource = grown(this.edgeSource, cap);
+      this.edgePrivate = grown(this.edgePrivate, cap);
+      this.edgeCapacity = cap;
+    }
+
+    /** Add an edge between two existing nodes; returns its row (its vis id) */
+    addEdge(fromId, toId, fields){
+      const src = this.rowOf.get(fromId), dst = this.rowOf.get(toId);
+      if (src === undefined || dst === undefined) throw new Error(`Edge ${fromId} -> ${toId}: unknown node`);
+      if (this.edgeCount === this.edgeCapacity) this._growEdges();
+      const row = this.edgeCount++;
+      this.edgeSrc[row] = src;
+      this.edgeDst[row] = dst;
+      this.edgeSource[row] = SOURCE_PRIMARY;
+      this.updateEdge(row, fields);
+      return row;
+    }
+
+    updateEdge(row, fields){
+      EDGE_STRING_COLUMNS.forEach(c => {
+        if (c in fields) this.edgeCols[c][row] = this.strings.intern(fields[c]);
+      });
+      if ('private' in fields) this.edgePrivate[row] = fields.private ? SOURCE_PRIMARY : 0;
+    }
+
+    removeEdge(row){ this.edgeFlags[row] |= EDGE_DELETED; }
+    edgeLive(row){ return row >= 0 && row < this.edgeCount && (this.edgeFlags[row] & EDGE_DELETED) === 0; }
+    edgeFrom(row){ return this.nodeId(this.edgeSrc[row]); }
+    edgeTo(row){ return this.nodeId(this.edgeDst[row]); }
+    edgeRelationship(row){ return this.strings.get(this.edgeCols.relationship[row]); }
+    edgeField(row, column){ return this.strings.get(this.edgeCols[column][row]); }
+
+    /** An edge as a plain object ({id, from, to, relationship, role, ...}), or null */
+    edge(row){
+      if (!this.edgeLive(row)) return null;
+      const e = { id: row, from: this.edgeFrom(row), to: this.edgeTo(row) };
+      EDGE_STRING_COLUMNS.forEach(c => { e[c] = this.edgeField(row, c); });
+      return e;
+    }
+
+    /** Rows of every live edge */
+    edgeRows(){
+      const rows = [];
+      for (let r = 0; r < this.edgeCount; r++) if (this.edgeLive(r)) rows.push(r);
+      return rows;
+    }
+
+    // ---------- adjacency ----------
+
+    // CSR over the edges present at build time; later edges are scanned as a short tail
+    _adjacency(){
+      if (this.csr && this.edgeCount - this.csr.built <= CSR_TAIL_MAX) return this.csr;
+      const n = this.nodeCount, m = this.edgeCount;
+      const offsets = new Int32Array(n + 1);
+      for (let e = 0; e < m; e++){ offsets[this.edgeSrc[e] + 1]++; offsets[this.edgeDst[e] + 1]++; }
+      for (let i = 0; i < n; i++) offsets[i + 1] += offsets[i];
+      const fill = offsets.slice(0, n);
+      const incident = new Int32Array(2 * m);
+      for (let e = 0; e < m; e++){
+        incident[fill[this.edgeSrc[e]]++] = e;
+        incident[fill[this.edgeDst[e]]++] = e;
+      }
+      this.csr = { offsets, edges: incident, built: m, nodes: n };
+      return this.csr;
+    }
+
+    /** Live edge rows touching a node row */
+    incidentRows(row){
+      const csr = this._adjacency();
+      const rows = [];
+      if (row < csr.nodes){
+        for (let i = csr.offsets[row]; i < csr.offsets[row + 1]; i++){
+          const e = csr.edges[i];
+          // a self-loop is listed twice
+          if (this.edgeLive(e) && rows[rows.length - 1] !== e) rows.push(e);
+        }
+      }
+      for (let e = csr.built; e < this.edgeCount; e++){
+        if ((this.edgeSrc[e] === row || this.edgeDst[e] === row) && this.edgeLive(e)) rows.push(e);
+      }
+      return rows;
+    }
+
+    incidentEdges(id){
+      const row = this.rowOf.get(id);
+      return row === undefined ? [] : this.incidentRows(row);
+    }
+
+    degree(row){ return this.incidentRows(row).length; }
+
+    /** The node row at the other end of an edge */
+    otherEnd(edgeRow, nodeRow){
+      return this.edgeSrc[edgeRow] === nodeRow ? this.edgeDst[edgeRow] : this.edgeSrc[edgeRow];
+    }
+
+    /** Ids of the nodes sharing an edge with a node */
+    neighbours(id){
+      const row = this.rowOf.get(id);
+      if (row === undefined) return [];
+      return this.incidentRows(row).map(e => this.nodeId(this.otherEnd(e, row)));
+    }
+
+    /**
+     * Live edge rows between two nodes with a relationship
+     * @param {boolean} [undirected] - also match to -> from
+     */
+    findEdges(fromId, toId, relationship, undirected = false){
+      const src = this.rowOf.get(fromId), dst = this.rowOf.get(toId);
+      if (src === undefined || dst === undefined) return [];
+      const rel = this.strings.ids.get(relationship == null ? '' : String(relationship));
+      if (rel === undefined) return [];
+      return this.incidentRows(src).filter(e => this.edgeCols.relationship[e] === rel &&
+        ((this.edgeSrc[e] === src && this.edgeDst[e] === dst) ||
+         (undirected && this.edgeSrc[e] === dst && this.edgeDst[e] === src)));
+    }
+
+    /**
+     * Node ids reachable from some start ids
+     * @param {string[]} ids
+     * @param {function} [include] - row filter; excluded rows are neither visited nor crossed
+     * @returns {Set<string>}
+     */
+    component(ids, include){
+      const seen = new Uint8Array(this.nodeCount);
+      const queue = new Int32Array(this.nodeCount);
+      let head = 0, tail = 0;
+      ids.forEach(id => {
+        const row = this.rowOf.get(id);
+        if (row !== undefined && !seen[row] && (!include || include(row))){ seen[row] = 1; queue[tail++] = row; }
+      });
+      const result = new Set();
+      while (head < tail){
+        const row = queue[head++];
+        result.add(this.nodeId(row));
+        this.incidentRows(row).forEach(e => {
+          const other = this.otherEnd(e, row);
+          if (!seen[other] && (!include || include(other))){ seen[other] = 1; queue[tail++] = other; }
+        });
+      }
+      return result;
+    }
+
+    // ---------- transfer ----------
+
+    /**
+     * Compact copy of the tables (structured-clone friendly, for other tabs and
+     * workers), with the adjacency index if it covers every edge
+     */
+    snapshot(){
+      const n = this.nodeCount, m = this.edgeCount;
+      const cut = (cols, count) => Object.fromEntries(Object.entries(cols).map(([c, a]) => [c, a.slice(0, count)]));
+      const csr = this.csr && this.csr.built === m && this.csr.nodes === n ? this.csr : null;
+      return {
+        strings: this.strings.strings.slice(),
+        nodeCount: n, edgeCount: m,
+        nodeCols: cut(this.nodeCols, n), nodeType: this.nodeType.slice(0, n), nodeFlags: this.nodeFlags.slice(0, n),
+        nodeSource: this.nodeSource.slice(0, n), nodePrivate: this.nodePrivate.slice(0, n),
+        edgeSrc: this.edgeSrc.slice(0, m), edgeDst: this.edgeDst.slice(0, m),
+        edgeCols: cut(this.edgeCols, m), edgeFlags: this.edgeFlags.slice(0, m),
+        edgeSource: this.edgeSource.slice(0, m), edgePrivate: this.edgePrivate.slice(0, m),
+        csr: csr && { offsets: csr.offsets.slice(), edges: csr.edges.slice() }
+      };
+    }
+
+    restore(snap){
+      this.reset(Math.max(1024, snap.nodeCount, snap.edgeCount));
+      this.strings = new StringPool(snap.strings);
+      this.nodeCount = snap.nodeCount;
+      this.edgeCount = snap.edgeCount;
+      NODE_STRING_COLUMNS.forEach(c => this.nodeCols[c].set(snap.nodeCols[c]));
+      this.nodeType.set(snap.nodeType);
+      this.nodeFlags.set(snap.nodeFlags);
+      this.nodeSource.fill(SOURCE_PRIMARY, 0, snap.nodeCount);
+      if (snap.nodeSource) this.nodeSource.set(snap.nodeSource);
+      if (snap.nodePrivate) this.nodePrivate.set(snap.nodePrivate);
+      this.edgeSrc.set(snap.edgeSrc);
+      this.edgeDst.set(snap.edgeDst);
+      EDGE_STRING_COLUMNS.forEach(c => this.edgeCols[c].set(snap.edgeCols[c]));
+      this.edgeFlags.set(snap.edgeFlags);
+      this.edgeSource.fill(SOURCE_PRIMARY, 0, snap.edgeCount);
+      if (snap.edgeSource) this.edgeSource.set(snap.edgeSource);
+      if (snap.edgePrivate) this.edgePrivate.set(snap.edgePrivate);
+      for (let r = 0; r < this.nodeCount; r++){
+        this.rowOf.set(this.nodeId(r), r);
+        this._indexLabel(r);
+      }
+      if (snap.csr) this.csr = { offsets: snap.csr.offsets, edges: snap.csr.edges, built: snap.edgeCount, nodes: snap.nodeCount };
+    }
+
+    // ---------- merging sheets ----------
+
+    /**
+     * Merge another sheet's store in as source bit `bit`: nodes with the same
+     * id and edges with the same (from, to, relationship) gain the bit and keep
+     * their fields; the rest are added with only that bit
+     */
+    mergeFrom(other, bit){
+      for (let r = 0; r < other.nodeCount; r++){
+        const id = other.nodeId(r);
+        let row = this.rowOf.get(id);
+        if (row === undefined){
+          row = this.addNode(other.node(id));
+          this.nodeSource[row] = 0;
+          this.nodePrivate[row] = 0;
+        }
+        this.nodeSource[row] |= bit;
+        if (other.nodePrivate[r]) this.nodePrivate[row] |= bit;
+      }
+      other.edgeRows().forEach(e => {
+        const from = other.edgeFrom(e), to = other.edgeTo(e);
+        let row = this.findEdges(from, to, other.edgeRelationship(e))[0];
+        if (row === undefined){
+          row = this.addEdge(from, to, other.edge(e));
+          this.edgeSource[row] = 0;
+          this.edgePrivate[row] = 0;
+        }
+        this.edgeSource[row] |= bit;
+        if (other.edgePrivate[e]) this.edgePrivate[row] |= bit;
+      });
+    }
+  }
+
+  const graphStore = new GraphStore();
+
+  // ---------- projection into the vis DataSets ----------
+  // A node is drawn when it is in the current view and not curated-hidden; a
+  // hidden node is "pinned" into the network while its curation modal is open.
+  // An edge is drawn when it is in the view and both of its ends are drawn. vis
+  // items carry only id, label, group/state, hidden and value (edges: id, from,
+  // to, label); everything else stays in the store.
+
+  const pinnedNodes = new Set();
+
+  // The view: rows from these sheets (source bits), leaving out rows only
+  // they mark private unless showPrivate. The default shows every sheet's public rows.
+  const graphView = { sheets: 0xff, showPrivate: false };
+
+  const inView = (source, priv) => (source & graphView.sheets & ~(graphView.showPrivate ? 0 : priv)) !== 0;
+  const nodeInView = row => inView(graphStore.nodeSource[row], graphStore.nodePrivate[row]);
+  const edgeInView = row => inView(graphStore.edgeSource[row], graphStore.edgePrivate[row]);
+
+  // vis edge ids are store rows offset by one (vis treats a 0 id as missing)
+  const visEdgeId = row => row + 1;
+  const edgeRowOf = id => id - 1;
+
+  function isProjected(row){
+    return nodeInView(row) && (!graphStore.isHidden(row) || pinnedNodes.has(graphStore.nodeId(row)));
+  }
+
+  // Degree counting only the edges in the view
+  const viewDegree = row => graphStore.incidentRows(row).filter(edgeInView).length;
+
+  function visNodeFor(row){
+    const label = graphStore.nodeLabel(row);
+    const healed = graphStore.nodeField(row, 'origin') === 'auto-healed';
+    return {
+      id: graphStore.nodeId(row),
+      label,
+      title: healed ? `${label}\n(auto-created from edge reference)` : label,
+      group: nodeGroup(graphStore.nodeTypeName(row)),
+      state: '',
+      hidden: graphStore.isHidden(row),
+      value: Math.max(1, viewDegree(row))
+    };
+  }
+
+  function visEdgeFor(row){
+    return { id: visEdgeId(row), from: graphStore.edgeFrom(row), to: graphStore.edgeTo(row), label: graphStore.edgeRelationship(row) };
+  }
+
+  function edgeProjected(row){
+    return graphStore.edgeLive(row) && edgeInView(row) && isProjected(graphStore.edgeSrc[row]) && isProjected(graphStore.edgeDst[row]);
+  }
+
+  /**
+   * Rebuild both DataSets from the store
+   * @param {Object} [extras] - per node id, vis properties to add (positions {x, y}, value).
+   *   Without them the nodes start from seedLayout() (layout.js).
+   */
+  function projectGraph(extras){
+    const rows = graphStore.findRows(isProjected);
+    const drawnEdges = graphStore.edgeRows().filter(edgeProjected);
+    if (!extras) extras = seedLayout(graphStore, rows, drawnEdges);
+    const visNodes = rows.map(r => {
+      const n = visNodeFor(r);
+      const extra = extras[n.id];
+      return extra ? { ...n, ...extra } : n;
+    });
+    nodes.clear();
+    edges.clear();
+    nodes.add(visNodes);
+    edges.add(drawnEdges.map(visEdgeFor));
+  }
+
+  // Put a node (and its edges to drawn nodes) into the network, or take it out
+  function projectNode(row, extra){
+    if (nodes.get(graphStore.nodeId(row))) return;
+    nodes.add({ ...visNodeFor(row), ...extra });
+    const back = graphStore.incidentRows(row).filter(e => edgeProjected(e) && !edges.get(visEdgeId(e)));
+    if (back.length) edges.add(back.map(visEdgeFor));
+  }
+
+  function unprojectNode(row){
+    edges.remove(graphStore.incidentRows(row).map(visEdgeId));
+    nodes.remove(graphStore.nodeId(row));
+  }
+
+  /**
+   * Switch the view (see graphView). Only the difference is applied: items
+   * leaving the view are removed from the DataSets, items entering it added,
+   * and nodes that stay keep their positions, resized to their degree in the view.
+   * @param {number} sheets - source bits of the sheets to show
+   * @param {boolean} showPrivate - include rows those sheets mark private
+   */
+  function setGraphView(sheets, showPrivate){
+    graphView.sheets = sheets;
+    graphView.showPrivate = showPrivate;
+    const drawnNodes = new Set(nodes.getIds());
+    const drawnEdges = new Set(edges.getIds());
+    const addNodes = [], removeNodes = [], resize = [];
+    for (let r = 0; r < graphStore.nodeCount; r++){
+      const id = graphStore.nodeId(r);
+      if (!isProjected(r)){ if (drawnNodes.has(id)) removeNodes.push(id); }
+      else if (drawnNodes.has(id)) resize.push({ id, value: Math.max(1, viewDegree(r)) });
+      else addNodes.push(visNodeFor(r));
+    }
+    const wanted = graphStore.edgeRows().filter(edgeProjected);
+    const wantedIds = new Set(wanted.map(visEdgeId));
+    edges.remove([...drawnEdges].filter(id => !wantedIds.has(id)));
+    nodes.remove(removeNodes);
+    if (resize.length) nodes.update(resize);
+    if (addNodes.length) nodes.add(addNodes);
+    const addEdges = wanted.filter(r => !drawnEdges.has(visEdgeId(r))).map(visEdgeFor);
+    if (addEdges.length) edges.add(addEdges);
+  }
+
+  // A new edge is saved to the primary sheet, and so are its ends unless a sheet marks them private
+  function publishEndpoints(row){
+    [graphStore.edgeSrc[row], graphStore.edgeDst[row]].forEach(n => {
+      if (!graphStore.nodePrivate[n]) graphStore.nodeSource[n] |= SOURCE_PRIMARY;
+    });
+  }
+
+  /**
+   * Add a node to the graph (drawn unless hidden)
+   * @param {Object} fields - sheet-named fields; id and label required
+   * @param {Object} [extra] - vis-only properties such as an initial x/y
+   */
+  function addGraphNode(fields, extra){
+    const row = graphStore.addNode({ type: parseTypeFromId(fields.id), ...fields });
+    if (isProjected(row)) projectNode(row, extra);
+    return row;
+  }
+
+  /** Update a node's fields and keep its drawn form in step */
+  function updateGraphNode(id, fields){
+    const row = graphStore.updateNode(id, fields);
+    if (row < 0) return;
+    const drawn = nodes.get(id);
+    if (!isProjected(row)){
+      if (drawn) unprojectNode(row);
+      return;
+    }
+    if (!drawn) { projectNode(row); return; }
+    if ('label' in fields || 'type' in fields || 'hidden' in fields){
+      const label = graphStore.nodeLabel(row);
+      nodes.update({ id, label, title: label, hidden: graphStore.isHidden(row), group: nodeGroup(graphStore.nodeTypeName(row), drawn.state) });
+    }
+  }
+
+  /** Make sure a node exists, creating a placeholder for an unknown id */
+  function ensureGraphNode(id){
+    if (!graphStore.hasNode(id)) addGraphNode(healedNodePayload(id));
+  }
+
+  function addGraphEdge(fromId, toId, relationship, fields){
+    const row = graphStore.addEdge(fromId, toId, { ...fields, relationship });
+    publishEndpoints(row);
+    if (edgeProjected(row)) edges.add(visEdgeFor(row));
+    return row;
+  }
+
+  function removeGraphEdges(rows){
+    rows.forEach(row => graphStore.removeEdge(row));
+    edges.remove(rows.map(visEdgeId));
+  }
+
+  function updateGraphEdge(row, fields){
+    graphStore.updateEdge(row, fields);
+    if ('relationship' in fields && edges.get(visEdgeId(row))) edges.update({ id: visEdgeId(row), label: graphStore.edgeRelationship(row) });
+  }
+
+  /**
+   * Add many nodes and edges with one DataSet add per set (one 'add' event,
+   * one redraw) instead of one per item. Ids already present and edges that
+   * already exist are skipped; unknown edge endpoints get placeholders.
+   * @param {Object[]} nodeFields - as for addGraphNode
+   * @param {Object[]} edgeFields - {from, to, relationship, ...sheet-named fields}
+   * @returns {{nodes: number, edges: number}} how many were added
+   */
+  function addGraphBatch(nodeFields, edgeFields){
+    const nodeRows = [], edgeRows = [];
+    const addNode = fields => nodeRows.push(graphStore.addNode({ type: parseTypeFromId(fields.id), ...fields }));
+    nodeFields.forEach(f => { if (!graphStore.hasNode(f.id)) addNode(f); });
+    edgeFields.forEach(({ from, to, ...fields }) => {
+      [from, to].forEach(id => { if (!graphStore.hasNode(id)) addNode(healedNodePayload(id)); });
+      if (!graphStore.findEdges(from, to, fields.relationship).length) edgeRows.push(graphStore.addEdge(from, to, fields));
+    });
+    edgeRows.forEach(publishEndpoints);
+    const drawnNodes = nodeRows.filter(isProjected).map(r => visNodeFor(r));
+    const drawnEdges = edgeRows.filter(edgeProjected).map(visEdgeFor);
+    if (drawnNodes.length) nodes.add(drawnNodes);
+    if (drawnEdges.length) edges.add(drawnEdges);
+    return { nodes: nodeRows.length, edges: edgeRows.length };
+  }
+
+  const NODE_OP_FIELDS = ['label', 'url', 'notes', 'member', 'origin'];
+  const EDGE_OP_FIELDS = ['role', 'url', 'notes'];
+  const pick = (op, names) => Object.fromEntries(names.filter(n => n in op).map(n => [n, op[n]]));
+
+  /** Sheet-named node fields carried by a node_add op */
+  function nodeOpFields(op){
+    const fields = { id: op.id, ...pick(op, NODE_OP_FIELDS) };
+    if (op.node_type) fields.type = op.node_type;
+    if (op.hidden) fields.hidden = true;
+    return fields;
+  }
+
+  /** Apply a queued op (see queueOp in graph.js) to the graph, e.g. one made in another tab */
+  function applyGraphOp(op){
+    if (op.type === 'node_add'){
+      if (!graphStore.hasNode(op.id)) addGraphNode(nodeOpFields(op));
+    } else if (op.type === 'edge_add'){
+      ensureGraphNode(op.from); ensureGraphNode(op.to);
+      if (!graphStore.findEdges(op.from, op.to, op.relationship).length){
+        addGraphEdge(op.from, op.to, op.relationship, pick(op, EDGE_OP_FIELDS));
+      }
+    } else if (op.type === 'edge_remove'){
+      removeGraphEdges(graphStore.findEdges(op.from, op.to, op.relationship));
+    } else if (op.type === 'edge_update'){
+      const row = graphStore.findEdges(op.from, op.to, op.old_relationship)[0];
+      if (row !== undefined) updateGraphEdge(row, { relationship: op.new_relationship });
+    } else if (op.type === 'update_node'){
+      const fields = {};
+      if ('hidden' in op) fields.hidden = op.hidden;
+      if ('url' in op) fields.url = op.url;
+      if (op.node_type) fields.type = op.node_type;
+      updateGraphNode(op.id, fields);
+    }
+  }
+
+  /** Apply a batch of queued ops; runs of node/edge adds go through addGraphBatch */
+  function applyGraphOps(ops){
+    let adds = { nodes: [], edges: [] };
+    const flush = () => {
+      if (adds.nodes.length || adds.edges.length) addGraphBatch(adds.nodes, adds.edges);
+      adds = { nodes: [], edges: [] };
+    };
+    ops.forEach(op => {
+      if (op.type === 'node_add') adds.nodes.push(nodeOpFields(op));
+      else if (op.type === 'edge_add') adds.edges.push({ from: op.from, to: op.to, relationship: op.relationship, ...pick(op, EDGE_OP_FIELDS) });
+      else { flush(); applyGraphOp(op); }
+    });
+    flush();
+  }
+
+  // ---------- curated-hidden nodes ----------
+
+  // Nodes kept out of the network, for lookups that used to read the DataSets
+  const hiddenNodes = {
+    has(id) { const row = graphStore.nodeRow(id); return row >= 0 && !isProjected(row); },
+    get(id) { return this.has(id) ? graphStore.node(id) : undefined; }
+  };
+
+  /**
+   * Bring a node into the network while something (the curation modal) works
+   * on it, even if it is flagged hidden
+   * @returns {Object|null} the node's fields, or null if it is unknown
+   */
+  function revealNode(id) {
+    const row = graphStore.nodeRow(id);
+    if (row < 0) return null;
+    pinnedNodes.add(id);
+    projectNode(row);
+    return graphStore.node(id);
+  }
+
+  /**
+   * Release a revealed node; one still flagged hidden leaves the network
+   * @returns {boolean} whether the node was taken out
+   */
+  function stashHiddenNode(id) {
+    pinnedNodes.delete(id);
+    const row = graphStore.nodeRow(id);
+    if (row < 0 || isProjected(row) || !nodes.get(id)) return false;
+    unprojectNode(row);
+    return true;
+  }
+
+  /** Edges of a node whose other end is kept out of the network */
+  function hiddenEdgesOf(id) {
+    const row = graphStore.nodeRow(id);
+    if (row < 0) return [];
+    return graphStore.incidentRows(row)
+      .filter(e => !isProjected(graphStore.otherEnd(e, row)))
+      .map(e => graphStore.edge(e));
+  }
+
+  /** Hidden node with this exact (trimmed) label, if any */
+  function hiddenNodeByLabel(label) {
+    const row = graphStore.findByLabel(label);
+    return row >= 0 && !isProjected(row) ? graphStore.node(graphStore.nodeId(row)) : null;
+  }
+
+  // Rows the primary sheet holds (or will, once saved); other sheets' rows are never written to it
+  const primaryNode = row => (graphStore.nodeSource[row] & SOURCE_PRIMARY) !== 0;
+  const primaryEdge = row => (graphStore.edgeSource[row] & SOURCE_PRIMARY) !== 0 &&
+    primaryNode(graphStore.edgeSrc[row]) && primaryNode(graphStore.edgeDst[row]);
+
+  /** Every node/edge of the primary sheet, in the form the sheet is written from */
+  function allNodes() {
+    const all = [];
+    for (let r = 0; r < graphStore.nodeCount; r++) if (primaryNode(r)) all.push(graphStore.node(graphStore.nodeId(r)));
+    return all;
+  }
+  function allEdges() { return graphStore.edgeRows().filter(primaryEdge).map(r => graphStore.edge(r)); }
@@ -0,0 +1,320 @@
+  // Bulk import/export worker (started by graph_io.js)
+  // Parses dropped CSV / JSON / JSON Lines files as they stream in and posts
+  // normalized rows back in chunks; serializes a graph store snapshot to CSV,
+  // JSON or GraphML as Blob parts, so no whole-file string is ever built.
+  //
+  // Messages in:  {job, type: 'parse', file}
+  //               {job, type: 'export', format, snapshot, include, name}
+  // Messages out: {job, type: 'rows', kind: 'nodes'|'edges'|'merges', rows}
+  //               {job, type: 'progress', bytes, total}
+  //               {job, type: 'done', stats | files}
+  //               {job, type: 'error', message}
+
+  const ROWS_PER_MESSAGE = 2000;
+  const ROWS_PER_PART = 1000;
+  const MAX_REPORTED_ERRORS = 20;
+
+  const NODE_EXPORT_COLUMNS = ['id', 'label', 'type', 'url', 'notes', 'member', 'origin', 'hidden', 'created_at', 'updated_at'];
+  const EDGE_EXPORT_COLUMNS = ['source', 'target', 'relationship', 'role', 'url', 'notes', 'created_at', 'updated_at'];
+
+  // ---------- parsing ----------
+
+  /** Incremental CSV parser (RFC 4180 quoting; fields may span chunks and lines) */
+  function csvParser(onRow){
+    let field = '', row = [], inQuotes = false, quoteSeen = false;
+    const endRow = () => {
+      row.push(field);
+      field = '';
+      // Skip blank lines
+      if (row.length > 1 || row[0] !== '') onRow(row);
+      row = [];
+    };
+    return {
+      push(text){
+        for (let i = 0; i < text.length; i++){
+          const c = text[i];
+          if (inQuotes){
+            if (c === '"'){ inQuotes = false; quoteSeen = true; }
+            else field += c;
+            continue;
+          }
+          if (quoteSeen){
+            quoteSeen = false;
+            // "" inside a quoted field is a literal quote
+            if (c === '"'){ field += '"'; inQuotes = true; continue; }
+          }
+          if (c === '"' && field === '') inQuotes = true;
+          else if (c === ',') { row.push(field); field = ''; }
+          else if (c === '\n') endRow();
+          else if (c !== '\r') field += c;
+        }
+      },
+      end(){
+        if (field !== '' || row.length) endRow();
+      }
+    };
+  }
+
+  const truthy = v => ['true', '1', 'yes', 'y'].includes(String(v == null ? '' : v).trim().toLowerCase());
+  const text = v => (v == null ? '' : String(v)).trim();
+
+  /** 'nodes' or 'edges' for a set of (lower-cased) column names, or null */
+  function kindOf(keys){
+    const has = k => keys.includes(k);
+    if ((has('source') && has('target')) || (has('from') && has('to'))) return 'edges';
+    if (has('id') || has('label') || has('name')) return 'nodes';
+    return null;
+  }
+
+  function nodeRecord(r){
+    return {
+      id: text(r.id), label: text(r.label || r.name), type: text(r.type || r.node_type).toLowerCase(),
+      url: text(r.url), notes: text(r.notes), member: text(r.member), origin: text(r.origin), hidden: truthy(r.hidden)
+    };
+  }
+
+  function edgeRecord(r){
+    return {
+      source: text(r.source || r.from), target: text(r.target || r.to),
+      source_type: text(r.source_type || r.from_type).toLowerCase(), target_type: text(r.target_type || r.to_type).toLowerCase(),
+      relationship: text(r.relationship || r.rel || r.label),
+      role: text(r.role), url: text(r.url), notes: text(r.notes)
+    };
+  }
+
+  /**
+   * Validates and dedupes records within the file and posts them in chunks.
+   * Dedupe against the loaded graph happens on the main thread (graph_io.js).
+   */
+  function rowSink(job){
+    const buffers = { nodes: [], edges: [] };
+    const seen = { nodes: new Set(), edges: new Set() };
+    const stats = { nodes: 0, edges: 0, duplicates: 0, invalid: 0, errors: [] };
+    const problem = (where, message) => {
+      stats.invalid++;
+      if (stats.errors.length < MAX_REPORTED_ERRORS) stats.errors.push(`${where}: ${message}`);
+    };
+    const flush = kind => {
+      if (!buffers[kind].length) return;
+      postMessage({ job, type: 'rows', kind, rows: buffers[kind] });
+      buffers[kind] = [];
+    };
+    return {
+      stats,
+      add(kind, raw, where){
+        const rec = kind === 'nodes' ? nodeRecord(raw) : edgeRecord(raw);
+        let key;
+        if (kind === 'nodes'){
+          if (!rec.id && !rec.label) return problem(where, 'node without id or label');
+          key = (rec.id || rec.label).toLowerCase();
+        } else {
+          if (!rec.source || !rec.target) return problem(where, 'edge without source and target');
+          if (rec.source === rec.target) return problem(where, `self-loop on ${rec.source}`);
+          key = `${rec.source}|${rec.target}|${rec.relationship}`.toLowerCase();
+        }
+        if (seen[kind].has(key)) { stats.duplicates++; return; }
+        seen[kind].add(key);
+        stats[kind]++;
+        buffers[kind].push(rec);
+        if (buffers[kind].length >= ROWS_PER_MESSAGE) flush(kind);
+      },
+      end(){ flush('nodes'); flush('edges'); }
+    };
+  }
+
+  /** Decode a File chunk by chunk, reporting progress */
+  async function streamText(job, file, onText){
+    const reader = file.stream().pipeThrough(new TextDecoderStream()).getReader();
+    let bytes = 0, first = true;
+    for (;;){
+      const { value, done } = await reader.read();
+      if (done) break;
+      // Drop a UTF-8 byte order mark (Excel writes one)
+      onText(first && value.charCodeAt(0) === 0xfeff ? value.slice(1) : value);
+      first = false;
+      bytes += value.length;
+      postMessage({ job, type: 'progress', bytes: Math.min(bytes, file.size), total: file.size });
+    }
+  }
+
+  async function parseCsv(job, file, sink){
+    let headers = null, kind = null, line = 1;
+    const parser = csvParser(values => {
+      line++;
+      if (!headers){
+        headers = values.map(h => h.trim().toLowerCase());
+        kind = kindOf(headers);
+        if (!kind) throw new Error(`Unrecognised CSV header: ${values.join(', ')} (need id/label for nodes, source/target for edges)`);
+        return;
+      }
+      const raw = {};
+      headers.forEach((h, i) => { raw[h] = values[i]; });
+      sink.add(kind, raw, `line ${line}`);
+    });
+    await streamText(job, file, chunk => parser.push(chunk));
+    parser.end();
+  }
+
+  async function parseJsonLines(job, file, sink){
+    let tail = '', line = 0;
+    const take = l => {
+      line++;
+      if (!l.trim()) return;
+      let item;
+      try { item = JSON.parse(l); } catch (e) { stats(sink, `line ${line}`, 'not valid JSON'); return; }
+      addItem(sink, item, `line ${line}`);
+    };
+    await streamText(job, file, chunk => {
+      const lines = (tail + chunk).split('\n');
+      tail = lines.pop();
+      lines.forEach(take);
+    });
+    take(tail);
+  }
+
+  // JSON has no natural record boundary to stream on; it is parsed whole, here off the main thread
+  async function parseJson(job, file, sink){
+    const doc = JSON.parse(await file.text());
+    postMessage({ job, type: 'progress', bytes: file.size, total: file.size });
+    if (Array.isArray(doc)) doc.forEach((item, i) => addItem(sink, item, `item ${i + 1}`));
+    // Merge batches from tools/find_duplicates.py: ops to apply as they are
+    else if (doc && Array.isArray(doc.merges)) postMessage({ job, type: 'rows', kind: 'merges', rows: doc.merges });
+    else if (doc && (doc.nodes || doc.edges)){
+      (doc.nodes || []).forEach((item, i) => sink.add('nodes', lowerKeys(item), `nodes[${i}]`));
+      (doc.edges || []).forEach((item, i) => sink.add('edges', lowerKeys(item), `edges[${i}]`));
+    } else throw new Error('Expected an array of records, {nodes: [...], edges: [...]} or {merges: [...]}');
+  }
+
+  const lowerKeys = item => Object.fromEntries(Object.entries(item || {}).map(([k, v]) => [k.toLowerCase(), v]));
+
+  function addItem(sink, item, where){
+    const raw = lowerKeys(item);
+    const kind = raw.kind === 'node' ? 'nodes' : raw.kind === 'edge' ? 'edges' : kindOf(Object.keys(raw));
+    if (!kind) return stats(sink, where, 'neither a node nor an edge');
+    sink.add(kind, raw, where);
+  }
+
+  function stats(sink, where, message){
+    sink.stats.invalid++;
+    if (sink.stats.errors.length < MAX_REPORTED_ERRORS) sink.stats.errors.push(`${where}: ${message}`);
+  }
+
+  async function parseFile(job, file){
+    const sink = rowSink(job);
+    const name = (file.name || '').toLowerCase();
+    if (/\.(jsonl|ndjson)$/.test(name)) await parseJsonLines(job, file, sink);
+    else if (name.endsWith('.json')) await parseJson(job, file, sink);
+    else await parseCsv(job, file, sink);
+    sink.end();
+    return sink.stats;
+  }
+
+  // ---------- export ----------
+
+  let GraphStoreClass = null;
+
+  /** A GraphStore holding the main thread's snapshot (graph_store.js has no DOM dependencies) */
+  function storeFrom(snapshot){
+    if (!GraphStoreClass){
+      importScripts('./graph_store.js');
+      GraphStoreClass = GraphStore;
+    }
+    const store = new GraphStoreClass();
+    store.restore(snapshot);
+    return store;
+  }
+
+  /** Row data of the nodes and edges to export (include: per-node-row flags, or null for all) */
+  function selection(store, include){
+    const nodeRows = [];
+    for (let r = 0; r < store.nodeCount; r++) if (!include || include[r]) nodeRows.push(r);
+    const edgeRows = store.edgeRows().filter(e => !include || (include[store.edgeSrc[e]] && include[store.edgeDst[e]]));
+    const nodeRow = r => {
+      const n = store.node(store.nodeId(r));
+      return { ...n, hidden: n.hidden ? 'true' : '' };
+    };
+    const edgeRow = e => {
+      const { from, to, ...rest } = store.edge(e);
+      return { ...rest, source: from, target: to };
+    };
+    return { nodeRows, edgeRows, nodeRow, edgeRow };
+  }
+
+  /** Blob parts: one string per ROWS_PER_PART rows */
+  function parts(rows, format, head, tail, sep = ''){
+    const out = head ? [head] : [];
+    for (let i = 0; i < rows.length; i += ROWS_PER_PART){
+      const part = rows.slice(i, i + ROWS_PER_PART).map(format).join(sep);
+      out.push(i ? sep + part : part);
+    }
+    if (tail) out.push(tail);
+    return out;
+  }
+
+  const csvCell = v => {
+    const s = v == null ? '' : String(v);
+    return /[",\n\r]/.test(s) ? `"${s.replace(/"/g, '""')}"` : s;
+  };
+  const csvLine = (columns, row) => columns.map(c => csvCell(row[c])).join(',') + '\n';
+
+  const xml = v => String(v == null ? '' : v)
+    .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+
+  function exportCsv(sel, name){
+    return [
+      { name: `${name}-nodes.csv`, blob: new Blob(
+        [NODE_EXPORT_COLUMNS.join(',') + '\n', ...parts(sel.nodeRows, r => csvLine(NODE_EXPORT_COLUMNS, sel.nodeRow(r)))],
+        { type: 'text/csv' }) },
+      { name: `${name}-edges.csv`, blob: new Blob(
+        [EDGE_EXPORT_COLUMNS.join(',') + '\n', ...parts(sel.edgeRows, e => csvLine(EDGE_EXPORT_COLUMNS, sel.edgeRow(e)))],
+        { type: 'text/csv' }) }
+    ];
+  }
+
+  function exportJson(sel, name){
+    const pickCols = (columns, row) => Object.fromEntries(columns.map(c => [c, c === 'hidden' ? row[c] === 'true' : row[c] || '']));
+    return [{ name: `${name}.json`, blob: new Blob([
+      '{"format":"era-graph","nodes":[\n',
+      ...parts(sel.nodeRows, r => JSON.stringify(pickCols(NODE_EXPORT_COLUMNS, sel.nodeRow(r))), '', '', ',\n'),
+      '\n],"edges":[\n',
+      ...parts(sel.edgeRows, e => JSON.stringify(pickCols(EDGE_EXPORT_COLUMNS, sel.edgeRow(e))), '', '', ',\n'),
+      '\n]}\n'
+    ], { type: 'application/json' }) }];
+  }
+
+  function exportGraphml(sel, name){
+    const nodeKeys = NODE_EXPORT_COLUMNS.filter(c => c !== 'id');
+    const edgeKeys = EDGE_EXPORT_COLUMNS.filter(c => c !== 'source' && c !== 'target');
+    const keyDecl = (target, k) => `  <key id="${target[0]}_${k}" for="${target}" attr.name="${k}" attr.type="string"/>\n`;
+    const data = (prefix, keys, row) => keys.filter(k => row[k]).map(k => `<data key="${prefix}_${k}">${xml(row[k])}</data>`).join('');
+    const head = '<?xml version="1.0" encoding="UTF-8"?>\n' +
+      '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n' +
+      nodeKeys.map(k => keyDecl('node', k)).join('') + edgeKeys.map(k => keyDecl('edge', k)).join('') +
+      '  <graph id="G" edgedefault="directed">\n';
+    return [{ name: `${name}.graphml`, blob: new Blob([
+      head,
+      ...parts(sel.nodeRows, r => { const n = sel.nodeRow(r); return `    <node id="${xml(n.id)}">${data('n', nodeKeys, n)}</node>\n`; }),
+      ...parts(sel.edgeRows, e => { const d = sel.edgeRow(e); return `    <edge source="${xml(d.source)}" target="${xml(d.target)}">${data('e', edgeKeys, d)}</edge>\n`; }),
+      '  </graph>\n</graphml>\n'
+    ], { type: 'application/graphml+xml' }) }];
+  }
+
+  const EXPORTERS = { csv: exportCsv, json: exportJson, graphml: exportGraphml };
+
+  // ---------- dispatch ----------
+
+  self.onmessage = async (e) => {
+    const { job, type } = e.data;
+    try {
+      if (type === 'parse'){
+        postMessage({ job, type: 'done', stats: await parseFile(job, e.data.file) });
+      } else if (type === 'export'){
+        const exporter = EXPORTERS[e.data.format];
+        if (!exporter) throw new Error(`Unknown export format: ${e.data.format}`);
+        const sel = selection(storeFrom(e.data.snapshot), e.data.include);
+        postMessage({ job, type: 'done', files: exporter(sel, e.data.name), nodes: sel.nodeRows.length, edges: sel.edgeRows.length });
+      }
+    } catch (err) {
+      postMessage({ job, type: 'error', message: err.message || String(err) });
+    }
+  };
@@ -0,0 +1,155 @@
+  // Seed layout
+  // With no saved positions vis scatters the nodes at random, and physics
+  // spends most of its stabilization untangling them. seedLayout() gives the
+  // drawn graph a structured start instead: each connected component is laid
+  // out radially around its highest-degree hub, one ring per hop from the hub
+  // with a band inside the ring per node type, and the components are packed
+  // into shelves, largest first. Physics then only has to relax it (see the
+  // minVelocity stop in graph.js). projectGraph() seeds whenever it is given
+  // no positions; placeNear() places nodes the quick editor creates.
+
+  const RING_GAP = 150;       // between the rings of successive hops
+  const NODE_GAP = 60;        // arc length a node needs on a ring
+  const COMPONENT_GAP = 120;  // between packed components
+  // Offset of a type's band within a ring, in RING_GAPs (orgs inside, people outside)
+  const TYPE_BAND = { organization: 0, project: 0.3, person: 0.6 };
+
+  /**
+   * Positions for the drawn graph
+   * @param {GraphStore} store
+   * @param {number[]} rows - drawn node rows
+   * @param {number[]} edgeRows - drawn edge rows (both ends among rows)
+   * @returns {Object} per node id, {x, y}
+   */
+  function seedLayout(store, rows, edgeRows){
+    const n = rows.length;
+    const local = new Map(rows.map((r, i) => [r, i]));
+    const adjacent = Array.from({ length: n }, () => []);
+    edgeRows.forEach(e => {
+      const a = local.get(store.edgeSrc[e]), b = local.get(store.edgeDst[e]);
+      if (a === undefined || b === undefined || a === b) return;
+      adjacent[a].push(b);
+      adjacent[b].push(a);
+    });
+
+    const seen = new Uint8Array(n);
+    const components = [];
+    for (let i = 0; i < n; i++){
+      if (seen[i]) continue;
+      // Members, then the hub: the member with the most drawn edges
+      const members = [i];
+      seen[i] = 1;
+      for (let k = 0; k < members.length; k++){
+        adjacent[members[k]].forEach(j => { if (!seen[j]){ seen[j] = 1; members.push(j); } });
+      }
+      const hub = members.reduce((h, j) => adjacent[j].length > adjacent[h].length ? j : h, i);
+      components.push(radialLayout(hub, members.length, adjacent, i => store.nodeTypeName(rows[i])));
+    }
+
+    const positions = {};
+    packComponents(components).forEach(({ layout, cx, cy }) => {
+      layout.nodes.forEach((i, k) => {
+        positions[store.nodeId(rows[i])] = { x: cx + layout.x[k], y: cy + layout.y[k] };
+      });
+    });
+    return positions;
+  }
+
+  /**
+   * One component around its hub: a BFS tree from the hub, each node on the
+   * ring of its hop distance, children sharing their parent's angular sector
+   * in proportion to the leaves below them (so branches don't cross)
+   * @returns {{nodes: number[], x: number[], y: number[], radius: number}} positions relative to the hub
+   */
+  function radialLayout(hub, size, adjacent, typeOf){
+    const order = [hub], parent = new Map([[hub, -1]]), depth = new Map([[hub, 0]]);
+    for (let k = 0; k < order.length; k++){
+      const v = order[k];
+      adjacent[v].forEach(j => {
+        if (parent.has(j)) return;
+        parent.set(j, v);
+        depth.set(j, depth.get(v) + 1);
+        order.push(j);
+      });
+    }
+    const children = new Map(order.map(v => [v, []]));
+    order.slice(1).forEach(v => children.get(parent.get(v)).push(v));
+    const leaves = new Map();
+    for (let k = order.length - 1; k >= 0; k--){
+      const v = order[k];
+      leaves.set(v, Math.max(1, children.get(v).reduce((s, c) => s + leaves.get(c), 0)));
+    }
+
+    // A ring is at least RING_GAP outside the last, and long enough for its nodes
+    const perRing = [];
+    order.forEach(v => { const d = depth.get(v); perRing[d] = (perRing[d] || 0) + 1; });
+    const ring = [0];
+    for (let d = 1; d < perRing.length; d++){
+      ring[d] = Math.max(ring[d - 1] + RING_GAP, perRing[d] * NODE_GAP / (2 * Math.PI));
+    }
+
+    const sector = new Map([[hub, [0, 2 * Math.PI]]]);
+    const x = [], y = [];
+    let radius = NODE_GAP / 2;
+    order.forEach(v => {
+      const [from, to] = sector.get(v);
+      let start = from;
+      children.get(v).forEach(c => {
+        const width = (to - from) * leaves.get(c) / leaves.get(v);
+        sector.set(c, [start, start + width]);
+        start += width;
+      });
+      const d = depth.get(v);
+      const r = d ? ring[d] + (TYPE_BAND[typeOf(v)] || 0) * RING_GAP : 0;
+      const angle = (from + to) / 2;
+      x.push(r * Math.cos(angle));
+      y.push(r * Math.sin(angle));
+      radius = Math.max(radius, r + NODE_GAP / 2);
+    });
+    return { nodes: order, x, y, radius, size };
+  }
+
+  /**
+   * Shelf packing: components largest first, left to right in rows about as
+   * wide as the whole packing is tall, centred on the origin
+   * @returns {{layout: Object, cx: number, cy: number}[]}
+   */
+  function packComponents(components){
+    const sorted = components.slice().sort((a, b) => b.radius - a.radius || b.size - a.size);
+    const cell = c => 2 * c.radius + COMPONENT_GAP;
+    const area = sorted.reduce((s, c) => s + cell(c) * cell(c), 0);
+    const width = Math.max(sorted.length ? cell(sorted[0]) : 0, Math.sqrt(area));
+    const placed = [];
+    let x = 0, y = 0, shelf = 0, right = 0;
+    sorted.forEach(c => {
+      if (x > 0 && x + cell(c) > width){ y += shelf; x = 0; shelf = 0; }
+      placed.push({ layout: c, cx: x + c.radius, cy: y + c.radius });
+      x += cell(c);
+      shelf = Math.max(shelf, cell(c));
+      right = Math.max(right, x);
+    });
+    const dx = right / 2, dy = (y + shelf) / 2;
+    placed.forEach(p => { p.cx -= dx; p.cy -= dy; });
+    return placed;
+  }
+
+  /**
+   * Where to put a node created next to an existing one: on the ring of its
+   * type around that node, in the widest gap between the neighbours drawn there
+   * @param {{x: number, y: number}} center - the existing node's position
+   * @param {{x: number, y: number}[]} around - its drawn neighbours' positions
+   * @param {string} type - the new node's type
+   */
+  function placeNear(center, around, type){
+    const r = RING_GAP * (1 + (TYPE_BAND[type] || 0));
+    const angles = around.map(p => Math.atan2(p.y - center.y, p.x - center.x)).sort((a, b) => a - b);
+    let angle = -Math.PI / 2;  // straight up when nothing is around
+    if (angles.length){
+      let widest = -1;
+      angles.forEach((a, k) => {
+        const gap = (k + 1 < angles.length ? angles[k + 1] : angles[0] + 2 * Math.PI) - a;
+        if (gap > widest){ widest = gap; angle = a + gap / 2; }
+      });
+    }
+    return { x: center.x + r * Math.cos(angle), y: center.y + r * Math.sin(angle) };
+  }
@@ -0,0 +1,53 @@
+  // Sheets load worker (started by index.html's Load Worker section)
+  // Receives the windows of a load as the page reads them and turns them into
+  // row objects as they arrive; once the read is complete, builds the graph
+  // store from the rows (parse, auto-heal, adjacency, row signatures) and
+  // transfers its tables back, so the page never touches a row.
+  //
+  // Messages in:  {job, type: 'shard', tab, shard, names, byColumn}   (shard 0 starts the tab over)
+  //               {job, type: 'window', tab, shard, offset, valueRanges}
+  //               {job, type: 'build', headers}
+  //               {job, type: 'cancel'}
+  // Messages out: {job, type: 'built', built}   (built.store: a GraphStore snapshot)
+  //               {job, type: 'error', message}
+
+  importScripts('./graph_store.js', './sheet_rows.js');
+
+  const loads = new Map();  // job -> {tab -> [collector per shard]}
+
+  // Every typed array in a store snapshot, to transfer rather than copy
+  function snapshotBuffers(snap){
+    const arrays = [
+      ...Object.values(snap.nodeCols), snap.nodeType, snap.nodeFlags, snap.nodeSource, snap.nodePrivate,
+      snap.edgeSrc, snap.edgeDst, ...Object.values(snap.edgeCols), snap.edgeFlags, snap.edgeSource, snap.edgePrivate,
+      ...(snap.csr ? [snap.csr.offsets, snap.csr.edges] : [])
+    ];
+    return arrays.map(a => a.buffer);
+  }
+
+  self.onmessage = (e) => {
+    const msg = e.data;
+    if (msg.type === 'cancel'){
+      loads.delete(msg.job);
+      return;
+    }
+    if (!loads.has(msg.job)) loads.set(msg.job, {});
+    const parts = loads.get(msg.job);
+    if (msg.type === 'shard'){
+      if (!msg.shard) parts[msg.tab] = [];
+      parts[msg.tab][msg.shard] = shardRowsCollector(msg.names, msg.byColumn);
+    } else if (msg.type === 'window'){
+      parts[msg.tab][msg.shard].onWindow(msg.offset, msg.valueRanges);
+    } else if (msg.type === 'build'){
+      loads.delete(msg.job);
+      try {
+        const rowsOf = tab => (parts[tab] || []).flatMap(c => c.finish());
+        const store = new GraphStore();
+        const built = buildLoadedGraph(store, rowsOf('nodes'), rowsOf('edges'), msg.headers.nodes);
+        built.store = store.snapshot();
+        self.postMessage({ job: msg.job, type: 'built', built }, snapshotBuffers(built.store));
+      } catch (err) {
+        self.postMessage({ job: msg.job, type: 'error', message: err.message });
+      }
+    }
+  };
@@ -0,0 +1,215 @@
+  // Sheet rows <-> graph fields
+  // Pure conversions between the nodes/edges tabs' rows and the graph store's
+  // fields, shared by the page and load_worker.js: reading windows into row
+  // objects, parsing and auto-healing, the row keys and signatures saves
+  // compare against, and the whole load build (rows in, store tables out).
+
+  /**
+   * Parse node type from ID prefix (person::, org::, project::)
+   * @param {string} id - Node ID like "person::John Doe"
+   * @returns {string} Type: 'person', 'project', or 'organization'
+   */
+  function parseTypeFromId(id) {
+    if (!id) return 'organization';
+    if (id.startsWith('person::')) return 'person';
+    if (id.startsWith('project::')) return 'project';
+    return 'organization';
+  }
+
+  /**
+   * Row objects from windows of one shard, filled in as they arrive
+   * @param {string[]} names - header of each column read
+   * @param {boolean} byColumn - one range per column (else one range of whole rows)
+   */
+  function shardRowsCollector(names, byColumn) {
+    const rows = [];
+    const at = i => rows[i] || (rows[i] = {});
+    return {
+      rows,
+      onWindow(offset, valueRanges) {
+        if (byColumn) {
+          valueRanges.forEach((vr, k) => (vr.values || []).forEach((cell, j) => { at(offset + j)[names[k]] = cell[0] || ''; }));
+        } else {
+          (valueRanges[0].values || []).forEach((values, j) => {
+            const row = at(offset + j);
+            names.forEach((h, c) => { row[h] = values[c] || ''; });
+          });
+        }
+      },
+      // Blank rows inside the data come back empty or not at all
+      finish() {
+        for (let i = 0; i < rows.length; i++) {
+          const row = at(i);
+          names.forEach(h => { if (!(h in row)) row[h] = ''; });
+        }
+        return rows;
+      }
+    };
+  }
+
+  // Columns that only the curation/edge modals, saving and the double-click URL need.
+  // A projected load leaves them empty in the graph store until fetched (see Lazy Detail Fields).
+  const NODE_DETAIL_FIELDS = ['url', 'notes', 'member', 'origin', 'created_at', 'cand_rows'];
+  const EDGE_DETAIL_FIELDS = ['role', 'url', 'notes', 'created_at'];
+
+  // A personal sheet's optional `private` column (checkbox or true/false): kept out of the merged view
+  const isPrivateCell = value => value === true || String(value).trim().toLowerCase() === 'true';
+
+  /**
+   * Convert a nodes-tab row into graph store fields
+   * @param {Object} n - Row keyed by sheet header (detail columns may be absent)
+   */
+  function nodeFromRow(n) {
+    const node = {
+      id: n.id,
+      label: n.label,
+      // Parse type from ID prefix (Sheet's type column is unreliable)
+      type: parseTypeFromId(n.id),
+      hidden: n.hidden === 'true' || n.hidden === true,
+      updated_at: n.updated_at || ''
+    };
+    NODE_DETAIL_FIELDS.forEach(f => { if (f in n) node[f] = n[f] || ''; });
+    if ('private' in n) node.private = isPrivateCell(n.private);
+    return node;
+  }
+
+  /**
+   * Convert an edges-tab row into graph store fields
+   * @param {Object} e - Row keyed by sheet header (detail columns may be absent)
+   */
+  function edgeFromRow(e) {
+    const edge = {
+      from: e.source,
+      to: e.target,
+      relationship: e.relationship || '',
+      updated_at: e.updated_at || ''
+    };
+    EDGE_DETAIL_FIELDS.forEach(f => { if (f in e) edge[f] = e[f] || ''; });
+    if ('private' in e) edge.private = isPrivateCell(e.private);
+    return edge;
+  }
+
+  /**
+   * Build a placeholder node for an ID that an edge references but no node row defines
+   * @param {string} id - Node ID like "org::Name"
+   */
+  function healedNodePayload(id) {
+    return {
+      id: id,
+      label: id.replace(/^(person|org|project)::/, ''), // Strip prefix for display
+      type: parseTypeFromId(id),
+      url: '',
+      notes: '',
+      member: '',
+      origin: 'auto-healed',
+      hidden: false,
+      created_at: new Date().toISOString(),
+      updated_at: new Date().toISOString()
+    };
+  }
+
+  /**
+   * Convert graph store fields into a nodes-tab row
+   * @param {Object} n - Node fields
+   * @param {string[]} [nodeHeader] - the nodes tab's header (default: as last read)
+   */
+  function nodeToRow(n, nodeHeader = sheetHeaders.nodes) {
+    const row = {
+      id: n.id,
+      label: n.label,
+      type: n.type || 'organization',
+      url: n.url || '',
+      notes: n.notes || '',
+      member: n.member || '',
+      origin: n.origin || '',
+      hidden: n.hidden ? 'true' : '',
+      created_at: n.created_at || '',
+      updated_at: n.updated_at || ''
+    };
+    // Only sheets that index their candidates from the nodes tab carry this column
+    if ((nodeHeader || []).includes('cand_rows')) row.cand_rows = n.cand_rows || '';
+    return row;
+  }
+
+  function edgeToRow(e) {
+    return {
+      source: e.from,
+      target: e.to,
+      relationship: e.relationship || e.label,
+      role: e.role || '',
+      url: e.url || '',
+      notes: e.notes || '',
+      created_at: e.created_at || '',
+      updated_at: e.updated_at || ''
+    };
+  }
+
+  const edgeKey = (from, to, relationship) => `${from}|${to}|${relationship}`;
+  const rowKeyFns = {
+    nodes: row => row.id,
+    edges: row => edgeKey(row.source, row.target, row.relationship)
+  };
+
+  function rowSignature(row) {
+    const { created_at, updated_at, ...content } = row;
+    return JSON.stringify(content);
+  }
+
+  /** A data row's key, and what sheetRows records for it */
+  function sheetRowEntry(tabName, index, row) {
+    return [rowKeyFns[tabName](row), { index, sig: rowSignature(row), created_at: row.created_at, updated_at: row.updated_at }];
+  }
+
+  /** A tab's sheetRows record ({keys, byKey}) for its data rows in order */
+  function indexSheetRows(tabName, rows) {
+    const index = { keys: [], byKey: new Map() };
+    rows.forEach((row, i) => {
+      const [key, entry] = sheetRowEntry(tabName, i, row);
+      index.keys[i] = key;
+      index.byKey.set(key, entry);
+    });
+    return index;
+  }
+
+  /** Newest updated_at among rows ('' if none) */
+  function newestStamp(rows) {
+    return rows.reduce((m, r) => (r.updated_at || '') > m ? r.updated_at : m, '');
+  }
+
+  /**
+   * Build a loaded graph into a store: parse the rows, create nodes that edges
+   * reference but no row defines (auto-heal), fill the tables and the adjacency
+   * index (node degrees), and record what the sheet holds
+   * @param {GraphStore} store - reset and filled
+   * @param {Object[]} nodesData - nodes-tab rows
+   * @param {Object[]} edgesData - edges-tab rows
+   * @param {string[]} [nodeHeader] - the nodes tab's header, for the row signatures
+   * @returns {{healed: string[], sheetRows: Object, newest: string, counts: {nodes: number, edges: number}}}
+   */
+  function buildLoadedGraph(store, nodesData, edgesData, nodeHeader) {
+    const nodesPayload = nodesData.map(nodeFromRow);
+    const edgesPayload = edgesData.map(edgeFromRow);
+
+    const known = new Set(nodesPayload.map(n => n.id));
+    const healed = [];
+    edgesPayload.forEach(edge => [edge.from, edge.to].forEach(id => {
+      if (!known.has(id)) { known.add(id); healed.push(id); }
+    }));
+
+    store.reset(Math.max(1024, nodesPayload.length + healed.length, edgesPayload.length));
+    nodesPayload.forEach(n => store.addNode(n));
+    healed.forEach(id => store.addNode(healedNodePayload(id)));
+    edgesPayload.forEach(e => store.addEdge(e.from, e.to, e));
+    store._adjacency();
+
+    // Healed nodes are not in the sheet
+    return {
+      healed,
+      sheetRows: {
+        nodes: indexSheetRows('nodes', nodesPayload.map(n => nodeToRow(n, nodeHeader || []))),
+        edges: indexSheetRows('edges', edgesPayload.map(edgeToRow))
+      },
+      newest: newestStamp(nodesData.concat(edgesData)),
+      counts: { nodes: nodesData.length, edges: edgesData.length }
+    };
+  }
@@ -0,0 +1,89 @@
+// Service worker: the app shell is served cache-first, the startup snapshot
+// stale-while-revalidate. Registered from index.html ("Offline Cache").
+//
+// The manifest block below is written by tools/build_manifest.py; run it
+// after changing any precached file so visitors pick up the new build.
+
+// ---- manifest (generated by tools/build_manifest.py) ----
+const VERSION = '476065ee9ee0';
+const PRECACHE = [
+  "index.html",
+  "sheet_rows.js",
+  "graph_store.js",
+  "layout.js",
+  "dedupe.js",
+  "graph.js",
+  "graph_io.js",
+  "tab_sync.js",
+  "io_worker.js",
+  "load_worker.js",
+  "https://unpkg.com/vis-network@9.1.9/standalone/umd/vis-network.min.js"
+];
+// ---- end manifest ----
+
+const SHELL_CACHE = `era-shell-${VERSION}`;
+const DATA_CACHE = 'era-data';
+// Served from cache at once and refreshed in the background; the page checks it against the sheet anyway
+const DATA_FILES = ['snapshot.json.gz'];
+
+const scoped = path => new URL(path, self.registration.scope).href;
+
+// A new build waits until no page runs the old one: an open page keeps loading
+// scripts (the workers, lazily) from the old shell cache, so the new worker
+// neither skips waiting nor claims pages, and only then drops the old cache.
+self.addEventListener('install', event => {
+  event.waitUntil(
+    caches.open(SHELL_CACHE).then(cache => cache.addAll(PRECACHE.map(scoped)))
+  );
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys().then(keys => Promise.all(keys
+      .filter(k => k.startsWith('era-shell-') && k !== SHELL_CACHE)
+      .map(k => caches.delete(k))))
+  );
+});
+
+async function cacheFirst(request, key) {
+  const cached = await caches.match(key, { cacheName: SHELL_CACHE });
+  return cached || fetch(request);
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(DATA_CACHE);
+  const cached = await cache.match(event.request);
+  const refresh = fetch(event.request).then(response => {
+    if (response.ok) return cache.put(event.request, response.clone()).then(() => response);
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(refresh.catch(() => {}));
+    return cached;
+  }
+  return refresh;
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  if (request.method !== 'GET') return;
+  const url = new URL(request.url);
+  const scope = self.registration.scope;
+
+  if (request.mode === 'navigate' && url.origin === location.origin) {
+    // The viewer is a single page; any query string is ignored
+    if (url.href.split('?')[0] === scope || url.href.split('?')[0] === scoped('index.html')) {
+      event.respondWith(cacheFirst(request, scoped('index.html')));
+    }
+    return;
+  }
+  if (url.origin === location.origin && DATA_FILES.some(f => url.href === scoped(f))) {
+    event.respondWith(staleWhileRevalidate(event));
+    return;
+  }
+  const href = url.href;
+  if (PRECACHE.some(p => scoped(p) === href)) {
+    event.respondWith(cacheFirst(request, href));
+  }
+  // Everything else (Sheets API, Google sign-in) goes to the network untouched
+});
@@ -0,0 +1,161 @@
+  // Cross-tab coordination (BroadcastChannel)
+  // One leader tab loads from Sheets; other tabs of the same sheet receive the
+  // loaded graph and layout over the channel instead of fetching and stabilizing
+  // again. Ops queued in any tab are broadcast and applied in every other tab.
+  (function(){
+    if (!('BroadcastChannel' in window)) return;
+
+    const FOLLOWER_WAIT_MS = 15000;  // how long a follower waits for the leader's snapshot
+    const SETTLE_WAIT_MS = 5000;     // how long the leader waits for physics before sharing positions
+    const tabId = Math.random().toString(36).slice(2);
+    const channel = new BroadcastChannel('era-graph:' + SHEET_ID);
+    let opSeq = 0;
+    let isLeader = false;
+    let loaded = false;
+    let snapshotSent = false;
+
+    // Remote ops this tab has applied but not yet seen saved, and the ids of our own ops
+    let appliedRemote = [];
+    let savingRemote = null;
+    const localOpIds = new Map(); // op object -> op_id
+
+    let resolveSnapshot;
+    const snapshotReceived = new Promise(resolve => { resolveSnapshot = resolve; });
+
+    function post(msg){ channel.postMessage({ ...msg, tab: tabId }); }
+
+    function currentSnapshot(){
+      // The store's typed-array tables clone cheaply; the other tab projects its own DataSets
+      return {
+        store: graphStore.snapshot(), positions: network.getPositions(), sheetRows, sheetHeaders, sheetShards, detailsLoaded
+      };
+    }
+
+    // Share positions once the layout has settled (or after SETTLE_WAIT_MS at the latest)
+    function broadcastSnapshotWhenSettled(){
+      let sent = false;
+      const send = () => { if (sent) return; sent = true; snapshotSent = true; post({ type: 'snapshot', ...currentSnapshot() }); };
+      network.once('stabilized', send);
+      setTimeout(send, SETTLE_WAIT_MS);
+    }
+
+    function applySnapshot(snap){
+      // Positions come from the leader; view state (ghosting, highlights) stays per tab
+      graphStore.restore(snap.store);
+      pinnedNodes.clear();
+      projectGraph(snap.positions);
+      graphSource = 'sheets';  // the leader's graph came from the sheet
+      // Which rows still need their detail columns fetched
+      const details = snap.detailsLoaded || { nodes: [], edges: [], all: true };
+      resetDetails(details.all);
+      details.nodes.forEach(k => detailsLoaded.nodes.add(k));
+      details.edges.forEach(k => detailsLoaded.edges.add(k));
+      loaded = true;
+      // Adopt the leader's view of the sheet rows (for append detection and pull sync)
+      Object.assign(sheetRows, snap.sheetRows);
+      Object.assign(sheetHeaders, snap.sheetHeaders);
+      Object.assign(sheetShards, snap.sheetShards);
+      if (typeof hideLoading === 'function') hideLoading();
+      console.log(`📡 Received ${graphStore.nodeCount} nodes, ${graphStore.edgeCount} edges from another tab`);
+    }
+
+    channel.onmessage = (e) => {
+      const msg = e.data;
+      if (!msg || msg.tab === tabId) return;
+      if (msg.type === 'hello'){
+        if (isLeader && loaded && snapshotSent) post({ type: 'snapshot', ...currentSnapshot() });
+      } else if (msg.type === 'snapshot'){
+        if (!loaded) { applySnapshot(msg); resolveSnapshot(true); }
+      } else if (msg.type === 'ops'){
+        if (!loaded) return;
+        applyGraphOps(msg.ops.map(o => o.op));
+        msg.ops.forEach(o => appliedRemote.push(o.op_id));
+      } else if (msg.type === 'rows'){
+        // Rows the leader pulled from the sheet (edits by other contributors)
+        if (loaded) applyPulledRows(msg.changed);
+      } else if (msg.type === 'saved'){
+        // Another tab wrote the sheet: adopt its row index (append and rewrite offsets)
+        if (loaded){
+          Object.assign(sheetRows, msg.sheetRows);
+          Object.assign(sheetShards, msg.sheetShards);
+        }
+        // ... and drop our ops its rewrite included
+        const ids = new Set(msg.op_ids);
+        const saved = [...localOpIds].filter(([, id]) => ids.has(id)).map(([op]) => op);
+        if (saved.length){
+          saved.forEach(op => localOpIds.delete(op));
+          dropSavedOps(saved);
+        }
+        appliedRemote = appliedRemote.filter(id => !ids.has(id));
+      }
+    };
+
+    window.onQueueOps(ops => {
+      post({ type: 'ops', ops: ops.map(op => {
+        const op_id = `${tabId}:${++opSeq}`;
+        localOpIds.set(op, op_id);
+        return { op, op_id };
+      }) });
+    });
+
+    window.addEventListener('sheetsrowspulled', (e) => post({ type: 'rows', changed: e.detail }));
+
+    // Every save in this tab moves the sheet's rows, and other tabs get the new row
+    // index with it. A full rewrite also persists every remote op applied before it started.
+    window.addEventListener('sheetssaveprogress', (e) => {
+      const p = e.detail;
+      if (p.state === 'saving' && p.done === 0) savingRemote = p.mode === 'full' ? appliedRemote.slice() : [];
+      if (p.state === 'saved' && savingRemote){
+        const ids = new Set(savingRemote);
+        appliedRemote = appliedRemote.filter(id => !ids.has(id));
+        post({ type: 'saved', op_ids: savingRemote, sheetRows, sheetShards });
+        savingRemote = null;
+      }
+      if (p.state === 'error') savingRemote = null;
+    });
+
+    // Leader election through the Web Locks API; without it every tab loads for itself
+    let resolveRole;
+    const roleKnown = new Promise(resolve => { resolveRole = resolve; });
+    if (navigator.locks){
+      const lockName = 'era-graph-leader:' + SHEET_ID;
+      navigator.locks.request(lockName, { ifAvailable: true }, lock => {
+        if (!lock){
+          resolveRole(false);
+          // Queue for leadership so a follower takes over when the leader closes
+          navigator.locks.request(lockName, () => { isLeader = true; return new Promise(() => {}); });
+          return;
+        }
+        isLeader = true;
+        resolveRole(true);
+        return new Promise(() => {});  // hold the lock for the life of the tab
+      });
+    } else {
+      isLeader = true;
+      resolveRole(true);
+    }
+    post({ type: 'hello' });
+
+    async function leaderLoad(){
+      const result = await loadDataFromSheets();
+      loaded = !!result;
+      if (loaded) broadcastSnapshotWhenSettled();
+      return result;
+    }
+
+    // Initial load: the leader fetches from Sheets; followers wait for its snapshot
+    async function initialLoad(){
+      if (loaded) return currentSnapshot();
+      if (await roleKnown) return leaderLoad();
+      const timeout = new Promise(resolve => setTimeout(() => resolve(false), FOLLOWER_WAIT_MS));
+      if (await Promise.race([snapshotReceived, timeout])) return currentSnapshot();
+      console.warn('📡 No snapshot from leader tab, loading from Sheets');
+      return leaderLoad();
+    }
+
+    window.tabSync = {
+      initialLoad,
+      get isLeader(){ return isLeader; },
+      tabId
+    };
+  })();
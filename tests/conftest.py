@@ -0,0 +1,109 @@
+"""
+Shared Playwright harness for the browser tests.
+
+- One headless Chromium per worker process (session scope)
+- A fresh browser context per test (isolated localStorage, routes, tabs)
+- The page is served by the Sheets stand-in (sheets_standin.py) against
+  fixture data, with the Google client libraries replaced by fake_gapi.js
+- Tests wait on window.__graph state with wait_for_function, never sleep
+
+Run the core tier in parallel (needs pytest-xdist):
+    pytest tests -m core -n auto
+"""
+import importlib.util
+import json
+
+import pytest
+
+from sheets_standin import FIXTURES_DIR, start_standin
+
+# The live scripts import Playwright at module level; skip them where it isn't installed
+if importlib.util.find_spec("playwright") is None:
+    collect_ignore = ["test_load.py", "test_sheets_api.py", "test_sheets_integration.py"]
+
+FAKE_GAPI = FIXTURES_DIR / "fake_gapi.js"
+GOOGLE_SCRIPTS = ["https://apis.google.com/js/api.js", "https://accounts.google.com/gsi/client"]
+
+# Conditions shared by the tests
+GRAPH_LOADED = "() => window.__graph && window.__graph.nodes.length > 0"
+NO_PENDING_OPS = "() => window.pendingOps.length === 0"
+
+
+@pytest.fixture(scope="session")
+def standin_server():
+    """Static site + Sheets stand-in on a free port (one per worker)."""
+    server, standin, url = start_standin()
+    yield standin, url
+    server.shutdown()
+
+
+@pytest.fixture
+def standin(standin_server):
+    """The stand-in spreadsheet, reset to the fixture data for each test."""
+    sheet, _ = standin_server
+    sheet.reset()
+    return sheet
+
+
+@pytest.fixture(scope="session")
+def browser():
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        yield browser
+        browser.close()
+
+
+def _route_google(context, base_url):
+    """Serve fake_gapi.js for the Google libraries and send REST calls to the stand-in."""
+    for url in GOOGLE_SCRIPTS:
+        context.route(url, lambda route: route.fulfill(path=str(FAKE_GAPI), content_type="application/javascript"))
+
+    def to_standin(route):
+        request = route.request
+        path = request.url.split("googleapis.com", 1)[1]
+        response = route.fetch(url=base_url + path)
+        route.fulfill(response=response)
+    context.route("https://sheets.googleapis.com/**", to_standin)
+
+
+@pytest.fixture
+def context(browser, standin, standin_server):
+    _, base_url = standin_server
+    context = browser.new_context(base_url=base_url)
+    _route_google(context, base_url)
+    yield context
+    context.close()
+
+
+def open_graph(context, signed_in=False, local_storage=None):
+    """Open the viewer in a new tab and wait until the fixture graph is loaded."""
+    items = dict(local_storage or {})
+    if signed_in:
+        items["gapi_token"] = json.dumps({"access_token": "standin-token", "expires_at": 4102444800000})
+    if items:
+        context.add_init_script(
+            "(() => { const items = %s; for (const k in items) localStorage.setItem(k, items[k]); })()"
+            % json.dumps(items)
+        )
+    page = context.new_page()
+    errors = []
+    page.on("pageerror", lambda err: errors.append(str(err)))
+    page.js_errors = errors
+    page.goto("/")
+    page.wait_for_function(GRAPH_LOADED)
+    return page
+
+
+@pytest.fixture
+def page(context):
+    """The viewer loaded from fixture data, not signed in."""
+    return open_graph(context)
+
+
+@pytest.fixture
+def signed_in_page(context):
+    """The viewer loaded from fixture data with a restored sign-in token."""
+    page = open_graph(context, signed_in=True)
+    page.wait_for_function("() => sheetsApiReady === true")
+    return page
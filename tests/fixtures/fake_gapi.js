@@ -0,0 +1,65 @@
+// Test stand-in for https://apis.google.com/js/api.js and https://accounts.google.com/gsi/client.
+// The harness serves this file for both URLs; gapi calls go to the Sheets
+// stand-in (tests/sheets_standin.py) on the page's own origin, and sign-in
+// succeeds immediately with a fake token.
+(function(){
+  const base = window.location.origin + '/v4/spreadsheets/';
+  const enc = encodeURIComponent;
+
+  // Resolve/reject like gapi.client: {status, result}
+  async function call(method, path, body) {
+    let resp;
+    try {
+      resp = await fetch(base + path, {
+        method,
+        headers: { 'Content-Type': 'application/json' },
+        body: body === undefined ? undefined : JSON.stringify(body)
+      });
+    } catch (e) {
+      throw { status: 0, result: { error: { message: String(e) } } };
+    }
+    const result = await resp.json().catch(() => ({}));
+    if (!resp.ok) throw { status: resp.status, result };
+    return { status: resp.status, result };
+  }
+
+  const values = {
+    get: ({ spreadsheetId, range }) => call('GET', `${spreadsheetId}/values/${enc(range)}`),
+    batchGet: ({ spreadsheetId, ranges }) =>
+      call('GET', `${spreadsheetId}/values:batchGet?` + ranges.map(r => 'ranges=' + enc(r)).join('&')),
+    update: ({ spreadsheetId, range, resource }) =>
+      call('PUT', `${spreadsheetId}/values/${enc(range)}?valueInputOption=RAW`, resource),
+    clear: ({ spreadsheetId, range }) => call('POST', `${spreadsheetId}/values/${enc(range)}:clear`, {}),
+    append: ({ spreadsheetId, range, resource }) =>
+      call('POST', `${spreadsheetId}/values/${enc(range)}:append?valueInputOption=RAW`, resource)
+  };
+  const spreadsheets = {
+    values,
+    get: ({ spreadsheetId }) => call('GET', `${spreadsheetId}`),
+    batchUpdate: ({ spreadsheetId, resource }) => call('POST', `${spreadsheetId}:batchUpdate`, resource)
+  };
+
+  if (!window.gapi || !window.gapi.__standin) {
+    window.gapi = {
+      __standin: true,
+      load(name, callback) { setTimeout(callback, 0); },
+      client: {
+        async init() { window.gapi.client.sheets = { spreadsheets }; },
+        setToken(token) { window.gapi.client.token = token; },
+        getToken() { return window.gapi.client.token || null; }
+      }
+    };
+  }
+
+  if (!window.google || !window.google.accounts) {
+    window.google = {
+      accounts: {
+        oauth2: {
+          initTokenClient({ callback }) {
+            return { requestAccessToken() { setTimeout(() => callback({ access_token: 'standin-token' }), 0); } };
+          }
+        }
+      }
+    };
+  }
+})();
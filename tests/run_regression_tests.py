@@ -2,36 +2,35 @@
 """
 Regression Test Suite
 Run this after any code changes to ensure nothing broke.
+
+Each tier is one pytest run against the fixture-served page (see
+conftest.py). Test files run in parallel worker processes when
+pytest-xdist is installed.
 """
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
 
-# Core regression tests (must pass)
-CORE_TESTS = [
-    "test_exact_scenario.py",           # Bogdonoff scenario (Phase B1)
-    "test_reload_persistence.py",       # Hidden state persistence
-    "test_search_filtering.py",         # Search filtering (Phase C1)
-]
-
-# Additional tests (nice to have)
-ADDITIONAL_TESTS = [
-    "test_curation_full.py",            # Full curation workflow
-    "test_filter_fix.py",               # Union vs intersection
-    "test_create_project.py",           # Project node creation
-]
+# Core regression tests (must pass): pytest -m core
+#   test_exact_scenario.py      Bogdonoff scenario (Phase B1)
+#   test_reload_persistence.py  Hidden state persistence
+#   test_search_filtering.py    Search filtering (Phase C1)
+# Additional tests (nice to have): pytest -m additional
+#   test_curation_full.py       Full curation workflow
+#   test_filter_fix.py          Union vs intersection
+#   test_create_project.py      Project node creation
 
-def run_test(test_file):
-    """Run a single test and return success status."""
+def run_tier(marker):
+    """Run one marker tier with pytest and return success status."""
     print(f"\n{'='*60}")
-    print(f"Running: {test_file}")
+    print(f"Running: pytest -m {marker}")
     print('='*60)
     
-    result = subprocess.run(
-        [sys.executable, test_file],
-        cwd=Path(__file__).parent,
-        capture_output=False
-    )
+    cmd = [sys.executable, "-m", "pytest", "-q", "-m", marker]
+    if importlib.util.find_spec("xdist"):
+        cmd += ["-n", "auto", "--dist", "loadfile"]
+    result = subprocess.run(cmd, cwd=Path(__file__).parent)
     
     return result.returncode == 0
 
@@ -39,44 +38,25 @@ def main():
     print("ERA Graph Pipeline - Regression Test Suite")
     print("=" * 60)
     
-    core_passed = 0
-    core_failed = 0
-    additional_passed = 0
-    additional_failed = 0
-    
-    # Run core tests
     print("\n🔴 CORE TESTS (must pass)")
-    for test in CORE_TESTS:
-        if run_test(test):
-            core_passed += 1
-            print(f"✅ {test} PASSED")
-        else:
-            core_failed += 1
-            print(f"❌ {test} FAILED")
+    core_ok = run_tier("core")
+    print(f"{'✅' if core_ok else '❌'} core tier {'PASSED' if core_ok else 'FAILED'}")
     
-    # Run additional tests
     print("\n🟡 ADDITIONAL TESTS (nice to have)")
-    for test in ADDITIONAL_TESTS:
-        if run_test(test):
-            additional_passed += 1
-            print(f"✅ {test} PASSED")
-        else:
-            additional_failed += 1
-            print(f"⚠️  {test} FAILED")
+    additional_ok = run_tier("additional")
+    print(f"{'✅' if additional_ok else '⚠️ '} additional tier {'PASSED' if additional_ok else 'FAILED'}")
     
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"Core Tests:       {core_passed}/{len(CORE_TESTS)} passed")
-    print(f"Additional Tests: {additional_passed}/{len(ADDITIONAL_TESTS)} passed")
     
-    if core_failed > 0:
+    if not core_ok:
         print("\n❌ REGRESSION DETECTED - Core tests failed!")
         print("   Do not proceed with new changes.")
         print("   Restore from backup or fix the issues.")
         return 1
-    elif additional_failed > 0:
+    elif not additional_ok:
         print("\n⚠️  Some additional tests failed")
         print("   Core functionality OK, but check failures")
         return 0
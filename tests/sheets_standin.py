@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Google Sheets API (values endpoints, tab list, addSheet).
+
+Serves the static site from the repo root and a small in-memory
+implementation of the Sheets v4 REST calls that index.html makes, so the
+browser tests run without network access to Google or a real sheet.
+tests/fixtures/fake_gapi.js replaces the Google client libraries and
+routes gapi calls here.
+
+Run standalone to click around against fixture data:
+    python tests/sheets_standin.py --port 8002
+"""
+import argparse
+import csv
+import json
+import re
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_CELL = re.compile(r"^([A-Z]*)(\d*)$")
+
+
+def column_index(letters):
+    """'A' -> 0, 'Z' -> 25, 'AA' -> 26."""
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+def parse_range(a1):
+    """Split an A1 range into (tab, first_col, first_row, last_col, last_row).
+
+    Rows and columns are 0-based; open ends (``A:Z``, ``A2:C``) are None.
+    """
+    tab, _, cells = a1.partition("!")
+    tab = tab.strip("'")
+    if not cells:
+        return tab, 0, 0, None, None
+    start, _, end = cells.partition(":")
+    c0, r0 = _CELL.match(start).groups()
+    first_col = column_index(c0) if c0 else 0
+    first_row = int(r0) - 1 if r0 else 0
+    if not end:
+        # A single cell is an anchor for writes and a one-cell range for reads
+        return tab, first_col, first_row, first_col, first_row
+    c1, r1 = _CELL.match(end).groups()
+    last_col = column_index(c1) if c1 else None
+    last_row = int(r1) - 1 if r1 else None
+    return tab, first_col, first_row, last_col, last_row
+
+
+def _trim(rows):
+    """Drop trailing empty cells and rows, as the Sheets API does."""
+    out = [list(r) for r in rows]
+    for r in out:
+        while r and r[-1] == "":
+            r.pop()
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+class SheetsStandIn:
+    """In-memory spreadsheet with per-tab grids of strings.
+
+    ``quota_per_minute`` simulates the per-user write quota: write requests
+    beyond it within a rolling minute get HTTP 429.
+    """
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, quota_per_minute=None):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.quota_per_minute = quota_per_minute
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.tabs = {}
+            for path in sorted(self.fixtures_dir.glob("*.csv")):
+                with open(path, newline="", encoding="utf-8") as f:
+                    self.tabs[path.stem] = [row for row in csv.reader(f)]
+            self.stats = {"reads": 0, "writes": 0, "bytes_written": 0, "quota_errors": 0}
+            self._write_times = []
+            self.spreadsheets = {}
+
+    def add_spreadsheet(self, sheet_id, tabs):
+        """Serve another spreadsheet (e.g. a personal sheet) under its id; tabs: name -> rows.
+
+        Any other id gets this one. Requests to it count in this stand-in's stats.
+        """
+        other = SheetsStandIn(self.fixtures_dir)
+        other.tabs = {name: [list(row) for row in rows] for name, rows in tabs.items()}
+        self.spreadsheets[sheet_id] = other
+        return other
+
+    # -- grid access -------------------------------------------------------
+
+    def _grid(self, tab):
+        return self.tabs.setdefault(tab, [])
+
+    def read(self, a1):
+        tab, c0, r0, c1, r1 = parse_range(a1)
+        grid = self._grid(tab)
+        last_row = len(grid) - 1 if r1 is None else min(r1, len(grid) - 1)
+        rows = []
+        for r in range(r0, last_row + 1):
+            row = grid[r]
+            end = len(row) if c1 is None else c1 + 1
+            rows.append(row[c0:end])
+        return _trim(rows)
+
+    def write(self, a1, values):
+        tab, c0, r0, _, _ = parse_range(a1)
+        grid = self._grid(tab)
+        for i, values_row in enumerate(values):
+            r = r0 + i
+            while len(grid) <= r:
+                grid.append([])
+            row = grid[r]
+            while len(row) < c0 + len(values_row):
+                row.append("")
+            for j, v in enumerate(values_row):
+                row[c0 + j] = "" if v is None else str(v)
+        self.tabs[tab] = _trim(grid)
+
+    def clear(self, a1):
+        tab, c0, r0, c1, r1 = parse_range(a1)
+        grid = self._grid(tab)
+        last_row = len(grid) - 1 if r1 is None else min(r1, len(grid) - 1)
+        for r in range(r0, last_row + 1):
+            row = grid[r]
+            end = len(row) if c1 is None else min(c1 + 1, len(row))
+            for c in range(c0, end):
+                row[c] = ""
+        self.tabs[tab] = _trim(grid)
+
+    def append(self, a1, values):
+        tab = parse_range(a1)[0]
+        start = len(_trim(self._grid(tab)))
+        self.write(f"{tab}!A{start + 1}", values)
+        return start
+
+    def rows_as_dicts(self, tab):
+        grid = self.tabs.get(tab, [])
+        if not grid:
+            return []
+        headers = grid[0]
+        return [{h: (row[i] if i < len(row) else "") for i, h in enumerate(headers)} for row in grid[1:]]
+
+    # -- quota -------------------------------------------------------------
+
+    def take_write_quota(self):
+        if not self.quota_per_minute:
+            return True
+        now = time.monotonic()
+        self._write_times = [t for t in self._write_times if now - t < 60]
+        if len(self._write_times) >= self.quota_per_minute:
+            self.stats["quota_errors"] += 1
+            return False
+        self._write_times.append(now)
+        return True
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    standin = None  # set per server class
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(REPO_ROOT), **kwargs)
+
+    def log_message(self, format, *args):
+        pass  # Suppress server logs
+
+    def _json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._json(status, {"error": {"code": status, "message": message}})
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        self.standin.stats["bytes_written"] += len(raw)
+        return json.loads(raw or b"{}")
+
+    def _route(self):
+        """Return (spreadsheet_path_remainder, query, spreadsheet) for API calls, else None."""
+        url = urlparse(self.path)
+        m = re.match(r"^/v4/spreadsheets/([^/:]+)([/:].*)?$", url.path)
+        if not m:
+            return None
+        sheet = self.standin.spreadsheets.get(unquote(m.group(1)), self.standin)
+        return unquote(m.group(2) or ""), parse_qs(url.query), sheet
+
+    def end_headers(self):
+        # Never let the browser cache fixture-served files between tests
+        if not self.path.startswith("/v4/"):
+            self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, OPTIONS")
+        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+        self.end_headers()
+
+    def do_GET(self):
+        routed = self._route()
+        if routed is None:
+            return super().do_GET()
+        rest, query, sheet = routed
+        s = self.standin
+        with s.lock:
+            s.stats["reads"] += 1
+            if rest == "/values:batchGet":
+                ranges = query.get("ranges", [])
+                return self._json(200, {"valueRanges": [{"range": r, "values": sheet.read(r)} for r in ranges]})
+            if rest.startswith("/values/"):
+                a1 = rest[len("/values/"):]
+                return self._json(200, {"range": a1, "values": sheet.read(a1)})
+            if rest == "":
+                sheets = [{"properties": {"title": t, "gridProperties": {
+                    "rowCount": max(len(g), 1000),
+                    "columnCount": max([len(r) for r in g] + [26]),
+                }}} for t, g in sheet.tabs.items()]
+                return self._json(200, {"sheets": sheets})
+        self._error(404, f"Unknown Sheets call {rest}")
+
+    def _write(self, handler, sheet):
+        s = self.standin
+        with s.lock:
+            if not s.take_write_quota():
+                return self._error(429, "Quota exceeded for quota metric 'Write requests' (rateLimitExceeded)")
+            s.stats["writes"] += 1
+            return handler(sheet)
+
+    def do_PUT(self):
+        routed = self._route()
+        if routed is None or not routed[0].startswith("/values/"):
+            return self._error(404, "Unknown Sheets call")
+        a1 = routed[0][len("/values/"):]
+        body = self._body()
+
+        def update(s):
+            s.write(a1, body.get("values", []))
+            return self._json(200, {"updatedRange": a1})
+        self._write(update, routed[2])
+
+    def do_POST(self):
+        routed = self._route()
+        if routed is None:
+            return self._error(404, "Unknown Sheets call")
+        rest, _, sheet = routed
+        body = self._body()
+        if rest == ":batchUpdate":
+            def batch_update(s):
+                titles = [r["addSheet"]["properties"]["title"] for r in body.get("requests", []) if "addSheet" in r]
+                taken = [t for t in titles if t in s.tabs]
+                if taken:
+                    return self._error(400, f"A sheet with the name \"{taken[0]}\" already exists")
+                for t in titles:
+                    s.tabs[t] = []
+                return self._json(200, {"replies": [{"addSheet": {"properties": {"title": t}}} for t in titles]})
+            return self._write(batch_update, sheet)
+        if rest.endswith(":clear"):
+            a1 = rest[len("/values/"):-len(":clear")]
+
+            def clear(s):
+                s.clear(a1)
+                return self._json(200, {"clearedRange": a1})
+            return self._write(clear, sheet)
+        if rest.endswith(":append"):
+            a1 = rest[len("/values/"):-len(":append")]
+
+            def append(s):
+                start = s.append(a1, body.get("values", []))
+                return self._json(200, {"updates": {"updatedRange": f"{parse_range(a1)[0]}!A{start + 1}"}})
+            return self._write(append, sheet)
+        self._error(404, f"Unknown Sheets call {rest}")
+
+
+def start_standin(port=0, fixtures_dir=FIXTURES_DIR, quota_per_minute=None):
+    """Start the stand-in in a daemon thread; returns (server, standin, base_url)."""
+    standin = SheetsStandIn(fixtures_dir, quota_per_minute=quota_per_minute)
+    handler = type("Handler", (_Handler,), {"standin": standin})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, standin, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--fixtures", default=str(FIXTURES_DIR))
+    parser.add_argument("--quota", type=int, default=None, help="write requests per minute before 429s")
+    args = parser.parse_args()
+    server, _, url = start_standin(args.port, args.fixtures, args.quota)
+    print(f"Sheets stand-in serving {REPO_ROOT} at {url}/")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Concurrent-editor load simulator for the save path.
+
+Runs N headless editors in parallel against the Sheets stand-in
+(sheets_standin.py), each in its own browser context (its own sign-in,
+localStorage and tab-sync group, i.e. its own user). Every editor makes a
+seeded stream of realistic edits through the page's own hooks
+(applyGraphOp + queueOp, as the Quick Editor and curation modal do) and
+saves them either with doSave() every few ops (full rewrite, as the Save
+button does) or by leaving them to autosave (append-only when it can).
+
+Reports, per save mode:
+- save latency percentiles (from the page's sheetssaveprogress events)
+- bytes written per save (request bodies of the editor's write calls)
+- quota errors (429s the stand-in served) and saves that failed
+- lost updates: edits a save acknowledged that the final sheet does not
+  hold, and that no later acknowledged edit replaced
+
+Usage:
+    python tests/simulate_editors.py --editors 20 --ops 30 --save full
+    python tests/simulate_editors.py --editors 20 --ops 30 --save autosave --quota 60
+    python tests/simulate_editors.py --editors 5 --json report.json
+
+Needs Playwright (pip install playwright && playwright install chromium).
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+from sheets_standin import FIXTURES_DIR, start_standin
+
+FAKE_GAPI = FIXTURES_DIR / "fake_gapi.js"
+GOOGLE_SCRIPTS = ["https://apis.google.com/js/api.js", "https://accounts.google.com/gsi/client"]
+RELATIONSHIPS = ["partnership", "employment", "funding", "member"]
+# Share of each op kind in an editor's stream
+OP_MIX = (("edge_add", 0.6), ("edge_remove", 0.2), ("update_node", 0.2))
+
+# Collects what each save acknowledged: runSave() snapshots pendingOps right
+# before its first 'saving' event, and those are the ops a 'saved' event covers.
+SAVE_PROBE = """() => {
+    window.__sim = { saves: [], current: null };
+    window.addEventListener('sheetssaveprogress', (e) => {
+        const p = e.detail;
+        if (p.state === 'saving' && p.done === 0) {
+            window.__sim.current = { start: Date.now(), mode: p.mode, ops: window.pendingOps.map(op => op.sim_id) };
+        } else if ((p.state === 'saved' || p.state === 'error') && window.__sim.current) {
+            const s = window.__sim.current;
+            window.__sim.saves.push({ ...s, end: Date.now(), ok: p.state === 'saved', message: p.message || '' });
+            window.__sim.current = null;
+        }
+    });
+}"""
+
+
+# -- ops -------------------------------------------------------------------
+
+def generate_ops(rng, editor, count, node_ids):
+    """One editor's op stream; ids and values are unique per op so the final sheet can be checked."""
+    ops, own_edges = [], []
+    kinds = [k for k, _ in OP_MIX]
+    weights = [w for _, w in OP_MIX]
+    for n in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        sim_id = f"e{editor}-{n}"
+        if kind == "edge_remove" and own_edges:
+            edge = own_edges.pop(rng.randrange(len(own_edges)))
+            ops.append({"type": "edge_remove", **edge, "sim_id": sim_id})
+        elif kind == "update_node":
+            ops.append({"type": "update_node", "id": rng.choice(node_ids),
+                        "url": f"https://example.org/sim/{sim_id}", "sim_id": sim_id})
+        else:
+            # A new contact of an existing node, so each added edge has its own key
+            edge = {"from": rng.choice(node_ids), "to": f"person::Sim Contact {sim_id}",
+                    "relationship": rng.choice(RELATIONSHIPS)}
+            own_edges.append(edge)
+            ops.append({"type": "edge_add", **edge, "sim_id": sim_id})
+    return ops
+
+
+def percentile(values, p):
+    """Nearest-rank percentile (p in 0..100); None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def find_lost_updates(acked, node_rows, edge_rows):
+    """
+    Acknowledged edits the final sheet lost.
+
+    acked: (ack time, op) pairs. An edge_add is lost if its row is missing,
+    an edge_remove if its row came back; an update_node url is lost if the
+    node's url isn't the value of the last acknowledged update to that node.
+    """
+    edges = {(r.get("source"), r.get("target"), r.get("relationship")) for r in edge_rows}
+    urls = {r.get("id"): r.get("url", "") for r in node_rows}
+    last_url = {}
+    lost = []
+    for when, op in sorted(acked, key=lambda a: a[0]):
+        if op["type"] == "update_node":
+            last_url[op["id"]] = op
+        key = (op.get("from"), op.get("to"), op.get("relationship"))
+        if op["type"] == "edge_add" and key not in edges:
+            removed_later = any(o["type"] == "edge_remove" and (o["from"], o["to"], o["relationship"]) == key
+                                for _, o in acked)
+            if not removed_later:
+                lost.append(op)
+        elif op["type"] == "edge_remove" and key in edges:
+            lost.append(op)
+    lost.extend(op for node_id, op in last_url.items() if urls.get(node_id) != op["url"])
+    return lost
+
+
+# -- browser ---------------------------------------------------------------
+
+async def _route_google(context, base_url):
+    for url in GOOGLE_SCRIPTS:
+        await context.route(url, lambda route: route.fulfill(path=str(FAKE_GAPI), content_type="application/javascript"))
+
+    async def to_standin(route):
+        path = route.request.url.split("googleapis.com", 1)[1]
+        response = await route.fetch(url=base_url + path)
+        await route.fulfill(response=response)
+    await context.route("https://sheets.googleapis.com/**", to_standin)
+
+
+async def run_editor(browser, base_url, editor, ops, save, save_every, think_ms, rng, timeout_ms):
+    """Drive one editor through its ops; returns its saves, write sizes and errors."""
+    context = await browser.new_context(base_url=base_url)
+    await _route_google(context, base_url)
+    token = json.dumps({"access_token": f"sim-token-{editor}", "expires_at": 4102444800000})
+    await context.add_init_script(
+        "localStorage.setItem('gapi_token', %s); localStorage.setItem('era_autosave', %s);"
+        % (json.dumps(token), json.dumps("on" if save == "autosave" else "off"))
+    )
+    page = await context.new_page()
+    writes, errors = [], []
+    page.on("pageerror", lambda err: errors.append(str(err)))
+    page.on("request", lambda req: writes.append((time.time() * 1000, len(req.post_data_buffer or b"")))
+            if req.method in ("PUT", "POST") and "/v4/spreadsheets/" in req.url else None)
+
+    await page.goto("/")
+    await page.wait_for_function("() => sheetsApiReady === true && graphSource === 'sheets'", timeout=timeout_ms)
+    await page.evaluate(SAVE_PROBE)
+
+    for n, op in enumerate(ops, start=1):
+        await asyncio.sleep(rng.uniform(0.5, 1.5) * think_ms / 1000)
+        await page.evaluate("(op) => { applyGraphOp(op); window.queueOp(op); }", op)
+        if save == "full" and n % save_every == 0:
+            await page.evaluate("() => window.doSave()")
+    # Flush: a last manual save, or wait for autosave to drain the queue
+    if save == "full":
+        await page.evaluate("() => window.doSave()")
+    try:
+        await page.wait_for_function("() => window.pendingOps.length === 0 && !window.__sim.current", timeout=timeout_ms)
+    except Exception:
+        errors.append(f"editor {editor}: {await page.evaluate('() => window.pendingOps.length')} op(s) never saved")
+    saves = await page.evaluate("() => window.__sim.saves")
+    await context.close()
+    return {"editor": editor, "saves": saves, "writes": writes, "errors": errors}
+
+
+def save_bytes(save, writes):
+    """Bytes this editor sent in write requests while the save ran."""
+    return sum(size for when, size in writes if save["start"] - 50 <= when <= save["end"] + 50)
+
+
+async def simulate(editors=5, ops_per_editor=20, save="full", save_every=5, think_ms=300,
+                   quota=None, seed=1, timeout_ms=120000):
+    from playwright.async_api import async_playwright
+
+    server, standin, base_url = start_standin(quota_per_minute=quota)
+    try:
+        node_ids = [r["id"] for r in standin.rows_as_dicts("nodes") if r.get("id")]
+        rngs = [random.Random(f"{seed}:{k}") for k in range(editors)]
+        streams = [generate_ops(rngs[k], k, ops_per_editor, node_ids) for k in range(editors)]
+        by_sim_id = {op["sim_id"]: op for stream in streams for op in stream}
+
+        started = time.time()
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            results = await asyncio.gather(*[
+                run_editor(browser, base_url, k, streams[k], save, save_every, think_ms, rngs[k], timeout_ms)
+                for k in range(editors)
+            ])
+            await browser.close()
+        elapsed = time.time() - started
+
+        acked = [(s["end"], by_sim_id[sim_id]) for r in results for s in r["saves"] if s["ok"]
+                 for sim_id in s["ops"] if sim_id in by_sim_id]
+        lost = find_lost_updates(acked, standin.rows_as_dicts("nodes"), standin.rows_as_dicts("edges"))
+        return build_report(results, lost, standin.stats, editors, ops_per_editor, save, quota, elapsed)
+    finally:
+        server.shutdown()
+
+
+def build_report(results, lost, stats, editors, ops_per_editor, save, quota, elapsed):
+    by_mode = {}
+    for r in results:
+        for s in r["saves"]:
+            entry = by_mode.setdefault(s["mode"] or "unknown", {"latency_ms": [], "bytes": [], "failed": 0})
+            if s["ok"]:
+                entry["latency_ms"].append(s["end"] - s["start"])
+                entry["bytes"].append(save_bytes(s, r["writes"]))
+            else:
+                entry["failed"] += 1
+    modes = {}
+    for mode, entry in by_mode.items():
+        lat, size = entry["latency_ms"], entry["bytes"]
+        modes[mode] = {
+            "saves": len(lat),
+            "failed": entry["failed"],
+            "latency_ms": {f"p{p}": percentile(lat, p) for p in (50, 90, 99)} | {"max": max(lat, default=None)},
+            "bytes_per_save": {"mean": round(sum(size) / len(size)) if size else None,
+                               "p50": percentile(size, 50), "max": max(size, default=None)},
+        }
+    return {
+        "editors": editors, "ops_per_editor": ops_per_editor, "save": save, "quota_per_minute": quota,
+        "elapsed_s": round(elapsed, 1),
+        "modes": modes,
+        "sheet": dict(stats),
+        "lost_updates": len(lost),
+        "lost_examples": lost[:10],
+        "errors": [e for r in results for e in r["errors"]],
+    }
+
+
+def format_report(report):
+    lines = [f"{report['editors']} editor(s) x {report['ops_per_editor']} op(s), save={report['save']}, "
+             f"quota={report['quota_per_minute'] or 'off'}, {report['elapsed_s']}s"]
+    for mode, m in sorted(report["modes"].items()):
+        lat, size = m["latency_ms"], m["bytes_per_save"]
+        lines.append(f"  {mode:<8} {m['saves']} save(s), {m['failed']} failed | latency ms "
+                     f"p50={lat['p50']} p90={lat['p90']} p99={lat['p99']} max={lat['max']} | "
+                     f"bytes/save mean={size['mean']} p50={size['p50']} max={size['max']}")
+    sheet = report["sheet"]
+    lines.append(f"  sheet: {sheet['reads']} read(s), {sheet['writes']} write(s), "
+                 f"{sheet['bytes_written']} bytes written, {sheet['quota_errors']} quota error(s) (429)")
+    lines.append(f"  lost updates: {report['lost_updates']}")
+    for op in report["lost_examples"]:
+        lines.append(f"    - {op['sim_id']}: {op['type']} {op.get('id') or (op.get('from'), op.get('to'))}")
+    for err in report["errors"]:
+        lines.append(f"  ! {err}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--editors", type=int, default=5)
+    parser.add_argument("--ops", type=int, default=20, help="ops per editor")
+    parser.add_argument("--save", choices=["full", "autosave"], default="full",
+                        help="full: doSave() every --save-every ops; autosave: leave it to autosave")
+    parser.add_argument("--save-every", type=int, default=5)
+    parser.add_argument("--think-ms", type=int, default=300, help="mean pause between an editor's ops")
+    parser.add_argument("--quota", type=int, default=None, help="stand-in write requests per minute before 429s")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout-ms", type=int, default=120000, help="per wait (load, final flush)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--fail-on-lost", action="store_true", help="exit 1 if any update was lost")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(simulate(args.editors, args.ops, args.save, args.save_every, args.think_ms,
+                                  args.quota, args.seed, args.timeout_ms))
+    print(format_report(report))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 1 if args.fail_on_lost and report["lost_updates"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
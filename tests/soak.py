@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Soak test: memory growth over a long editing session.
+
+Drives one headless viewer against the Sheets stand-in (sheets_standin.py)
+through thousands of scripted, seeded actions of the kinds a curator makes
+all day: Quick Editor edits (existing and new nodes, undo), search filters,
+curation modal opens with a scroll through the connection list, and a
+Re-Load at the end of every cycle. Each Re-Load discards the session's
+edits, so the page is back in the same state: after a forced garbage
+collection, a sample there should not grow from one cycle to the next.
+
+Samples (Chrome DevTools Protocol, Performance.getMetrics):
+- JS heap used
+- DOM nodes (including detached nodes something still holds)
+- event listeners
+- documents
+
+The report gives each quantity's growth from the sample after the warm-up
+cycles to the smallest of the last few samples (so a transient spike does
+not count), and fails when growth exceeds the limits.
+
+Usage:
+    python tests/soak.py --cycles 50 --actions 40
+    python tests/soak.py --cycles 200 --max-heap-mb 16 --json soak.json
+
+Needs Playwright (pip install playwright && playwright install chromium).
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+from sheets_standin import FIXTURES_DIR, start_standin
+
+FAKE_GAPI = FIXTURES_DIR / "fake_gapi.js"
+GOOGLE_SCRIPTS = ["https://apis.google.com/js/api.js", "https://accounts.google.com/gsi/client"]
+GRAPH_LOADED = "() => window.__graph && window.__graph.nodes.length > 0"
+# Share of each action kind in a cycle (every cycle then ends with a Re-Load)
+ACTION_MIX = (("edit", 0.35), ("new_node", 0.1), ("undo", 0.1), ("filter", 0.2), ("modal", 0.25))
+FILTER_SETTLE_MS = 600  # graph.js runs the search filter 500ms after the last keystroke
+
+# Performance.getMetrics name -> sample field
+METRICS = {"JSHeapUsedSize": "heap_bytes", "Nodes": "dom_nodes",
+           "JSEventListeners": "listeners", "Documents": "documents"}
+DEFAULT_LIMITS = {"heap_bytes": 8 * 2**20, "dom_nodes": 500, "listeners": 100, "documents": 0}
+
+# Drawn nodes and the Quick Editor's relationships, read once the graph is loaded
+PAGE_VOCABULARY = """() => ({
+    nodes: window.__graph.nodes.get().map(n => [n.id, n.label]),
+    relationships: [...document.getElementById('qeRel').options].map(o => o.value).filter(v => v && !v.startsWith('__'))
+})"""
+
+
+# -- plan ------------------------------------------------------------------
+
+def plan_actions(rng, cycle, count, nodes, relationships):
+    """One cycle's actions; nodes are (id, label) pairs of drawn nodes."""
+    kinds = [k for k, _ in ACTION_MIX]
+    weights = [w for _, w in ACTION_MIX]
+    actions = []
+    for n in range(count):
+        kind = rng.choices(kinds, weights)[0]
+        (from_id, from_label), (to_id, to_label) = rng.sample(nodes, 2)
+        if kind in ("edit", "new_node"):
+            to = to_label if kind == "edit" else f"Soak Contact {cycle}-{n}"
+            actions.append({"kind": kind, "from": from_label, "to": to, "relationship": rng.choice(relationships)})
+        elif kind == "filter":
+            # A word of a label, as a curator would type it
+            actions.append({"kind": "filter", "query": rng.choice(from_label.split())[:6].lower()})
+        elif kind == "modal":
+            actions.append({"kind": "modal", "id": from_id})
+        else:
+            actions.append({"kind": kind})
+    return actions
+
+
+# -- growth ----------------------------------------------------------------
+
+def measure_growth(samples, warmup=2, tail=3):
+    """
+    Growth of each sampled quantity: the smallest of the last `tail` samples
+    minus the sample taken after `warmup` cycles. None if there are no
+    samples past the baseline yet.
+    """
+    if len(samples) <= warmup + 1:
+        return None
+    baseline = samples[warmup]
+    last = samples[max(warmup + 1, len(samples) - tail):]
+    return {field: min(s[field] for s in last) - baseline[field] for field in METRICS.values()}
+
+
+def over_limits(growth, limits):
+    """Messages for the quantities that grew past their limit."""
+    return [f"{field} grew by {growth[field]:,.0f} (limit {limit:,.0f})"
+            for field, limit in limits.items() if growth and growth[field] > limit]
+
+
+# -- browser ---------------------------------------------------------------
+
+def _route_google(context, base_url):
+    for url in GOOGLE_SCRIPTS:
+        context.route(url, lambda route: route.fulfill(path=str(FAKE_GAPI), content_type="application/javascript"))
+
+    def to_standin(route):
+        path = route.request.url.split("googleapis.com", 1)[1]
+        route.fulfill(response=route.fetch(url=base_url + path))
+    context.route("https://sheets.googleapis.com/**", to_standin)
+
+
+def take_sample(cdp):
+    """Collect garbage, then read the CDP performance counters."""
+    cdp.send("HeapProfiler.collectGarbage")
+    cdp.send("HeapProfiler.collectGarbage")
+    metrics = {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}
+    return {field: metrics.get(name, 0) for name, field in METRICS.items()}
+
+
+def run_action(page, action):
+    kind = action["kind"]
+    if kind in ("edit", "new_node"):
+        page.fill("#qeFrom", action["from"])
+        page.fill("#qeTo", action["to"])
+        page.select_option("#qeRel", action["relationship"])
+        page.click("#qeAdd")
+    elif kind == "undo":
+        page.click("#qeUndo")
+    elif kind == "filter":
+        page.fill("#qeTo", "")
+        page.fill("#qeFrom", action["query"])
+        page.wait_for_timeout(FILTER_SETTLE_MS)
+        page.fill("#qeFrom", "")
+        page.wait_for_timeout(FILTER_SETTLE_MS)
+    elif kind == "modal":
+        page.evaluate("(id) => window.openCurationFor(id)", action["id"])
+        page.wait_for_function("() => document.getElementById('curationModal').style.display === 'flex'")
+        page.evaluate("""() => {
+            const list = document.getElementById('curationList');
+            list.scrollTop = list.scrollHeight;
+            list.dispatchEvent(new Event('scroll'));
+        }""")
+        page.click("#closeCuration")
+
+
+def reload_graph(page):
+    """Click Re-Load (discarding the cycle's edits) and wait for the new graph."""
+    page.click("#refreshBtn")
+    page.wait_for_function("() => !document.getElementById('refreshBtn').disabled")
+    page.wait_for_function(GRAPH_LOADED)
+
+
+def run_soak(page, cycles=50, actions_per_cycle=40, seed=1, log=None):
+    """
+    Soak a loaded viewer; returns the samples (one after load, then one per
+    cycle) and the page errors seen. Every dialog is dismissed: near-duplicate
+    prompts create the node, the unsaved-changes prompt re-loads without saving.
+    """
+    rng = random.Random(seed)
+    errors = []
+    page.on("pageerror", lambda err: errors.append(str(err)))
+    page.on("dialog", lambda dialog: dialog.dismiss())
+    cdp = page.context.new_cdp_session(page)
+    cdp.send("Performance.enable")
+
+    vocabulary = page.evaluate(PAGE_VOCABULARY)
+    nodes = [tuple(n) for n in vocabulary["nodes"]]
+    samples = [{"cycle": 0, "actions": 0, "elapsed_s": 0.0, **take_sample(cdp)}]
+    started = time.time()
+    for cycle in range(1, cycles + 1):
+        for action in plan_actions(rng, cycle, actions_per_cycle, nodes, vocabulary["relationships"]):
+            run_action(page, action)
+        reload_graph(page)
+        sample = {"cycle": cycle, "actions": cycle * (actions_per_cycle + 1),
+                  "elapsed_s": round(time.time() - started, 1), **take_sample(cdp)}
+        samples.append(sample)
+        if log:
+            log(format_sample(sample))
+    cdp.detach()
+    return {"samples": samples, "errors": errors}
+
+
+def soak(cycles=50, actions_per_cycle=40, seed=1, warmup=2, tail=3, limits=None, log=None):
+    from playwright.sync_api import sync_playwright
+
+    server, _, base_url = start_standin()
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context(base_url=base_url)
+            _route_google(context, base_url)
+            page = context.new_page()
+            page.goto("/")
+            page.wait_for_function(GRAPH_LOADED)
+            result = run_soak(page, cycles, actions_per_cycle, seed, log)
+            browser.close()
+    finally:
+        server.shutdown()
+    growth = measure_growth(result["samples"], warmup, tail)
+    return {
+        "cycles": cycles, "actions_per_cycle": actions_per_cycle, "seed": seed, "warmup": warmup,
+        "limits": limits or DEFAULT_LIMITS,
+        "growth": growth,
+        "failures": over_limits(growth, limits or DEFAULT_LIMITS),
+        **result,
+    }
+
+
+def format_sample(s):
+    return (f"  cycle {s['cycle']:>4} ({s['actions']} actions, {s['elapsed_s']}s): "
+            f"heap {s['heap_bytes'] / 2**20:.1f} MB, {s['dom_nodes']:.0f} DOM nodes, "
+            f"{s['listeners']:.0f} listeners, {s['documents']:.0f} document(s)")
+
+
+def format_report(report):
+    samples = report["samples"]
+    lines = [f"{report['cycles']} cycle(s) x {report['actions_per_cycle']} action(s) + Re-Load, seed={report['seed']}"]
+    lines += [format_sample(s) for s in (samples[0], samples[min(report["warmup"], len(samples) - 1)], samples[-1])]
+    if report["growth"] is None:
+        lines.append("  too few cycles to measure growth")
+    else:
+        g = report["growth"]
+        lines.append(f"  growth after warm-up: heap {g['heap_bytes'] / 2**20:+.2f} MB, {g['dom_nodes']:+.0f} DOM nodes, "
+                     f"{g['listeners']:+.0f} listeners, {g['documents']:+.0f} document(s)")
+    for failure in report["failures"]:
+        lines.append(f"  ! {failure}")
+    for err in report["errors"]:
+        lines.append(f"  ! page error: {err}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cycles", type=int, default=50, help="cycles, each ending with a Re-Load")
+    parser.add_argument("--actions", type=int, default=40, help="actions per cycle")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=2, help="cycles before the baseline sample")
+    parser.add_argument("--tail", type=int, default=3, help="last samples whose smallest value is compared")
+    parser.add_argument("--max-heap-mb", type=float, default=DEFAULT_LIMITS["heap_bytes"] / 2**20)
+    parser.add_argument("--max-dom-nodes", type=int, default=DEFAULT_LIMITS["dom_nodes"])
+    parser.add_argument("--max-listeners", type=int, default=DEFAULT_LIMITS["listeners"])
+    parser.add_argument("--json", metavar="PATH", help="also write the report (with every sample) as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print each sample as it is taken")
+    args = parser.parse_args(argv)
+
+    limits = {"heap_bytes": args.max_heap_mb * 2**20, "dom_nodes": args.max_dom_nodes,
+              "listeners": args.max_listeners, "documents": DEFAULT_LIMITS["documents"]}
+    report = soak(args.cycles, args.actions, args.seed, args.warmup, args.tail, limits,
+                  log=print if args.verbose else None)
+    print(format_report(report))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 1 if report["failures"] or report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
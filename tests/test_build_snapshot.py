@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Test the offline snapshot builder (tools/build_snapshot.py)"""
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+from sheets_standin import FIXTURES_DIR, start_standin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+import build_snapshot  # noqa: E402
+
+pytestmark = pytest.mark.core
+
+
+def fixture_snapshot(**kwargs):
+    node_rows, edge_rows = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    return build_snapshot.build_snapshot(node_rows, edge_rows, **kwargs)
+
+
+def node_index(snapshot, node_id):
+    strings = snapshot["strings"]
+    return [strings[i] for i in snapshot["nodes"]["id"]].index(node_id)
+
+
+def test_heals_and_reports_problems():
+    nodes = [{"id": "org::A", "label": "A"}, {"id": ""}, {"id": "org::A", "label": "again"}]
+    edges = [
+        {"source": "org::A", "target": "person::Bea Lind", "relationship": "employment"},
+        {"source": "org::A", "target": "person::Bea Lind", "relationship": "employment"},
+        {"source": "org::A", "target": "", "relationship": "partnership"},
+        {"source": "org::A", "target": "org::A", "relationship": "partnership"},
+    ]
+    graph, links, problems = build_snapshot.prepare_graph(nodes, edges)
+    assert [(n["id"], n["label"], n["type"], n["healed"]) for n in graph] == [
+        ("org::A", "A", "organization", False),
+        ("person::Bea Lind", "Bea Lind", "person", True),
+    ]
+    assert len(links) == 3
+    assert len(problems) == 6
+    assert build_snapshot.degrees(len(graph), links) == [3, 2]
+
+
+def test_fixture_snapshot():
+    snapshot, problems = fixture_snapshot(iterations=50)
+    assert problems == ["edges row 19: healed missing node 'org::Unlisted Partner Trust'"]
+    assert (len(snapshot["nodes"]["id"]), len(snapshot["edges"]["source"])) == (21, 18)
+    assert snapshot["source"]["nodes"] == 20 and snapshot["source"]["edges"] == 18
+
+    hidden = node_index(snapshot, "org::Fetzer Institute")
+    assert snapshot["nodes"]["hidden"][hidden] == 1
+    assert snapshot["nodes"]["degree"][hidden] == 2
+    # Hidden nodes are not drawn, so they get no position
+    assert snapshot["nodes"]["x"][hidden] is None
+    healed = node_index(snapshot, "org::Unlisted Partner Trust")
+    assert snapshot["nodes"]["healed"][healed] == 1
+
+    labels = [snapshot["strings"][snapshot["nodes"]["label"][i]].lower() for i in snapshot["label_index"]]
+    assert labels == sorted(labels)
+
+
+def test_layout_is_seeded_and_keeps_edges_short():
+    first, _ = fixture_snapshot(iterations=100, seed=3)
+    again, _ = fixture_snapshot(iterations=100, seed=3)
+    assert (first["nodes"]["x"], first["nodes"]["y"]) == (again["nodes"]["x"], again["nodes"]["y"])
+
+    xs, ys = first["nodes"]["x"], first["nodes"]["y"]
+    drawn = [i for i, x in enumerate(xs) if x is not None]
+    assert all(math.isfinite(xs[i]) and math.isfinite(ys[i]) for i in drawn)
+
+    def dist(a, b):
+        return math.hypot(xs[a] - xs[b], ys[a] - ys[b])
+    edges = [(s, t) for s, t in zip(first["edges"]["source"], first["edges"]["target"])
+             if xs[s] is not None and xs[t] is not None and s != t]
+    pairs = [(a, b) for a in drawn for b in drawn if a < b]
+    mean_edge = sum(dist(s, t) for s, t in edges) / len(edges)
+    mean_pair = sum(dist(a, b) for a, b in pairs) / len(pairs)
+    assert mean_edge < mean_pair
+
+
+def test_write_and_read_back(tmp_path):
+    snapshot, _ = fixture_snapshot(iterations=10)
+    out = tmp_path / "snapshot.json.gz"
+    size = build_snapshot.write_snapshot(snapshot, out)
+    assert out.read_bytes()[:2] == b"\x1f\x8b"
+    assert 0 < size < 4096
+    assert build_snapshot.read_snapshot(out) == snapshot
+
+
+def test_reads_through_the_sheets_api():
+    server, _, url = start_standin()
+    try:
+        from_api = build_snapshot.read_sheets(url, "standin-sheet")
+    finally:
+        server.shutdown()
+    from_csv = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    assert [r["id"] for r in from_api[0]] == [r["id"] for r in from_csv[0]]
+    assert [(r["source"], r["target"]) for r in from_api[1]] == [(r["source"], r["target"]) for r in from_csv[1]]
+
+
+def test_reads_sharded_tabs():
+    server, sheet, url = start_standin()
+    try:
+        edges = sheet.tabs["edges"]
+        sheet.tabs["edges"], sheet.tabs["edges_001"] = edges[:6], [edges[0]] + edges[6:]
+        from_api = build_snapshot.read_sheets(url, "standin-sheet")
+    finally:
+        server.shutdown()
+    assert build_snapshot.shard_names("edges", {"edges", "edges_001", "edges_003"}) == ["edges", "edges_001"]
+    from_csv = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    assert from_api[1] == from_csv[1]
+
+
+def test_strict_refuses_to_write(tmp_path, capsys):
+    out = tmp_path / "snapshot.json.gz"
+    args = ["--csv", str(FIXTURES_DIR), "--out", str(out), "--iterations", "5"]
+    assert build_snapshot.main(args + ["--strict"]) == 1
+    assert not out.exists()
+    assert build_snapshot.main(args) == 0
+    assert out.exists()
+    assert "21 nodes, 18 edges" in capsys.readouterr().out
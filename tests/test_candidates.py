@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Test lazy loading of discovered partner candidates in the curation modal"""
+import pytest
+
+pytestmark = pytest.mark.additional
+
+CANDIDATES = "#curationList input[type=checkbox][data-name]"
+CANDIDATE_NAMES = "(sel) => [...document.querySelectorAll(sel)].map(cb => cb.dataset.name)"
+
+
+def candidate_requests(page):
+    """Record the Sheets requests that touch the candidates tab."""
+    seen = []
+    page.on("request", lambda req: seen.append(req.url) if "candidates" in req.url else None)
+    return seen
+
+
+def open_modal(page, org_id):
+    page.evaluate("(id) => window.openCurationFor(id)", org_id)
+    page.wait_for_selector(CANDIDATES)
+    return page.evaluate(CANDIDATE_NAMES, CANDIDATES)
+
+
+def test_nothing_fetched_at_startup(page):
+    assert page.evaluate("() => window.__graph.candidates.size") == 0
+
+
+def test_row_range_from_node(page):
+    # Kenya Forest Alliance carries cand_rows, so one request fetches its rows
+    requests = candidate_requests(page)
+    assert open_modal(page, 'org::Kenya Forest Alliance') == ['Green Belt Movement Trust']
+    assert len(requests) == 1
+
+    # Reopening is served from the cache
+    page.keyboard.press("Escape")
+    assert open_modal(page, 'org::Kenya Forest Alliance') == ['Green Belt Movement Trust']
+    assert len(requests) == 1
+
+
+def test_row_range_from_index(page):
+    # Without cand_rows the org_id column is read once to find the rows;
+    # media links, "website by" credits and duplicates are filtered out
+    requests = candidate_requests(page)
+    names = open_modal(page, 'org::Ecorestoration Alliance')
+    assert names == ['Regen Network Foundation', 'Soil Health Institute']
+    assert len(requests) == 2
+    assert page.js_errors == []
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Test the curation modal's virtualized connection list on a hub with many partners"""
+import pytest
+
+pytestmark = pytest.mark.core
+
+HUB = "org::Regen Network"
+ROWS = "#curationList .curRow"
+CHECKBOX = '#curationList input[data-conn-id="{}"]'
+
+
+@pytest.fixture
+def hub_page(page):
+    page.evaluate("""(hub) => addGraphBatch(
+        Array.from({ length: 600 }, (_, i) => ({ id: `org::Partner ${i}`, label: `Partner ${i}` })),
+        Array.from({ length: 600 }, (_, i) => ({ from: hub, to: `org::Partner ${i}`, relationship: 'partnership' })))""", HUB)
+    page.evaluate("(id) => window.openCurationFor(id)", HUB)
+    page.wait_for_selector(ROWS)
+    return page
+
+
+def test_only_a_window_is_rendered(hub_page):
+    page = hub_page
+    connections = page.evaluate("""(id) => { const r = graphStore.nodeRow(id);
+        return graphStore.incidentRows(r).filter(e => isProjected(graphStore.otherEnd(e, r))).length; }""", HUB)
+    assert page.text_content("#curationInfo").startswith(f"{connections} connections")
+    assert page.locator(ROWS).count() < 100
+
+    # Scrolling to the end brings the last partner in; the first rows leave the DOM
+    page.evaluate("() => { const list = document.getElementById('curationList'); list.scrollTop = list.scrollHeight; list.dispatchEvent(new Event('scroll')); }")
+    page.wait_for_selector(CHECKBOX.format("org::Partner 599"))
+    assert page.locator(CHECKBOX.format("org::Partner 0")).count() == 0
+    assert page.locator(ROWS).count() < 100
+
+
+def test_toggle_patches_one_row(hub_page):
+    page = hub_page
+    page.evaluate("() => document.querySelectorAll('#curationList .curRow').forEach(r => { r.__kept = true; })")
+    selector = CHECKBOX.format("org::Partner 3")
+    page.evaluate("(sel) => { const cb = document.querySelector(sel); cb.checked = false; cb.dispatchEvent(new Event('change', { bubbles: true })); }", selector)
+    assert page.evaluate("() => window.pendingOps") == [
+        {"type": "edge_remove", "from": HUB, "to": "org::Partner 3", "relationship": "partnership"}]
+    # The row stays (unticked) so it can be ticked back; every other row is the same element
+    assert not page.is_checked(selector)
+    replaced = page.evaluate("() => [...document.querySelectorAll('#curationList .curRow')].filter(r => !r.__kept).length")
+    assert replaced == 1
+
+    page.evaluate("(sel) => { const cb = document.querySelector(sel); cb.checked = true; cb.dispatchEvent(new Event('change', { bubbles: true })); }", selector)
+    assert page.evaluate("() => window.pendingOps.length") == 2
+    assert page.evaluate("(hub) => graphStore.findEdges(hub, 'org::Partner 3', 'partnership').length", HUB) == 1
+    assert page.js_errors == []
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Test the projected startup load and on-demand detail columns"""
+import pytest
+
+from conftest import NO_PENDING_OPS
+
+pytestmark = pytest.mark.core
+
+ORG_ID = 'org::Ecorestoration Alliance'
+
+
+def test_startup_skips_detail_columns(page):
+    # Jon Schull has a URL in the sheet, but the initial load leaves it empty in the store
+    assert page.evaluate("() => window.__graph.store.node('person::Jon Schull').url") == ''
+    assert page.evaluate("() => window.__graph.nodes.get('person::Jon Schull').label") == 'Jon Schull'
+
+
+def test_modal_fetches_details(page):
+    page.evaluate("(id) => window.openCurationFor(id)", ORG_ID)
+    page.wait_for_function("() => document.getElementById('curationUrlInput').value === 'https://ecorestorationalliance.org'")
+    # The neighbours' rows came in the same batch
+    assert page.evaluate("() => window.__graph.store.node('person::Jon Schull').url") == 'https://ecorestorationalliance.org'
+    assert page.js_errors == []
+
+
+def test_full_save_keeps_unfetched_columns(signed_in_page, standin):
+    page = signed_in_page
+    before = {r['id']: r for r in standin.rows_as_dicts('nodes')}
+
+    page.evaluate("() => window.openCurationFor('org::Climate Foundation')")
+    page.evaluate("() => { const cb = document.getElementById('sourceToggle'); cb.checked = false; cb.dispatchEvent(new Event('change', { bubbles: true })); }")
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+
+    after = {r['id']: r for r in standin.rows_as_dicts('nodes')}
+    assert after['org::Climate Foundation']['hidden'] == 'true'
+    # Untouched rows keep their detail columns and their timestamps
+    jon = after['person::Jon Schull']
+    assert jon['url'] == before['person::Jon Schull']['url']
+    assert jon['member'] == before['person::Jon Schull']['member']
+    assert jon['updated_at'] == before['person::Jon Schull']['updated_at']
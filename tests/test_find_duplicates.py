@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Test the offline near-duplicate finder (tools/find_duplicates.py)"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from sheets_standin import FIXTURES_DIR
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+import build_snapshot  # noqa: E402
+import find_duplicates  # noqa: E402
+
+pytestmark = pytest.mark.core
+
+
+def test_label_keys():
+    key = find_duplicates.label_key
+    assert key("Eco-Restoration Alliance") == key("Ecorestoration Alliance") == "ecorestorationalliance"
+    assert key("The Savory Institute, Inc.") == key("Savory Institute")
+    assert key("Café & Co-op") == "cafeandcoop"
+    assert key("The") == "the" and key(" - ") == ""
+
+
+def test_blocking_skips_common_grams(monkeypatch):
+    labels = [f"Alliance {i:03d}" for i in range(30)] + ["Regen Network"]
+    index = find_duplicates.LabelIndex(labels)
+    assert [i for i, _ in index.candidates("Alliance 007")][:1] == [7]
+    # With "all"/"lli"/... over the block limit, only the digits can bring a label in
+    monkeypatch.setattr(find_duplicates, "BLOCK_MAX", 10)
+    assert index.candidates("Regen Networks") == [(30, pytest.approx(0.952, abs=1e-3))]
+    assert index.candidates("Alliance 007") == [(7, 1.0)]
+
+
+def test_fixture_merges():
+    node_rows, edge_rows = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    merge, split = find_duplicates.plan_merges(node_rows, edge_rows)
+    # The hand-entered node with a URL is kept; the scraped one's edge already exists there
+    assert (merge["keep"], merge["drop"], merge["score"]) == ("org::Ecorestoration Alliance", "org::Eco-Restoration Alliance", 1.0)
+    assert merge["ops"][-1] == {"type": "update_node", "id": "org::Eco-Restoration Alliance", "hidden": True}
+
+    compound = "org::Biodiversity for Livable Climate,Ecorestoration Alliance"
+    assert split["split"] == compound
+    assert split["into"] == ["org::Biodiversity for Livable Climate", "org::Ecorestoration Alliance"]
+    ops = split["ops"]
+    assert ops[0]["type"] == "node_add" and ops[0]["label"] == "Biodiversity for Livable Climate"
+    assert {"type": "edge_add", "from": "person::Philip Bogdonoff", "to": "org::Ecorestoration Alliance",
+            "relationship": "membership"} in ops
+    assert not any(op["type"] == "edge_add" and compound in (op["from"], op["to"]) for op in ops)
+
+
+def test_people_and_types_are_not_merged():
+    nodes = [
+        {"id": "person::Smith, Jane", "label": "Smith, Jane"},
+        {"id": "person::Jane Smith", "label": "Jane Smith"},
+        {"id": "org::Regen Network", "label": "Regen Network"},
+        {"id": "project::Regen Network", "label": "Regen Network"},
+        {"id": "org::Soil Society", "label": "Soil Society"},
+        {"id": "org::Soil Societies", "label": "Soil Societies", "url": "https://soil.example"},
+    ]
+    edges = [{"source": "person::Jane Smith", "target": "org::Soil Societies", "relationship": "membership", "role": "chair"}]
+    [batch] = find_duplicates.plan_merges(nodes, edges)
+    # Soil Societies has the URL and the edge, so it is kept
+    assert (batch["keep"], batch["drop"]) == ("org::Soil Societies", "org::Soil Society")
+
+
+def test_cli_writes_batches(tmp_path, capsys):
+    out = tmp_path / "merges.json"
+    assert find_duplicates.main(["--csv", str(FIXTURES_DIR), "--out", str(out)]) == 0
+    doc = json.loads(out.read_text())
+    assert doc["format"] == "era-merge-batches" and len(doc["merges"]) == 2
+    assert "merge 'org::Eco-Restoration Alliance'" in capsys.readouterr().out
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Test the columnar graph store and its projection into the vis DataSets"""
+import pytest
+
+pytestmark = pytest.mark.core
+
+HIDDEN_ID = 'org::Fetzer Institute'
+
+
+def test_store_holds_hidden_part_of_graph(page):
+    # 20 node rows plus one auto-healed edge endpoint; Fetzer is curated-hidden
+    counts = page.evaluate("""() => {
+        const g = window.__graph;
+        return {stored: g.store.nodeCount, drawn: g.nodes.length,
+                storedEdges: g.store.edgeRows().length, drawnEdges: g.edges.length};
+    }""")
+    assert counts == {'stored': 21, 'drawn': 20, 'storedEdges': 18, 'drawnEdges': 16}
+    assert page.evaluate("(id) => window.__graph.store.degree(window.__graph.store.nodeRow(id))", HIDDEN_ID) == 2
+
+
+def test_vis_items_carry_only_render_fields(page):
+    keys = page.evaluate("() => Object.keys(window.__graph.nodes.get('org::Climate Foundation')).sort()")
+    assert set(keys) <= {'id', 'label', 'title', 'group', 'state', 'hidden', 'value', 'x', 'y', 'physics', 'fixed'}
+    edge = page.evaluate("() => Object.keys(window.__graph.edges.get()[0]).sort()")
+    assert set(edge) <= {'id', 'from', 'to', 'label', 'hidden'}
+
+
+def test_queries_read_the_store(page):
+    result = page.evaluate("""() => {
+        const s = window.__graph.store;
+        return {
+            byLabel: s.nodeId(s.findByLabel('  Kiss the Ground ')),
+            undirected: s.findEdges('org::Kiss the Ground', 'org::Regen Network', 'partnership', true).length,
+            directed: s.findEdges('org::Kiss the Ground', 'org::Regen Network', 'partnership').length,
+            component: [...s.component(['project::Living Soil Program'])].sort()
+        };
+    }""")
+    assert result['byLabel'] == 'org::Kiss the Ground'
+    assert (result['undirected'], result['directed']) == (1, 0)
+    assert result['component'] == [
+        'org::Kiss the Ground', 'org::Regen Network', 'org::Soil Society',
+        'person::Ana Silva', 'person::Liana Weber', 'project::Living Soil Program',
+    ]
+
+
+def test_adding_nodes_keeps_the_adjacency_index(page):
+    # New nodes are past the CSR's rows and their edges in its tail: both are scanned, nothing is rebuilt
+    result = page.evaluate("""() => {
+        const s = window.__graph.store;
+        const csr = s._adjacency();
+        s.addNode({ id: 'person::New One', label: 'New One' });
+        s.addEdge('person::New One', 'org::Regen Network', { relationship: 'partnership' });
+        return { same: s._adjacency() === csr, neighbours: s.neighbours('person::New One'),
+                 back: s.neighbours('org::Regen Network').includes('person::New One') };
+    }""")
+    assert result == {"same": True, "neighbours": ["org::Regen Network"], "back": True}
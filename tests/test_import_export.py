@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test bulk import (CSV/JSON Lines through the worker) and export (CSV/JSON/GraphML)"""
+import json
+
+import pytest
+
+from conftest import NO_PENDING_OPS
+
+pytestmark = pytest.mark.core
+
+EDGES_CSV = """source,target,relationship,source_type,notes
+Regen Network,Import Person One,advisor,,"met at ""the"" summit, 2025"
+Import Person One,Import Project,partnership,person,
+Import Person One,Import Project,partnership,person,
+Import Project,Import Project,partnership,,
+"""
+
+
+def import_file(page, tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    page.set_input_files("#importFile", str(path))
+    page.wait_for_function("() => !document.getElementById('importBtn').disabled && window.pendingOps.length > 0")
+
+
+def test_csv_import_is_one_batch(signed_in_page, standin, tmp_path):
+    page = signed_in_page
+    before = page.evaluate("() => [window.__graph.nodes.length, window.__graph.edges.length]")
+    page.evaluate("() => { window.__batches = []; window.onQueueOps(ops => window.__batches.push(ops.length)); }")
+    import_file(page, tmp_path, "edges.csv", EDGES_CSV)
+
+    after = page.evaluate("() => [window.__graph.nodes.length, window.__graph.edges.length]")
+    assert after == [before[0] + 2, before[1] + 2]
+    # Names resolve by label (the graph first, then earlier rows); the duplicate row and the self-loop are skipped
+    assert page.evaluate("() => window.__batches") == [4]
+    ops = page.evaluate("() => window.pendingOps")
+    assert [op["type"] for op in ops] == ["node_add", "node_add", "edge_add", "edge_add"]
+    assert ops[2]["from"] == "org::Regen Network" and ops[2]["to"] == "org::Import Person One"
+    assert ops[3]["from"] == "org::Import Person One" and ops[3]["to"] == "org::Import Project"
+
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+    edges = standin.rows_as_dicts("edges")
+    advisor = next(r for r in edges if r["relationship"] == "advisor")
+    assert advisor["notes"] == 'met at "the" summit, 2025'
+    assert any(r["id"] == "org::Import Person One" and r["origin"] == "import" for r in standin.rows_as_dicts("nodes"))
+
+
+def test_jsonl_import_skips_existing(page, tmp_path):
+    lines = [
+        {"kind": "node", "id": "org::Regen Network", "label": "Regen Network"},
+        {"kind": "node", "label": "Import Org", "url": "https://example.org"},
+        {"source": "org::Import Org", "target": "person::Ana Silva", "relationship": "affiliation"},
+        {"source": "person::Ana Silva", "target": "org::Regen Network", "relationship": "affiliation"},
+    ]
+    import_file(page, tmp_path, "graph.jsonl", "\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+    ops = page.evaluate("() => window.pendingOps")
+    assert [op["type"] for op in ops] == ["node_add", "edge_add"]
+    assert page.evaluate("() => graphStore.node('org::Import Org').url") == "https://example.org"
+
+
+@pytest.mark.parametrize("fmt,names", [
+    ("csv", ["-nodes.csv", "-edges.csv"]),
+    ("json", [".json"]),
+    ("graphml", [".graphml"]),
+])
+def test_export(page, fmt, names):
+    files = page.evaluate("""async (fmt) => {
+        const files = await exportGraph(fmt);
+        return Promise.all(files.map(async f => ({ name: f.name, text: await f.blob.text() })));
+    }""", fmt)
+    assert [f["name"][-len(n):] for f, n in zip(files, names)] == names
+    text = files[0]["text"]
+    if fmt == "csv":
+        assert len(text.strip().splitlines()) == 1 + 21
+        assert len(files[1]["text"].strip().splitlines()) == 1 + 18
+        # Detail columns are fetched before exporting (the default load leaves them out)
+        assert "https://ecorestorationalliance.org" in next(line for line in text.splitlines() if "Jon Schull" in line)
+    elif fmt == "json":
+        doc = json.loads(text)
+        assert (len(doc["nodes"]), len(doc["edges"])) == (21, 18)
+        assert next(n for n in doc["nodes"] if n["id"] == "org::Fetzer Institute")["hidden"] is True
+        assert next(n for n in doc["nodes"] if n["id"] == "person::Jon Schull")["url"] == "https://ecorestorationalliance.org"
+    else:
+        assert text.count("<node ") == 21 and text.count("<edge ") == 18
+
+
+def test_export_visible_only_downloads(page):
+    page.check("#exportVisible")
+    page.select_option("#exportFormat", "json")
+    with page.expect_download() as download:
+        page.click("#exportBtn")
+    doc = json.loads(open(download.value.path()).read())
+    assert len(doc["nodes"]) == 20
+    assert all(n["id"] != "org::Fetzer Institute" for n in doc["nodes"])
+    assert len(doc["edges"]) == 16
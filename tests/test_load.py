@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Test that static HTML loads and works without a server"""
 
+import pytest
 from playwright.sync_api import sync_playwright
 import time
 import os
 
+pytestmark = pytest.mark.live
+
 def test_static_load():
     # Get absolute path to index.html
     current_dir = os.path.dirname(os.path.abspath(__file__))
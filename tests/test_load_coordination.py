@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test that Sheets loads are shared, cancelled and applied in order"""
+import pytest
+
+from conftest import NO_PENDING_OPS
+
+pytestmark = pytest.mark.core
+
+STATS = "() => ({...loadCoordinator.stats})"
+
+
+def sheet_reads(page):
+    """Record the Sheets reads the page makes from now on."""
+    seen = []
+    page.on("request", lambda req: seen.append(req.url) if "/v4/spreadsheets/" in req.url else None)
+    return seen
+
+
+def test_reload_during_load_shares_the_read(page):
+    reads = sheet_reads(page)
+    before = page.evaluate(STATS)
+    same = page.evaluate("""async () => {
+        const first = loadDataFromSheets();
+        document.getElementById('refreshBtn').click();
+        const second = loadDataFromSheets();
+        const [a, b] = await Promise.all([first, second]);
+        return a !== null && a === b;
+    }""")
+    assert same
+    page.wait_for_function("() => !loadCoordinator.busy('graph')")
+    after = page.evaluate(STATS)
+    assert after["started"] - before["started"] == 1
+    assert after["joined"] - before["joined"] == 2
+    # The tab list and the header batchGet, then one column window per tab
+    assert len(reads) == 4
+
+
+def test_older_result_never_overwrites_newer(page):
+    applied = page.evaluate("""async () => {
+        const applied = [];
+        const after = (ms, v) => () => new Promise(r => setTimeout(() => r(v), ms));
+        await Promise.all([
+            loadCoordinator.run('slow', after(80, 'old'), d => applied.push(d)),
+            loadCoordinator.run('fast', after(5, 'new'), d => applied.push(d)),
+        ]);
+        return applied;
+    }""")
+    assert applied == ["new"]
+
+
+def test_full_load_cancels_pull(page):
+    result = page.evaluate("""async () => {
+        let release;
+        const held = new Promise(r => { release = r; });
+        const pull = loadCoordinator.run('pull', () => held, () => 'applied');
+        const load = loadDataFromSheets();
+        release({});
+        return { pull: await pull, load: (await load) !== null, busy: loadCoordinator.inFlight.size };
+    }""")
+    assert result == {"pull": None, "load": True, "busy": 0}
+    assert page.evaluate("() => window.__graph.nodes.length") == 20
+
+
+def test_own_save_is_not_pulled_back(signed_in_page):
+    page = signed_in_page
+    page.evaluate("""() => {
+        addGraphEdge('person::Ana Silva', 'org::Regen Network', 'partnership');
+        queueOp({ type: 'edge_add', from: 'person::Ana Silva', to: 'org::Regen Network', relationship: 'partnership' });
+    }""")
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+    # The rows the save stamped still carry the stamps it recorded; the mark itself stays put
+    hwm = page.evaluate("() => localStorage.getItem(HWM_KEY)")
+    pulled = page.evaluate("async () => { const r = await fetchPulledRows(); return [r.reload, r.pulledRows.length]; }")
+    assert pulled == [False, 0]
+    assert page.evaluate("() => localStorage.getItem(HWM_KEY)") == hwm
+
+
+def test_append_after_someone_elses_append(signed_in_page, standin):
+    page = signed_in_page
+    remote = ["person::Jon Schull", "org::Commonland", "partnership", "", "", "",
+              "2025-09-02T00:00:00.000Z", "2025-09-02T00:00:00.000Z"]
+    standin.append("edges!A1", [remote])
+    saved = page.evaluate("""async () => {
+        addGraphEdge('person::Ana Silva', 'org::Regen Network', 'partnership');
+        queueOp({ type: 'edge_add', from: 'person::Ana Silva', to: 'org::Regen Network', relationship: 'partnership' });
+        return (await saveDataToSheets({ incremental: true })).ok;
+    }""")
+    assert saved
+    # Our row is recorded where the append put it, after the remote row
+    assert page.evaluate("() => [sheetRows.edges.keys[18], sheetRows.edges.keys[19]]") == [
+        None, "person::Ana Silva|org::Regen Network|partnership"]
+    changed = page.evaluate("async () => (await fetchPulledRows()).changed.edges.map(([i, row]) => [i, row.source])")
+    assert changed == [[18, "person::Jon Schull"]]
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Test that a Sheets load is built in load_worker.js, and the in-page fallback"""
+import pytest
+
+pytestmark = pytest.mark.core
+
+# What a load leaves behind: store and drawn counts, the recorded sheet rows, the adjacency index
+LOAD_STATE = """() => ({
+    counts: [graphStore.nodeCount, graphStore.edgeCount, window.__graph.nodes.length, window.__graph.edges.length],
+    keys: [sheetRows.nodes.keys, sheetRows.edges.keys],
+    sigs: [...sheetRows.nodes.byKey.values()].map(r => r.sig),
+    degree: graphStore.degree(graphStore.nodeRow('org::Regen Network')),
+    csr: !!graphStore.csr
+})"""
+
+
+def test_rows_are_built_in_the_worker(page):
+    assert any(w.url.endswith("/load_worker.js") for w in page.workers)
+    loaded = page.evaluate(LOAD_STATE)
+    # 20 node rows plus one auto-healed node, 18 edges; Fetzer is hidden
+    assert loaded["counts"] == [21, 18, 20, 16]
+    assert len(loaded["keys"][0]) == 20 and len(loaded["keys"][1]) == 18
+    assert loaded["csr"]
+    assert page.evaluate("() => graphStore.findRows(r => graphStore.nodeField(r, 'origin') === 'auto-healed').length") == 1
+
+    # A reload with the page's own row parsing broken still succeeds: the page never parses a row
+    page.evaluate("() => { window.nodeFromRow = window.edgeFromRow = () => { throw new Error('parsed in the page'); }; }")
+    assert page.evaluate("() => loadDataFromSheets()") == {"nodes": 21, "edges": 18}
+    assert page.evaluate(LOAD_STATE) == loaded
+
+
+def test_in_page_fallback_matches_worker(page):
+    loaded = page.evaluate(LOAD_STATE)
+    page.evaluate("() => { loadWorker = false; }")
+    assert page.evaluate("() => loadDataFromSheets()") == {"nodes": 21, "edges": 18}
+    assert page.evaluate(LOAD_STATE) == loaded
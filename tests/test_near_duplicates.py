@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test the near-duplicate check before the quick editor creates a node, and importing merge batches"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import NO_PENDING_OPS
+from sheets_standin import FIXTURES_DIR
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+import build_snapshot  # noqa: E402
+import find_duplicates  # noqa: E402
+
+pytestmark = pytest.mark.core
+
+EDGE_ADDS = "() => window.pendingOps.filter(op => op.type === 'edge_add').map(op => [op.from, op.to])"
+
+
+def add_edge(page, from_label, to_label):
+    page.fill("#qeFrom", from_label)
+    page.fill("#qeTo", to_label)
+    page.click("#qeAdd")
+    page.wait_for_function("() => window.pendingOps.length > 0")
+
+
+def test_existing_node_is_offered(page):
+    prompts = []
+
+    def answer(dialog):
+        prompts.append(dialog.message)
+        dialog.accept()
+
+    page.on("dialog", answer)
+    nodes = page.evaluate("() => graphStore.nodeCount")
+    add_edge(page, "Ana Silva", "The Eco Restoration Alliance, Inc.")
+    assert len(prompts) == 1 and '"Ecorestoration Alliance"' in prompts[0]
+    assert page.evaluate(EDGE_ADDS) == [["person::Ana Silva", "org::Ecorestoration Alliance"]]
+    assert page.evaluate("() => graphStore.nodeCount") == nodes
+
+
+def test_declining_creates_the_node(page):
+    page.on("dialog", lambda dialog: dialog.dismiss())
+    add_edge(page, "Ana Silva", "Regen Networks")
+    assert page.evaluate(EDGE_ADDS) == [["person::Ana Silva", "org::Regen Networks"]]
+    # The new node is indexed on the next lookup
+    assert page.evaluate("() => duplicateIndex.candidates('Regen Networks').map(c => graphStore.nodeId(c.row))") == [
+        "org::Regen Networks", "org::Regen Network"]
+
+
+def test_import_merge_batches(signed_in_page, standin, tmp_path):
+    page = signed_in_page
+    node_rows, edge_rows = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    path = tmp_path / "merges.json"
+    path.write_text(json.dumps({"merges": find_duplicates.plan_merges(node_rows, edge_rows)}))
+    page.set_input_files("#importFile", str(path))
+    page.wait_for_function("() => !document.getElementById('importBtn').disabled && window.pendingOps.length > 0")
+
+    assert page.evaluate("() => window.__graph.hidden.has('org::Eco-Restoration Alliance')")
+    assert sorted(page.evaluate("() => graphStore.neighbours('person::Philip Bogdonoff')")) == [
+        "org::Biodiversity for Livable Climate", "org::Ecorestoration Alliance"]
+
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+    hidden = {r["id"] for r in standin.rows_as_dicts("nodes") if r["hidden"] == "true"}
+    assert {"org::Eco-Restoration Alliance", "org::Biodiversity for Livable Climate,Ecorestoration Alliance"} <= hidden
+    assert {"source": "person::Philip Bogdonoff", "target": "org::Biodiversity for Livable Climate"} in [
+        {"source": r["source"], "target": r["target"]} for r in standin.rows_as_dicts("edges")]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Test merging personal sheets into the graph and switching between views"""
+import json
+
+import pytest
+
+from conftest import NO_PENDING_OPS, open_graph
+
+pytestmark = pytest.mark.core
+
+PERSONAL_ID = "personal-1"
+PERSONAL_TABS = {
+    "nodes": [
+        ["id", "label", "private"],
+        ["org::Regen Network", "Regen Network", ""],
+        ["person::Me", "Me", ""],
+        ["person::Secret", "Secret", "TRUE"],
+    ],
+    "edges": [
+        ["source", "target", "relationship", "private"],
+        ["person::Me", "org::Regen Network", "affiliation", ""],
+        ["person::Secret", "person::Me", "friend", "true"],
+    ],
+}
+
+DRAWN = "() => [window.__graph.nodes.length, window.__graph.edges.length]"
+DRAWN_IDS = "() => window.__graph.nodes.getIds()"
+
+
+@pytest.fixture
+def merged_page(context, standin):
+    standin.add_spreadsheet(PERSONAL_ID, PERSONAL_TABS)
+    return open_graph(context, signed_in=True, local_storage={"era_personal_sheets": json.dumps([PERSONAL_ID])})
+
+
+def test_views_switch_without_reading(merged_page, standin):
+    page = merged_page
+    # Fixture graph (20 drawn nodes, 16 edges) plus Me and its edge; Secret is private
+    assert page.evaluate(DRAWN) == [21, 17]
+    assert "person::Secret" not in page.evaluate(DRAWN_IDS)
+    regen = "() => graphStore.nodeSource[graphStore.nodeRow('org::Regen Network')]"
+    assert page.evaluate(regen) == 0b11
+
+    reads = standin.stats["reads"]
+    page.select_option("#viewSelect", "personal")
+    assert sorted(page.evaluate(DRAWN_IDS)) == ["org::Regen Network", "person::Me", "person::Secret"]
+    assert page.evaluate(DRAWN) == [3, 2]
+    page.select_option("#viewSelect", "global")
+    assert page.evaluate(DRAWN) == [20, 16]
+    page.select_option("#viewSelect", "merged")
+    assert page.evaluate(DRAWN) == [21, 17]
+    assert standin.stats["reads"] == reads
+
+
+def test_view_is_remembered(merged_page):
+    page = merged_page
+    page.select_option("#viewSelect", "global")
+    page.reload()
+    page.wait_for_function("() => window.__graph.nodes.length === 20")
+    assert page.input_value("#viewSelect") == "global"
+
+
+def test_saves_only_write_the_primary_sheet(merged_page, standin):
+    page = merged_page
+    page.evaluate("""() => {
+        addGraphEdge('person::Me', 'org::Commonland', 'partnership');
+        addGraphEdge('person::Secret', 'org::Commonland', 'partnership');
+        updateGraphNode('org::Regen Network', { url: 'https://regen.example' });
+        queueOp({ type: 'update_node', id: 'org::Regen Network', url: 'https://regen.example' });
+    }""")
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+    ids = [r["id"] for r in standin.rows_as_dicts("nodes")]
+    # Me was connected into the global graph, so it is published; the private node never is
+    assert "person::Me" in ids and "person::Secret" not in ids
+    edges = standin.rows_as_dicts("edges")
+    assert not any("person::Secret" in (e["source"], e["target"]) for e in edges)
+    assert standin.spreadsheets[PERSONAL_ID].rows_as_dicts("nodes")[1] == {"id": "person::Me", "label": "Me", "private": ""}
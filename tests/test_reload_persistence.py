@@ -1,33 +1,58 @@
 #!/usr/bin/env python3
 """Test that hidden state persists after browser reload"""
-from playwright.sync_api import sync_playwright
-import time
-
-def test_reload():
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=300)
-        page = browser.new_page()
-        
-        print("1. Loading page...")
-        page.goto("http://127.0.0.1:8002/")
-        page.wait_for_selector("#network")
-        page.wait_for_function("() => window.__graph && window.__graph.nodes")
-        
-        print("2. Checking if Fetzer Institute is hidden...")
-        fetzer_node = page.evaluate("""() => {
-            const node = window.__graph.nodes.get('org::Fetzer Institute');
-            return node ? {hidden: node.hidden === true, label: node.label} : null;
-        }""")
-        
-        print(f"   Fetzer Institute: {fetzer_node}")
-        
-        if fetzer_node and fetzer_node['hidden']:
-            print("✅ SUCCESS: Hidden state persisted after reload")
-        else:
-            print("❌ FAIL: Hidden state did NOT persist")
-        
-        time.sleep(3)
-        browser.close()
-
-if __name__ == "__main__":
-    test_reload()
+import pytest
+
+from conftest import GRAPH_LOADED, NO_PENDING_OPS
+
+pytestmark = pytest.mark.core
+
+
+def node_hidden(page, node_id):
+    """True when the node is flagged hidden (in the network or in the hidden node store)."""
+    return page.evaluate(
+        "(id) => { const n = window.__graph.nodes.get(id) || window.__graph.hidden.get(id); return n ? n.hidden === true : null; }",
+        node_id,
+    )
+
+
+def test_hidden_from_sheet(page):
+    # Fetzer Institute is marked hidden in the fixture sheet: it is kept out of the network
+    assert node_hidden(page, 'org::Fetzer Institute') is True
+    assert page.evaluate("() => window.__graph.nodes.get('org::Fetzer Institute')") is None
+
+
+def test_restore_hidden_connection(signed_in_page, standin):
+    page = signed_in_page
+    hidden_id = 'org::Fetzer Institute'
+    source = page.evaluate(
+        "(id) => { const e = hiddenEdgesOf(id)[0]; return e ? (e.from === id ? e.to : e.from) : null; }", hidden_id
+    )
+    assert source is not None, "fixture should connect a visible node to the hidden org"
+
+    # The visible neighbour's modal lists the hidden connection; ticking it restores the node
+    page.evaluate("(id) => window.openCurationFor(id)", source)
+    selector = f'#curationList input[type=checkbox][data-restore-id="{hidden_id}"]'
+    page.wait_for_selector(selector)
+    page.evaluate("(sel) => { const cb = document.querySelector(sel); cb.checked = true; cb.dispatchEvent(new Event('change', { bubbles: true })); }", selector)
+    assert page.evaluate("(id) => window.__graph.nodes.get(id).hidden === false && !window.__graph.hidden.has(id)", hidden_id)
+    assert page.evaluate("(id) => window.__graph.edges.get().some(e => e.from === id || e.to === id)", hidden_id)
+
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+    row = next(r for r in standin.rows_as_dicts('nodes') if r['id'] == hidden_id)
+    assert row['hidden'] == ''
+
+
+def test_reload(signed_in_page):
+    page = signed_in_page
+    node_id = 'org::Climate Foundation'
+    assert node_hidden(page, node_id) is False
+
+    page.evaluate("(id) => window.openCurationFor(id)", node_id)
+    page.evaluate("() => { const cb = document.getElementById('sourceToggle'); cb.checked = false; cb.dispatchEvent(new Event('change', { bubbles: true })); }")
+    page.click("#qeSaveTop")
+    page.wait_for_function(NO_PENDING_OPS)
+
+    page.reload()
+    page.wait_for_function(GRAPH_LOADED)
+    assert node_hidden(page, node_id) is True
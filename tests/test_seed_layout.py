@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Test the seeded layout the graph starts from, and where new nodes are placed"""
+import math
+
+import pytest
+
+pytestmark = pytest.mark.core
+
+# Seed positions of the drawn graph, with each drawn node's type and drawn neighbours
+SEED = """() => {
+    const rows = graphStore.findRows(isProjected);
+    const positions = seedLayout(graphStore, rows, graphStore.edgeRows().filter(edgeProjected));
+    const drawn = new Set(rows.map(r => graphStore.nodeId(r)));
+    const nodes = {};
+    rows.forEach(r => {
+        const id = graphStore.nodeId(r);
+        nodes[id] = { ...positions[id], type: graphStore.nodeTypeName(r),
+                      neighbours: [...new Set(graphStore.neighbours(id))].filter(n => n !== id && drawn.has(n)) };
+    });
+    return { nodes, ids: Object.keys(positions) };
+}"""
+BAND = {"organization": 0, "project": 0.3, "person": 0.6}
+RING_GAP = 150
+
+
+def distance(a, b):
+    return math.hypot(a["x"] - b["x"], a["y"] - b["y"])
+
+
+def test_drawn_graph_is_seeded_around_hubs(page):
+    seed = page.evaluate(SEED)
+    nodes = seed["nodes"]
+    assert sorted(seed["ids"]) == sorted(page.evaluate("() => window.__graph.nodes.getIds()"))
+    points = list(nodes.values())
+    assert min(distance(a, b) for i, a in enumerate(points) for b in points[i + 1:]) >= 50
+
+    # The best-connected node is a hub: its neighbours sit on the first ring, in their type's band
+    hub = max(nodes, key=lambda id: (len(nodes[id]["neighbours"]), -seed["ids"].index(id)))
+    rings = {round(distance(nodes[hub], nodes[other]) - BAND[nodes[other]["type"]] * RING_GAP, 6)
+             for other in nodes[hub]["neighbours"]}
+    assert len(rings) == 1 and rings.pop() >= RING_GAP
+
+
+def test_seed_is_what_the_network_starts_from(page):
+    # A cold load (no snapshot, no other tab) draws every node at its seed position
+    drawn = page.evaluate("() => window.__graph.nodes.get().map(n => [n.id, n.x, n.y])")
+    seed = page.evaluate(SEED)["nodes"]
+    assert all(x == seed[id]["x"] and y == seed[id]["y"] for id, x, y in drawn)
+
+
+def test_new_node_goes_in_the_widest_gap(page):
+    placed = page.evaluate("""() => [
+        placeNear({x: 0, y: 0}, [], 'organization'),
+        placeNear({x: 10, y: 10}, [{x: 20, y: 10}, {x: 10, y: 20}], 'person')
+    ]""")
+    assert placed[0] == pytest.approx({"x": 0, "y": -RING_GAP})
+    # Neighbours to the right and below leave the widest gap up and to the left
+    r = RING_GAP * (1 + BAND["person"]) / math.sqrt(2)
+    assert placed[1] == pytest.approx({"x": 10 - r, "y": 10 - r})
+
+    page.check('input[name="toType"][value="person"]')
+    page.fill("#qeFrom", "Regen Network")
+    page.fill("#qeTo", "Brand New Contact")
+    page.click("#qeAdd")
+    page.wait_for_function("() => !!window.__graph.nodes.get('person::Brand New Contact')")
+    start = page.evaluate("() => { const n = window.__graph.nodes.get('person::Brand New Contact'); return [n.x, n.y]; }")
+    assert all(isinstance(v, (int, float)) for v in start)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test the service worker's precache manifest and its caching in the browser"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import GRAPH_LOADED, open_graph
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+import build_manifest  # noqa: E402
+
+CONTROLLED = "() => navigator.serviceWorker.controller !== null"
+
+
+@pytest.mark.core
+def test_sw_manifest_is_current():
+    # Fails after editing a precached file without running tools/build_manifest.py
+    assert build_manifest.main(["--check"]) == 0
+
+
+@pytest.mark.core
+def test_version_follows_file_contents(tmp_path):
+    for name in build_manifest.APP_FILES:
+        shutil.copy(build_manifest.REPO_ROOT / name, tmp_path / name)
+    version, precache = build_manifest.build_manifest(tmp_path)
+    assert precache[-1].startswith("https://unpkg.com/vis-network@")
+
+    with open(tmp_path / "graph.js", "a") as f:
+        f.write("\n// changed\n")
+    assert build_manifest.build_manifest(tmp_path)[0] != version
+
+    sw = build_manifest.SW_PATH.read_text()
+    updated = build_manifest.update_sw(sw, "feedfacecafe", precache)
+    assert "const VERSION = 'feedfacecafe';" in updated
+    assert updated.count("// ---- end manifest ----") == 1
+
+
+@pytest.mark.core
+def test_unpinned_vis_is_refused(tmp_path):
+    html = (build_manifest.REPO_ROOT / "index.html").read_text()
+    (tmp_path / "index.html").write_text(html.replace("vis-network@9.1.9/", "vis-network/"))
+    with pytest.raises(ValueError, match="not pinned"):
+        build_manifest.vis_url(tmp_path)
+
+
+@pytest.mark.core
+def test_new_build_does_not_take_over_open_pages():
+    # Open pages keep fetching from their build's cache until they close
+    sw = build_manifest.SW_PATH.read_text()
+    assert "skipWaiting()" not in sw
+    assert "clients.claim()" not in sw
+
+
+@pytest.mark.additional
+def test_repeat_visit_served_from_cache(context):
+    page = open_graph(context, local_storage={"use_sw": "true"})
+    page.wait_for_function("() => navigator.serviceWorker.ready.then(() => true)")
+    page.reload()
+    page.wait_for_function(CONTROLLED)
+    page.wait_for_function(GRAPH_LOADED)
+    cached = page.evaluate("""async () => {
+        const names = await caches.keys();
+        const shell = await caches.open(names.find(n => n.startsWith('era-shell-')));
+        return (await shell.keys()).map(r => r.url.split('/').pop());
+    }""")
+    assert {"index.html", "graph.js", "graph_store.js", "tab_sync.js", "vis-network.min.js"} <= set(cached)
+
+    # The shell no longer needs the network
+    context.set_offline(True)
+    page.reload()
+    page.wait_for_selector("#toolbar")
+    assert page.evaluate("() => typeof vis !== 'undefined' && typeof graphStore !== 'undefined'")
@@ -4,10 +4,13 @@ Test Google Sheets API browser integration
 Tests the functions in /helpful that will be integrated into index.html
 """
 
+import pytest
 from playwright.sync_api import sync_playwright
 import time
 import os
 
+pytestmark = pytest.mark.live
+
 def test_sheets_api():
     # Get path to index.html
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -20,7 +23,7 @@ def test_sheets_api():
     print('='*70)
     
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
+        browser = p.chromium.launch(headless=True)
         page = browser.new_page()
         
         # Collect console messages and errors
@@ -206,10 +209,6 @@ def test_sheets_api():
             print("   Need to add code from /helpful folder")
             success = False
         
-        print("\n" + "="*70)
-        print("Press Enter to close browser...")
-        input()
-        
         browser.close()
         return success
 
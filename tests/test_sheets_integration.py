@@ -10,6 +10,7 @@ Tests actual user workflows:
 Runs with local HTTP server (required for Google API).
 """
 
+import pytest
 from playwright.sync_api import sync_playwright
 import http.server
 import socketserver
@@ -17,6 +18,8 @@ import threading
 import time
 import os
 
+pytestmark = pytest.mark.live
+
 PORT = 8123
 TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Test the local Sheets stand-in the browser tests run against"""
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from sheets_standin import SheetsStandIn, parse_range, start_standin
+
+pytestmark = pytest.mark.core
+
+
+def test_parse_range():
+    assert parse_range("nodes!A:Z") == ("nodes", 0, 0, 25, None)
+    assert parse_range("nodes!A1") == ("nodes", 0, 0, 0, 0)
+    assert parse_range("edges!J2:J") == ("edges", 9, 1, 9, None)
+    assert parse_range("edges!A5:AB9") == ("edges", 0, 4, 27, 8)
+    assert parse_range("'my tab'!B3:C4") == ("my tab", 1, 2, 2, 3)
+
+
+def test_fixture_rows():
+    sheet = SheetsStandIn()
+    nodes = sheet.rows_as_dicts("nodes")
+    assert nodes[0]["id"] == "person::Philip Bogdonoff"
+    assert any(n["hidden"] == "true" for n in nodes)
+    assert sheet.read("nodes!A1:B1") == [["id", "label"]]
+
+
+def test_update_then_trim_tail():
+    sheet = SheetsStandIn()
+    sheet.write("edges!A1", [["source", "target"], ["a", "b"]])
+    sheet.clear("edges!A3:Z")
+    assert sheet.read("edges!A:B") == [["source", "target"], ["a", "b"]]
+    assert len(sheet.read("edges!A:Z")) == 2
+
+
+def test_append_after_last_row():
+    sheet = SheetsStandIn()
+    count = len(sheet.read("edges!A:Z"))
+    sheet.append("edges!A1", [["x", "y", "partnership"]])
+    rows = sheet.read("edges!A:Z")
+    assert len(rows) == count + 1
+    assert rows[-1] == ["x", "y", "partnership"]
+
+
+def test_http_round_trip_and_quota():
+    server, sheet, url = start_standin(quota_per_minute=1)
+    try:
+        base = url + "/v4/spreadsheets/test/values/"
+        with urllib.request.urlopen(base + "nodes!A1:B1") as resp:
+            assert json.load(resp)["values"] == [["id", "label"]]
+
+        def put():
+            req = urllib.request.Request(base + "nodes!A2?valueInputOption=RAW", method="PUT",
+                                         data=json.dumps({"values": [["person::X", "X"]]}).encode())
+            return urllib.request.urlopen(req)
+
+        put().close()
+        assert sheet.read("nodes!A2:B2") == [["person::X", "X"]]
+        with pytest.raises(urllib.error.HTTPError) as err:
+            put()
+        assert err.value.code == 429
+        assert sheet.stats["quota_errors"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_add_sheet_and_tab_list():
+    server, sheet, url = start_standin()
+    try:
+        def post(body):
+            req = urllib.request.Request(url + "/v4/spreadsheets/test:batchUpdate", method="POST",
+                                         data=json.dumps(body).encode())
+            return urllib.request.urlopen(req)
+
+        post({"requests": [{"addSheet": {"properties": {"title": "edges_001"}}}]}).close()
+        with urllib.request.urlopen(url + "/v4/spreadsheets/test") as resp:
+            titles = [s["properties"]["title"] for s in json.load(resp)["sheets"]]
+        assert "edges_001" in titles and sheet.read("edges_001!A:Z") == []
+        with pytest.raises(urllib.error.HTTPError) as err:
+            post({"requests": [{"addSheet": {"properties": {"title": "edges"}}}]})
+        assert err.value.code == 400
+    finally:
+        server.shutdown()
+
+
+def test_other_spreadsheets_by_id():
+    server, sheet, url = start_standin()
+    try:
+        personal = sheet.add_spreadsheet("personal-1", {"nodes": [["id", "label", "private"], ["person::Me", "Me", ""]]})
+        with urllib.request.urlopen(url + "/v4/spreadsheets/personal-1") as resp:
+            assert [s["properties"]["title"] for s in json.load(resp)["sheets"]] == ["nodes"]
+        with urllib.request.urlopen(url + "/v4/spreadsheets/personal-1/values/nodes!A2:B2") as resp:
+            assert json.load(resp)["values"] == [["person::Me", "Me"]]
+        # Any other id is the fixture spreadsheet
+        with urllib.request.urlopen(url + "/v4/spreadsheets/test/values/nodes!A1:B1") as resp:
+            assert json.load(resp)["values"] == [["id", "label"]]
+        assert personal.rows_as_dicts("nodes") == [{"id": "person::Me", "label": "Me", "private": ""}]
+        assert sheet.stats["reads"] == 3
+    finally:
+        server.shutdown()
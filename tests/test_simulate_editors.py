@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the concurrent-editor simulator's op streams, lost-update check and CLI"""
+import json
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from simulate_editors import find_lost_updates, generate_ops, percentile
+
+NODE_IDS = ["org::Regen Network", "org::Kiss the Ground", "person::Ana Silva"]
+
+
+@pytest.mark.core
+def test_op_streams_are_seeded_and_self_contained():
+    ops = generate_ops(random.Random(7), 3, 40, NODE_IDS)
+    assert ops == generate_ops(random.Random(7), 3, 40, NODE_IDS)
+    assert len({op["sim_id"] for op in ops}) == 40
+    added = set()
+    for op in ops:
+        key = (op.get("from"), op.get("to"), op.get("relationship"))
+        if op["type"] == "edge_add":
+            assert key not in added and op["to"].startswith("person::Sim Contact e3-")
+            added.add(key)
+        elif op["type"] == "edge_remove":
+            # Editors only remove edges they added earlier
+            assert key in added
+            added.discard(key)
+        else:
+            assert op["id"] in NODE_IDS and op["url"].endswith(op["sim_id"])
+
+
+@pytest.mark.core
+def test_percentile():
+    assert percentile([], 50) is None
+    assert percentile([30, 10, 20], 50) == 20
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([5], 90) == 5
+
+
+@pytest.mark.core
+def test_find_lost_updates():
+    add = {"type": "edge_add", "from": "a", "to": "b", "relationship": "partnership", "sim_id": "e0-0"}
+    gone = {"type": "edge_add", "from": "a", "to": "c", "relationship": "partnership", "sim_id": "e0-1"}
+    remove = {"type": "edge_remove", "from": "a", "to": "c", "relationship": "partnership", "sim_id": "e0-2"}
+    back = {"type": "edge_add", "from": "a", "to": "d", "relationship": "funding", "sim_id": "e1-0"}
+    back_removed = {"type": "edge_remove", "from": "a", "to": "d", "relationship": "funding", "sim_id": "e1-1"}
+    url_old = {"type": "update_node", "id": "a", "url": "https://example.org/sim/e0-3", "sim_id": "e0-3"}
+    url_new = {"type": "update_node", "id": "a", "url": "https://example.org/sim/e1-2", "sim_id": "e1-2"}
+    url_clobbered = {"type": "update_node", "id": "b", "url": "https://example.org/sim/e1-3", "sim_id": "e1-3"}
+    acked = [(1, add), (2, gone), (3, remove), (4, back), (5, back_removed),
+             (6, url_old), (7, url_new), (8, url_clobbered)]
+    nodes = [{"id": "a", "url": url_new["url"]}, {"id": "b", "url": ""}]
+    edges = [
+        {"source": "a", "target": "b", "relationship": "partnership"},
+        # Removed by its editor, then written back by someone's full rewrite
+        {"source": "a", "target": "d", "relationship": "funding"},
+    ]
+    lost = find_lost_updates(acked, nodes, edges)
+    assert sorted(op["sim_id"] for op in lost) == ["e1-1", "e1-3"]
+
+
+@pytest.mark.additional
+def test_small_simulation(tmp_path):
+    pytest.importorskip("playwright.async_api")
+    out = tmp_path / "report.json"
+    script = Path(__file__).resolve().parent / "simulate_editors.py"
+    done = subprocess.run(
+        [sys.executable, str(script), "--editors", "2", "--ops", "4", "--save-every", "2",
+         "--think-ms", "20", "--timeout-ms", "30000", "--json", str(out)],
+        capture_output=True, text=True, timeout=180,
+    )
+    assert done.returncode == 0, done.stderr
+    report = json.loads(out.read_text())
+    assert report["errors"] == []
+    full = report["modes"]["full"]
+    assert full["saves"] >= 2 and full["failed"] == 0
+    assert full["latency_ms"]["p50"] > 0 and full["bytes_per_save"]["p50"] > 0
+    assert report["sheet"]["writes"] >= 2 * full["saves"]
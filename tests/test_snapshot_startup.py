@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Test drawing the prebuilt snapshot before the Sheets load finishes"""
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import GRAPH_LOADED
+from sheets_standin import FIXTURES_DIR
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+import build_snapshot  # noqa: E402
+
+pytestmark = pytest.mark.additional
+
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    node_rows, edge_rows = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    snapshot, _ = build_snapshot.build_snapshot(node_rows, edge_rows, iterations=50)
+    path = tmp_path / "snapshot.json.gz"
+    build_snapshot.write_snapshot(snapshot, path)
+    return path
+
+
+def open_with_snapshot(context, snapshot_file, hold_sheets):
+    context.route("**/snapshot.json.gz", lambda route: route.fulfill(path=str(snapshot_file)))
+    held = []
+    if hold_sheets:
+        # Leave the Sheets reads unanswered so only the snapshot can draw the graph
+        context.route("https://sheets.googleapis.com/**", held.append)
+    page = context.new_page()
+    page.goto("/")
+    page.wait_for_function(GRAPH_LOADED)
+    return page, held
+
+
+def test_snapshot_draws_before_sheets(context, snapshot_file):
+    page, held = open_with_snapshot(context, snapshot_file, hold_sheets=True)
+    assert held
+    state = page.evaluate("""() => ({
+        source: graphSource,
+        drawn: window.__graph.nodes.length,
+        hiddenDrawn: !!window.__graph.nodes.get('org::Fetzer Institute'),
+        positioned: window.__graph.nodes.get('org::Climate Foundation').x !== undefined,
+    })""")
+    assert state == {'source': 'snapshot', 'drawn': 20, 'hiddenDrawn': False, 'positioned': True}
+    assert page.evaluate("() => runSave()")["ok"] is False
+
+
+def test_sheets_replace_snapshot(context, snapshot_file):
+    page, _ = open_with_snapshot(context, snapshot_file, hold_sheets=False)
+    page.wait_for_function("() => graphSource === 'sheets'")
+    counts = page.evaluate("() => [window.__graph.nodes.length, window.__graph.edges.length]")
+    assert counts == [20, 16]
+    # Details only come from the sheet
+    assert page.evaluate("() => window.__graph.store.node('org::Climate Foundation').updated_at") != ''
+
+
+def test_undrawable_snapshot_falls_back_to_sheets(context, tmp_path):
+    node_rows, edge_rows = build_snapshot.read_csv_dir(FIXTURES_DIR)
+    snapshot, _ = build_snapshot.build_snapshot(node_rows, edge_rows, iterations=50)
+    # An edge pointing past the node table: addEdge throws part-way through the draw
+    snapshot["edges"]["target"][0] = len(snapshot["nodes"]["id"]) + 5
+    path = tmp_path / "snapshot.json.gz"
+    build_snapshot.write_snapshot(snapshot, path)
+    page, _ = open_with_snapshot(context, path, hold_sheets=False)
+    page.wait_for_function("() => graphSource === 'sheets'")
+    counts = page.evaluate("() => [window.__graph.nodes.length, window.__graph.edges.length]")
+    assert counts == [20, 16]
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test the soak harness's action plans and growth check, and run a short soak"""
+import random
+
+import pytest
+
+from soak import DEFAULT_LIMITS, measure_growth, over_limits, plan_actions, run_soak
+
+NODES = [("org::Regen Network", "Regen Network"), ("person::Ana Silva", "Ana Silva"),
+         ("org::Kiss the Ground", "Kiss the Ground")]
+RELATIONSHIPS = ["partnership", "affiliation"]
+
+
+def sample(heap_mb, dom_nodes=1000, listeners=50, documents=1):
+    return {"heap_bytes": heap_mb * 2**20, "dom_nodes": dom_nodes, "listeners": listeners, "documents": documents}
+
+
+@pytest.mark.core
+def test_plans_are_seeded_and_use_the_vocabulary():
+    actions = plan_actions(random.Random(5), 3, 200, NODES, RELATIONSHIPS)
+    assert actions == plan_actions(random.Random(5), 3, 200, NODES, RELATIONSHIPS)
+    assert {a["kind"] for a in actions} == {"edit", "new_node", "undo", "filter", "modal"}
+    labels = {label for _, label in NODES}
+    for n, a in enumerate(actions):
+        if a["kind"] == "edit":
+            assert {a["from"], a["to"]} <= labels and a["from"] != a["to"]
+        elif a["kind"] == "new_node":
+            assert a["from"] in labels and a["to"] == f"Soak Contact 3-{n}"
+        elif a["kind"] == "filter":
+            assert any(a["query"] in label.lower() for label in labels)
+        elif a["kind"] == "modal":
+            assert a["id"] in dict(NODES)
+
+
+@pytest.mark.core
+def test_growth_is_measured_after_warmup_and_ignores_spikes():
+    # Warm-up allocations and a transient spike in the tail don't count
+    steady = [sample(10), sample(14), sample(15), sample(15.5), sample(40), sample(15.2)]
+    growth = measure_growth(steady, warmup=2, tail=3)
+    assert growth["heap_bytes"] == pytest.approx(0.2 * 2**20)
+    assert over_limits(growth, DEFAULT_LIMITS) == []
+
+    leaking = [sample(10, 1000 + 300 * k, 50 + 40 * k) for k in range(8)]
+    growth = measure_growth(leaking, warmup=2, tail=3)
+    assert growth["dom_nodes"] == 900 and growth["listeners"] == 120
+    assert over_limits(growth, DEFAULT_LIMITS) == [
+        "dom_nodes grew by 900 (limit 500)", "listeners grew by 120 (limit 100)"]
+
+    assert measure_growth(steady[:3], warmup=2) is None
+    assert over_limits(None, DEFAULT_LIMITS) == []
+
+
+@pytest.mark.soak
+def test_short_soak(page):
+    result = run_soak(page, cycles=8, actions_per_cycle=25, seed=3)
+    assert result["errors"] == []
+    assert len(result["samples"]) == 9
+    assert over_limits(measure_growth(result["samples"]), DEFAULT_LIMITS) == []
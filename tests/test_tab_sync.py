@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Test that tabs of one sheet share the loaded graph and the sheet's row index"""
+import pytest
+
+from conftest import open_graph
+
+pytestmark = pytest.mark.core
+
+ROW_INDEX = "() => [sheetRows.nodes.keys, sheetRows.edges.keys]"
+
+
+def test_follower_adopts_row_index_after_leader_saves(context):
+    leader = open_graph(context, signed_in=True)
+    leader.wait_for_function("() => sheetsApiReady === true")
+    follower = open_graph(context, signed_in=True)
+    assert follower.evaluate("() => window.tabSync.isLeader") is False
+    assert follower.evaluate(ROW_INDEX) == leader.evaluate(ROW_INDEX)
+
+    # An append from the leader grows the sheet; the follower's next write must start after it
+    saved = leader.evaluate("""async () => {
+        addGraphEdge('person::Ana Silva', 'org::Commonland', 'partnership');
+        queueOp({ type: 'edge_add', from: 'person::Ana Silva', to: 'org::Commonland', relationship: 'partnership' });
+        return (await saveDataToSheets({ incremental: true })).ok;
+    }""")
+    assert saved
+    follower.wait_for_function("() => sheetRows.edges.keys.length === 19")
+    assert follower.evaluate(ROW_INDEX) == leader.evaluate(ROW_INDEX)
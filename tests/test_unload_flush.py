@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test the keepalive flush of autosaved edits when the page unloads"""
+import json
+
+import pytest
+
+from conftest import open_graph
+
+pytestmark = pytest.mark.core
+
+UNLOAD_OPS_KEY = "era_unload_ops:1cR5X2xFSGffivfsMjyHDDeDJQv6R0kQpVUJsEJ2_1yY"
+EDGE = ("person::Ana Silva", "org::Commonland", "partnership")
+EDGE_OP = {"type": "edge_add", "from": EDGE[0], "to": EDGE[1], "relationship": EDGE[2]}
+STAMP = "2025-09-02T00:00:00.000Z"
+
+# Replace fetch with a recorder that fails like a request the browser refused
+RECORD_FETCH = """() => {
+    window.unloadFetches = [];
+    window.fetch = (url, options) => {
+        window.unloadFetches.push({ keepalive: options.keepalive, bytes: options.body.length });
+        return Promise.reject(new TypeError('Failed to fetch'));
+    };
+}"""
+
+
+def test_flush_sends_small_batch_and_keeps_it_queued(signed_in_page):
+    signed_in_page.evaluate(RECORD_FETCH)
+    result = signed_in_page.evaluate("""([from, to, relationship]) => {
+        addGraphEdge(from, to, relationship);
+        const ops = [{ type: 'edge_add', from, to, relationship }];
+        return { flushed: flushOpsOnUnload(ops), kept: JSON.parse(localStorage.getItem(UNLOAD_OPS_KEY)).ops };
+    }""", list(EDGE))
+    assert result == {"flushed": True, "kept": [EDGE_OP]}
+    assert signed_in_page.evaluate("window.unloadFetches.map(f => f.keepalive)") == [True]
+    signed_in_page.wait_for_timeout(100)
+    assert signed_in_page.js_errors == []
+
+
+def test_flush_declines_batch_over_keepalive_budget(signed_in_page):
+    signed_in_page.evaluate(RECORD_FETCH)
+    flushed = signed_in_page.evaluate("""() => {
+        const ops = [];
+        for (let i = 0; i < 400; i++) {
+            addGraphNode({ id: 'person::Bulk ' + i, label: 'Bulk ' + i + ' ' + 'x'.repeat(200), type: 'person' });
+            ops.push({ type: 'node_add', id: 'person::Bulk ' + i });
+        }
+        return flushOpsOnUnload(ops);
+    }""")
+    assert flushed is False
+    assert signed_in_page.evaluate("[window.unloadFetches.length, localStorage.getItem(UNLOAD_OPS_KEY)]") == [0, None]
+
+
+def test_flush_declines_when_token_is_about_to_expire(signed_in_page):
+    signed_in_page.evaluate(RECORD_FETCH)
+    flushed = signed_in_page.evaluate("""([from, to, relationship]) => {
+        localStorage.setItem('gapi_token', JSON.stringify({ access_token: 'standin-token', expires_at: Date.now() + 5000 }));
+        addGraphEdge(from, to, relationship);
+        return flushOpsOnUnload([{ type: 'edge_add', from, to, relationship }]);
+    }""", list(EDGE))
+    assert flushed is False
+    assert signed_in_page.evaluate("window.unloadFetches.length") == 0
+
+
+def _flushed_last_visit():
+    keys = {"nodes": [], "edges": ["|".join(EDGE)]}
+    return {UNLOAD_OPS_KEY: json.dumps({"ops": [EDGE_OP], "keys": keys})}
+
+
+def test_next_visit_requeues_flush_that_did_not_land(context):
+    page = open_graph(context, signed_in=True, local_storage=_flushed_last_visit())
+    page.wait_for_function("() => window.pendingOps.length === 1")
+    assert page.evaluate("window.pendingOps") == [EDGE_OP]
+    assert page.evaluate(f"graphStore.findEdges('{EDGE[0]}', '{EDGE[1]}', '{EDGE[2]}').length") == 1
+
+
+def test_next_visit_drops_flush_that_landed(context, standin):
+    standin.append("edges!A1", [[*EDGE, "", "", "", STAMP, STAMP]])
+    page = open_graph(context, signed_in=True, local_storage=_flushed_last_visit())
+    page.wait_for_function("() => graphSource === 'sheets'")
+    assert page.evaluate("[window.pendingOps.length, localStorage.getItem(UNLOAD_OPS_KEY)]") == [0, None]
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Test which failed Sheets writes are retried"""
+import pytest
+
+pytestmark = pytest.mark.core
+
+
+def test_retryable_errors(page):
+    verdicts = page.evaluate("""() => [
+        { status: 429 },
+        { status: 503 },
+        { status: 403, result: { error: { code: 403, errors: [{ reason: 'rateLimitExceeded' }] } } },
+        { status: 0, result: { error: { message: 'TypeError: Failed to fetch' } } },
+        new TypeError('Failed to fetch'),
+        { status: 400, result: { error: { code: 400 } } },
+        { status: 403, result: { error: { code: 403, status: 'PERMISSION_DENIED' } } },
+        new TypeError("Cannot read properties of undefined (reading 'length')"),
+        new ReferenceError('rows is not defined'),
+    ].map(isRetryableError)""")
+    assert verdicts == [True] * 5 + [False] * 4
+
+
+def test_own_bug_fails_without_retrying(page):
+    result = page.evaluate("""async () => {
+        let calls = 0;
+        try {
+            await scheduledWrite('nodes', () => { calls++; return undefinedHelper(); });
+        } catch (err) {
+            return { calls, error: err.name };
+        }
+    }""")
+    assert result == {"calls": 1, "error": "ReferenceError"}
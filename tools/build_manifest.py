@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Write the precache manifest into sw.js.
+
+The service worker serves index.html, the app scripts and the pinned
+vis-network build cache-first, so a visitor only sees a new build once
+sw.js itself changes. This script hashes those files and rewrites the
+manifest block at the top of sw.js (VERSION + PRECACHE); a new VERSION
+makes browsers install the new worker, which refills the cache and, once
+no open page still runs the old build, drops the old one.
+
+Run after changing any precached file:
+    python tools/build_manifest.py
+
+Check that sw.js is current (exit 1 if not; the core tests do this):
+    python tools/build_manifest.py --check
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SW_PATH = REPO_ROOT / "sw.js"
+APP_FILES = ["index.html", "sheet_rows.js", "graph_store.js", "layout.js", "dedupe.js", "graph.js", "graph_io.js", "tab_sync.js",
+             "io_worker.js", "load_worker.js"]
+
+BLOCK = re.compile(r"(// ---- manifest \(generated by tools/build_manifest\.py\) ----\n)(.*?)(// ---- end manifest ----)", re.S)
+VIS_SCRIPT = re.compile(r'<script[^>]*src="(https://unpkg\.com/vis-network[^"]*)"')
+PINNED = re.compile(r"vis-network@\d+\.\d+\.\d+/")
+
+
+def vis_url(root=REPO_ROOT):
+    """The vis-network URL index.html loads; must name an exact version."""
+    m = VIS_SCRIPT.search((root / "index.html").read_text(encoding="utf-8"))
+    if not m:
+        raise ValueError("no vis-network <script> in index.html")
+    if not PINNED.search(m.group(1)):
+        raise ValueError(f"vis-network is not pinned to a version: {m.group(1)}")
+    return m.group(1)
+
+
+def build_manifest(root=REPO_ROOT):
+    """Returns (version, precache list) for the current files."""
+    precache = APP_FILES + [vis_url(root)]
+    digest = hashlib.sha256()
+    for name in APP_FILES:
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update((root / name).read_bytes())
+    digest.update(precache[-1].encode("utf-8"))
+    return digest.hexdigest()[:12], precache
+
+
+def render_block(version, precache):
+    return f"const VERSION = '{version}';\nconst PRECACHE = {json.dumps(precache, indent=2)};\n"
+
+
+def update_sw(sw_text, version, precache):
+    if not BLOCK.search(sw_text):
+        raise ValueError("no manifest block in sw.js")
+    return BLOCK.sub(lambda m: m.group(1) + render_block(version, precache) + m.group(3), sw_text, count=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--check", action="store_true", help="only check that sw.js is current")
+    args = parser.parse_args(argv)
+
+    version, precache = build_manifest()
+    current = SW_PATH.read_text(encoding="utf-8")
+    updated = update_sw(current, version, precache)
+    if args.check:
+        if updated != current:
+            print("sw.js manifest is out of date; run python tools/build_manifest.py", file=sys.stderr)
+            return 1
+        print(f"sw.js manifest is current ({version})")
+        return 0
+    if updated != current:
+        SW_PATH.write_text(updated, encoding="utf-8")
+    print(f"sw.js manifest: version {version}, {len(precache)} files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
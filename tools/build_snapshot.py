@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Build the startup snapshot (snapshot.json.gz) that index.html draws before
+the Sheet answers.
+
+Does offline what every page load otherwise repeats: heals edge endpoints
+that have no node row, checks the rows, computes degree and a force-directed
+layout, and writes the result as gzipped, column-oriented JSON. The page
+draws it at once, then checks the sheet against it when the real load
+arrives (see "Startup Snapshot" in index.html).
+
+Read a CSV export (nodes.csv + edges.csv):
+    python tools/build_snapshot.py --csv tests/fixtures
+
+or the nodes/edges tabs through the Sheets API (the test stand-in, or the
+real API with a key):
+    python tests/sheets_standin.py --port 8002 &
+    python tools/build_snapshot.py --sheets-url http://127.0.0.1:8002
+    python tools/build_snapshot.py --sheets-url https://sheets.googleapis.com --api-key KEY
+"""
+import argparse
+import csv
+import gzip
+import json
+import math
+import random
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import quote
+from urllib.request import urlopen
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_FORMAT = "era-graph-snapshot"
+SNAPSHOT_VERSION = 1
+# Same order as NODE_TYPES in graph_store.js
+NODE_TYPES = ["organization", "person", "project"]
+
+
+def parse_type(node_id):
+    """Type from the ID prefix, as parseTypeFromId() in index.html does."""
+    if node_id.startswith("person::"):
+        return "person"
+    if node_id.startswith("project::"):
+        return "project"
+    return "organization"
+
+
+def healed_label(node_id):
+    return re.sub(r"^(person|org|project)::", "", node_id)
+
+
+# -- reading ---------------------------------------------------------------
+
+def read_csv_dir(directory):
+    """Rows of nodes.csv and edges.csv as dicts keyed by header."""
+    tabs = {}
+    for tab in ("nodes", "edges"):
+        with open(Path(directory) / f"{tab}.csv", newline="", encoding="utf-8") as f:
+            tabs[tab] = list(csv.DictReader(f))
+    return tabs["nodes"], tabs["edges"]
+
+
+def default_sheet_id():
+    """SHEET_ID from index.html, so the CLI and the page read the same sheet."""
+    m = re.search(r"const SHEET_ID = ['\"]([^'\"]+)['\"]", (REPO_ROOT / "index.html").read_text(encoding="utf-8"))
+    return m.group(1) if m else None
+
+
+def shard_names(tab, titles):
+    """The tab and its shard tabs (tab_001, tab_002, ...) present in titles, in order."""
+    names = [tab]
+    while f"{tab}_{len(names):03d}" in titles:
+        names.append(f"{tab}_{len(names):03d}")
+    return names
+
+
+def read_sheets(base_url, sheet_id, api_key=None):
+    """Rows of the nodes and edges tabs (and their shards) through the Sheets API."""
+    def get(path):
+        url = f"{base_url.rstrip('/')}/v4/spreadsheets/{sheet_id}{path}"
+        if api_key:
+            url += f"?key={quote(api_key)}"
+        with urlopen(url) as resp:
+            return json.load(resp)
+
+    def shard_rows(name):
+        values = get(f"/values/{quote(name)}").get("values", [])
+        if not values:
+            return []
+        headers = values[0]
+        return [{h: (row[i] if i < len(row) else "") for i, h in enumerate(headers)} for row in values[1:]]
+
+    titles = {s["properties"]["title"] for s in get("").get("sheets", [])}
+    return tuple([row for name in shard_names(tab, titles) for row in shard_rows(name)] for tab in ("nodes", "edges"))
+
+
+# -- healing and validation ------------------------------------------------
+
+def prepare_graph(node_rows, edge_rows):
+    """Clean rows into a graph.
+
+    Returns (nodes, edges, problems): nodes are dicts with id/label/type/
+    hidden/healed, edges are (source index, target index, relationship)
+    tuples, and problems lists what was dropped, healed or looks wrong.
+    """
+    problems = []
+    nodes, index = [], {}
+    for n, row in enumerate(node_rows, start=2):
+        node_id = (row.get("id") or "").strip()
+        if not node_id:
+            problems.append(f"nodes row {n}: no id, skipped")
+            continue
+        if node_id in index:
+            problems.append(f"nodes row {n}: duplicate id {node_id!r}, skipped")
+            continue
+        index[node_id] = len(nodes)
+        nodes.append({
+            "id": node_id,
+            "label": row.get("label") or healed_label(node_id),
+            "type": parse_type(node_id),
+            "hidden": (row.get("hidden") or "").strip().lower() == "true",
+            "healed": False,
+        })
+
+    edges, seen = [], set()
+    for n, row in enumerate(edge_rows, start=2):
+        source, target = (row.get("source") or "").strip(), (row.get("target") or "").strip()
+        relationship = row.get("relationship") or ""
+        if not source or not target:
+            problems.append(f"edges row {n}: missing source or target, skipped")
+            continue
+        for node_id in (source, target):
+            if node_id not in index:
+                # Auto-heal, as loadDataFromSheets() does
+                index[node_id] = len(nodes)
+                nodes.append({"id": node_id, "label": healed_label(node_id), "type": parse_type(node_id),
+                              "hidden": False, "healed": True})
+                problems.append(f"edges row {n}: healed missing node {node_id!r}")
+        key = (source, target, relationship)
+        if key in seen:
+            problems.append(f"edges row {n}: duplicate edge {source!r} -> {target!r} ({relationship})")
+        if source == target:
+            problems.append(f"edges row {n}: self-loop on {source!r}")
+        seen.add(key)
+        edges.append((index[source], index[target], relationship))
+    return nodes, edges, problems
+
+
+def degrees(node_count, edges):
+    # Matches GraphStore.degree(): a self-loop counts once
+    degree = [0] * node_count
+    for s, t, _ in edges:
+        degree[s] += 1
+        if t != s:
+            degree[t] += 1
+    return degree
+
+
+# -- layout ----------------------------------------------------------------
+
+def force_layout(node_count, edges, include=None, iterations=300, edge_length=100.0, seed=1):
+    """Fruchterman-Reingold layout with grid-limited repulsion.
+
+    Repulsion only acts between nodes in neighbouring grid cells (2 edge
+    lengths wide), so an iteration costs about O(nodes + edges); a weak pull
+    toward the origin keeps disconnected components together.
+
+    Args:
+        include: optional list of booleans; excluded nodes get no position
+    Returns:
+        list of (x, y), or None for excluded nodes
+    """
+    rng = random.Random(seed)
+    active = [i for i in range(node_count) if include is None or include[i]]
+    if not active:
+        return [None] * node_count
+    k = edge_length
+    spread = k * math.sqrt(len(active))
+    x = [0.0] * node_count
+    y = [0.0] * node_count
+    for i in active:
+        angle, radius = rng.uniform(0, 2 * math.pi), spread * math.sqrt(rng.random())
+        x[i], y[i] = radius * math.cos(angle), radius * math.sin(angle)
+    links = [(s, t) for s, t, _ in edges if s != t and (include is None or (include[s] and include[t]))]
+    cell = 2 * k
+    temperature = spread / 10
+
+    for step in range(iterations):
+        dx = [0.0] * node_count
+        dy = [0.0] * node_count
+        grid = {}
+        for i in active:
+            grid.setdefault((int(x[i] // cell), int(y[i] // cell)), []).append(i)
+        for (cx, cy), members in grid.items():
+            # Half of the 3x3 neighbourhood, so each pair of cells is visited once
+            for ox, oy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+                other = grid.get((cx + ox, cy + oy))
+                if not other:
+                    continue
+                same_cell = ox == 0 and oy == 0
+                for a, i in enumerate(members):
+                    for j in (members[a + 1:] if same_cell else other):
+                        ddx, ddy = x[i] - x[j], y[i] - y[j]
+                        d2 = ddx * ddx + ddy * ddy
+                        if d2 == 0:
+                            ddx, ddy, d2 = rng.uniform(-1, 1), rng.uniform(-1, 1), 1.0
+                        elif d2 > cell * cell:
+                            continue
+                        f = k * k / d2
+                        dx[i] += ddx * f
+                        dy[i] += ddy * f
+                        dx[j] -= ddx * f
+                        dy[j] -= ddy * f
+        for s, t in links:
+            ddx, ddy = x[s] - x[t], y[s] - y[t]
+            d = math.hypot(ddx, ddy) or 0.01
+            f = d / k
+            dx[s] -= ddx * f
+            dy[s] -= ddy * f
+            dx[t] += ddx * f
+            dy[t] += ddy * f
+        for i in active:
+            dx[i] -= x[i] * 0.01
+            dy[i] -= y[i] * 0.01
+            d = math.hypot(dx[i], dy[i])
+            if d > 0:
+                move = min(d, temperature)
+                x[i] += dx[i] / d * move
+                y[i] += dy[i] / d * move
+        temperature = max(1.0, temperature * (1 - 1.0 / max(1, iterations - step)))
+    return [(x[i], y[i]) if include is None or include[i] else None for i in range(node_count)]
+
+
+# -- snapshot --------------------------------------------------------------
+
+def build_snapshot(node_rows, edge_rows, iterations=300, seed=1):
+    """Heal, validate and lay out rows; returns (snapshot dict, problems)."""
+    nodes, edges, problems = prepare_graph(node_rows, edge_rows)
+    degree = degrees(len(nodes), edges)
+    # Hidden nodes are not drawn, so they take no part in the layout
+    positions = force_layout(len(nodes), edges, include=[not n["hidden"] for n in nodes],
+                             iterations=iterations, seed=seed)
+
+    strings, string_ids = [], {}
+
+    def intern(s):
+        if s not in string_ids:
+            string_ids[s] = len(strings)
+            strings.append(s)
+        return string_ids[s]
+
+    stamps = [r.get("updated_at") or "" for r in list(node_rows) + list(edge_rows)]
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        # What the page compares the sheet against
+        "source": {"nodes": len(node_rows), "edges": len(edge_rows), "updated_at": max(stamps, default="")},
+        "strings": strings,
+        "nodes": {
+            "id": [intern(n["id"]) for n in nodes],
+            "label": [intern(n["label"]) for n in nodes],
+            "type": [NODE_TYPES.index(n["type"]) for n in nodes],
+            "hidden": [int(n["hidden"]) for n in nodes],
+            "healed": [int(n["healed"]) for n in nodes],
+            "degree": degree,
+            "x": [round(p[0], 1) if p else None for p in positions],
+            "y": [round(p[1], 1) if p else None for p in positions],
+        },
+        "edges": {
+            "source": [s for s, _, _ in edges],
+            "target": [t for _, t, _ in edges],
+            "relationship": [intern(r) for _, _, r in edges],
+        },
+        # Node indexes in case-insensitive label order (for prefix search / the datalist)
+        "label_index": sorted(range(len(nodes)), key=lambda i: (nodes[i]["label"].strip().lower(), i)),
+    }
+    return snapshot, problems
+
+
+def write_snapshot(snapshot, path):
+    data = json.dumps(snapshot, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    with gzip.open(path, "wb", compresslevel=9) as f:
+        f.write(data)
+    return Path(path).stat().st_size
+
+
+def read_snapshot(path):
+    with gzip.open(path, "rb") as f:
+        return json.loads(f.read().decode("utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", metavar="DIR", help="directory with nodes.csv and edges.csv")
+    source.add_argument("--sheets-url", metavar="URL", help="Sheets API base URL (stand-in or https://sheets.googleapis.com)")
+    parser.add_argument("--sheet-id", default=None, help="spreadsheet id (default: SHEET_ID in index.html)")
+    parser.add_argument("--api-key", default=None, help="API key for the real Sheets API")
+    parser.add_argument("--out", default=str(REPO_ROOT / "snapshot.json.gz"))
+    parser.add_argument("--iterations", type=int, default=300, help="layout iterations")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--strict", action="store_true", help="fail (exit 1) if any row had problems")
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        node_rows, edge_rows = read_csv_dir(args.csv)
+    else:
+        sheet_id = args.sheet_id or default_sheet_id()
+        if not sheet_id:
+            parser.error("no --sheet-id and none found in index.html")
+        node_rows, edge_rows = read_sheets(args.sheets_url, sheet_id, args.api_key)
+
+    snapshot, problems = build_snapshot(node_rows, edge_rows, iterations=args.iterations, seed=args.seed)
+    for problem in problems:
+        print(f"  ! {problem}", file=sys.stderr)
+    if problems and args.strict:
+        print(f"{len(problems)} problem(s); snapshot not written", file=sys.stderr)
+        return 1
+    size = write_snapshot(snapshot, args.out)
+    print(f"Wrote {args.out}: {len(snapshot['nodes']['id'])} nodes, {len(snapshot['edges']['source'])} edges, "
+          f"{size} bytes ({len(problems)} problem(s))")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Find near-duplicate nodes in a sheet export and write merge batches.
+
+Labels are compared the way dedupe.js compares them in the page: by a
+normalized key ("Eco-Restoration Alliance" and "Ecorestoration Alliance"
+are both "ecorestorationalliance") and by the Dice coefficient of their
+character trigrams. An inverted trigram index (blocking) limits each
+comparison to the nodes sharing a trigram with the label, so a pass is
+roughly linear in the number of nodes rather than quadratic.
+
+Nodes of one type that match are grouped; the best-kept node of a group
+(visible, hand-entered, with a URL, most connected) takes over the others'
+edges and they are hidden. A label joining several names with commas
+("Biodiversity for Livable Climate,Ecorestoration Alliance") is split: its
+edges move to the node of each name, created if missing.
+
+Each merge is written as a batch of queueOp ops; importing the output file
+in the page (Import button) applies and queues them for the next save:
+    python tools/find_duplicates.py --csv tests/fixtures --out merges.json
+    python tools/find_duplicates.py --sheets-url http://127.0.0.1:8002 --out merges.json
+"""
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+from build_snapshot import default_sheet_id, healed_label, parse_type, read_csv_dir, read_sheets
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MERGES_FORMAT = "era-merge-batches"
+MERGES_VERSION = 1
+
+# Same as dedupe.js
+DUPLICATE_THRESHOLD = 0.8
+GRAM_SIZE = 3
+BLOCK_MAX = 200
+LEGAL_SUFFIXES = {"inc", "llc", "ltd", "co", "corp", "gmbh", "plc"}
+ID_PREFIX = {"person": "person::", "project": "project::", "organization": "org::"}
+EDGE_DETAIL_FIELDS = ("role", "url", "notes")
+
+
+# -- comparison ------------------------------------------------------------
+
+def label_key(label):
+    """Comparison key of a label, as labelKey() in dedupe.js."""
+    text = re.sub("[\u0300-\u036f]", "", unicodedata.normalize("NFKD", label or ""))
+    words = [w for w in re.split(r"[^a-z0-9]+", text.lower().replace("&", " and ")) if w]
+    while len(words) > 1 and words[0] == "the":
+        words.pop(0)
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return "".join(words)
+
+
+def label_grams(key):
+    if len(key) < GRAM_SIZE:
+        return {key}
+    return {key[i:i + GRAM_SIZE] for i in range(len(key) - GRAM_SIZE + 1)}
+
+
+def similarity(a, b):
+    """Dice coefficient of two gram sets."""
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class LabelIndex:
+    """Keys and trigram postings of a list of labels."""
+
+    def __init__(self, labels):
+        self.keys = [label_key(label) for label in labels]
+        self.grams = [label_grams(key) if key else set() for key in self.keys]
+        self.by_key, self.postings = {}, {}
+        for i, key in enumerate(self.keys):
+            if not key:
+                continue
+            self.by_key.setdefault(key, []).append(i)
+            for g in self.grams[i]:
+                self.postings.setdefault(g, []).append(i)
+
+    def candidates(self, label, accept=None, threshold=DUPLICATE_THRESHOLD):
+        """(index, score) of the labels probably naming the same thing, best first."""
+        key = label_key(label)
+        if not key:
+            return []
+        grams = label_grams(key)
+        shared = {}
+        for g in grams:
+            rows = self.postings.get(g, ())
+            if len(rows) > BLOCK_MAX:
+                continue  # too common to tell labels apart
+            for i in rows:
+                shared[i] = shared.get(i, 0) + 1
+        for i in self.by_key.get(key, ()):
+            shared[i] = float("inf")
+        min_shared = threshold * len(grams) / 2
+        found = []
+        for i, count in shared.items():
+            if count < min_shared or (accept and not accept(i)):
+                continue
+            score = 1.0 if self.keys[i] == key else similarity(grams, self.grams[i])
+            if score >= threshold:
+                found.append((i, score))
+        return sorted(found, key=lambda f: (-f[1], f[0]))
+
+
+def compound_parts(label):
+    """Names joined in one label with commas or semicolons ([] if it is one name)."""
+    parts = [p.strip() for p in re.split(r"[,;]", label or "")]
+    parts = [p for p in parts if label_key(p) and label_key(p) not in LEGAL_SUFFIXES]
+    return parts if len(parts) > 1 else []
+
+
+# -- the graph being merged ------------------------------------------------
+
+class Graph:
+    """Nodes and edges of an export, updated as merge ops are planned."""
+
+    def __init__(self, node_rows, edge_rows):
+        self.nodes, self.order, self.position = {}, [], {}
+        for row in node_rows:
+            node_id = (row.get("id") or "").strip()
+            if node_id and node_id not in self.nodes:
+                self._add_node(node_id, row)
+        self.edges, self.incident = {}, {}
+        for row in edge_rows:
+            source, target = (row.get("source") or "").strip(), (row.get("target") or "").strip()
+            if not source or not target:
+                continue
+            for node_id in (source, target):
+                if node_id not in self.nodes:
+                    # Auto-heal, as the page does
+                    self._add_node(node_id, {"label": healed_label(node_id), "origin": "auto-healed"})
+            fields = {f: row.get(f) or "" for f in EDGE_DETAIL_FIELDS}
+            self.add_edge(source, target, row.get("relationship") or "", fields)
+
+    def _add_node(self, node_id, row):
+        self.nodes[node_id] = {
+            "id": node_id,
+            "label": row.get("label") or healed_label(node_id),
+            "type": parse_type(node_id),
+            "url": row.get("url") or "",
+            "origin": row.get("origin") or "",
+            "hidden": str(row.get("hidden") or "").strip().lower() == "true",
+        }
+        self.position[node_id] = len(self.order)
+        self.order.append(node_id)
+
+    def add_edge(self, source, target, relationship, fields):
+        key = (source, target, relationship)
+        self.edges[key] = fields
+        for node_id in (source, target):
+            self.incident.setdefault(node_id, set()).add(key)
+
+    def remove_edge(self, key):
+        del self.edges[key]
+        for node_id in key[:2]:
+            self.incident[node_id].discard(key)
+
+    def degree(self, node_id):
+        return len(self.incident.get(node_id, ()))
+
+    def keep_rank(self, node_id):
+        """Which node of a group takes over the others (the highest)."""
+        n = self.nodes[node_id]
+        return (not n["hidden"], n["origin"] == "manual", bool(n["url"]), self.degree(node_id), -self.position[node_id])
+
+    def redirect_ops(self, old_id, new_ids):
+        """Ops moving old_id's edges onto each of new_ids, planned into the graph."""
+        ops = []
+        for key in sorted(self.incident.get(old_id, ())):
+            source, target, relationship = key
+            fields = self.edges[key]
+            self.remove_edge(key)
+            ops.append({"type": "edge_remove", "from": source, "to": target, "relationship": relationship})
+            for new_id in new_ids:
+                moved = (new_id if source == old_id else source, new_id if target == old_id else target, relationship)
+                if moved[0] == moved[1] or moved in self.edges:
+                    continue
+                self.add_edge(*moved, fields)
+                ops.append({"type": "edge_add", "from": moved[0], "to": moved[1], "relationship": relationship,
+                            **{f: v for f, v in fields.items() if v}})
+        return ops
+
+    def is_compound(self, node_id):
+        # "Smith, Jane" is one person
+        node = self.nodes[node_id]
+        return node["type"] != "person" and bool(compound_parts(node["label"]))
+
+    def hide_op(self, node_id):
+        self.nodes[node_id]["hidden"] = True
+        return {"type": "update_node", "id": node_id, "hidden": True}
+
+
+# -- planning --------------------------------------------------------------
+
+def duplicate_groups(graph, index, threshold=DUPLICATE_THRESHOLD):
+    """Groups (lists of ids, two or more) of same-type nodes with matching labels."""
+    ids = graph.order
+    parent = list(range(len(ids)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def matches(i):
+        node = graph.nodes[ids[i]]
+        return lambda j: j != i and graph.nodes[ids[j]]["type"] == node["type"] and not graph.is_compound(ids[j])
+
+    for i, node_id in enumerate(ids):
+        if graph.is_compound(node_id):
+            continue  # split below, not merged
+        for j, _ in index.candidates(graph.nodes[node_id]["label"], accept=matches(i), threshold=threshold):
+            parent[find(j)] = find(i)
+    groups = {}
+    for i in range(len(ids)):
+        groups.setdefault(find(i), []).append(ids[i])
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def plan_merges(node_rows, edge_rows, threshold=DUPLICATE_THRESHOLD):
+    """Merge batches for an export: [{keep, drop, score, ops} | {split, into, ops}]."""
+    graph = Graph(node_rows, edge_rows)
+    index = LabelIndex([graph.nodes[i]["label"] for i in graph.order])
+    batches, kept = [], {}  # kept: dropped id -> id that took it over
+
+    for group in duplicate_groups(graph, index, threshold):
+        keep = max(group, key=graph.keep_rank)
+        keep_grams = label_grams(label_key(graph.nodes[keep]["label"]))
+        for drop in sorted(group, key=graph.position.get):
+            if drop == keep:
+                continue
+            ops = graph.redirect_ops(drop, [keep])
+            if graph.nodes[drop]["url"] and not graph.nodes[keep]["url"]:
+                graph.nodes[keep]["url"] = graph.nodes[drop]["url"]
+                ops.append({"type": "update_node", "id": keep, "url": graph.nodes[keep]["url"]})
+            ops.append(graph.hide_op(drop))
+            kept[drop] = keep
+            score = similarity(keep_grams, label_grams(label_key(graph.nodes[drop]["label"])))
+            batches.append({"keep": keep, "drop": drop, "score": round(score, 3), "ops": ops})
+
+    for node_id in list(graph.order):
+        node = graph.nodes[node_id]
+        if not graph.is_compound(node_id) or node["hidden"]:
+            continue
+        ops, into, matched = [], [], 0
+        same_type = lambda j: graph.nodes[graph.order[j]]["type"] == node["type"] and not graph.is_compound(graph.order[j])  # noqa: E731
+        for part in compound_parts(node["label"]):
+            found = index.candidates(part, accept=same_type, threshold=threshold)
+            if found:
+                matched += 1
+                part_id = graph.order[found[0][0]]
+                into.append(kept.get(part_id, part_id))
+                continue
+            part_id = ID_PREFIX[node["type"]] + part
+            if part_id not in graph.nodes:
+                graph._add_node(part_id, {"label": part, "origin": node["origin"]})
+                ops.append({"type": "node_add", "id": part_id, "label": part, "node_type": node["type"],
+                            "origin": node["origin"]})
+            into.append(part_id)
+        # A name that merely contains a comma matches no other node; leave it alone
+        if not matched:
+            continue
+        ops += graph.redirect_ops(node_id, into)
+        ops.append(graph.hide_op(node_id))
+        batches.append({"split": node_id, "into": into, "ops": ops})
+    return batches
+
+
+def describe(batch):
+    if "split" in batch:
+        return f"split {batch['split']!r} into " + ", ".join(repr(i) for i in batch["into"])
+    return f"merge {batch['drop']!r} into {batch['keep']!r} (similarity {batch['score']})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--csv", metavar="DIR", help="directory with nodes.csv and edges.csv")
+    source.add_argument("--sheets-url", metavar="URL", help="Sheets API base URL (stand-in or https://sheets.googleapis.com)")
+    parser.add_argument("--sheet-id", default=None, help="spreadsheet id (default: SHEET_ID in index.html)")
+    parser.add_argument("--api-key", default=None, help="API key for the real Sheets API")
+    parser.add_argument("--threshold", type=float, default=DUPLICATE_THRESHOLD, help="trigram similarity to count as a match")
+    parser.add_argument("--out", default=None, help="write the merge batches here (JSON) to import in the page")
+    args = parser.parse_args(argv)
+
+    if args.csv:
+        node_rows, edge_rows = read_csv_dir(args.csv)
+    else:
+        sheet_id = args.sheet_id or default_sheet_id()
+        if not sheet_id:
+            parser.error("no --sheet-id and none found in index.html")
+        node_rows, edge_rows = read_sheets(args.sheets_url, sheet_id, args.api_key)
+
+    batches = plan_merges(node_rows, edge_rows, threshold=args.threshold)
+    for batch in batches:
+        print(f"  {describe(batch)}: {len(batch['ops'])} op(s)")
+    if args.out:
+        doc = {"format": MERGES_FORMAT, "version": MERGES_VERSION, "merges": batches}
+        Path(args.out).write_text(json.dumps(doc, indent=1, ensure_ascii=False), encoding="utf-8")
+        print(f"Wrote {args.out}: {len(batches)} batch(es)")
+    else:
+        print(f"{len(batches)} batch(es); use --out to write them")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())